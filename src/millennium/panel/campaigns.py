@@ -0,0 +1,160 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from millennium.panel.models import Campaign, CampaignSlot, terminal
+from millennium.panel.framebuilder import buildFrames
+from millennium.panel.transport import estimateSession, linkTimings
+from collections import namedtuple
+import datetime
+import heapq
+
+# Lower goes first. A terminal that cannot reach the NCC or is misconfigured
+# is worse off than one with last month's rates.
+TABLE_PRIORITY = {
+    'NCCTermParms': 0,
+    'InstallParms': 1,
+    'FconfigOpts': 2,
+    'CardTable': 3,
+    'CoinValTable': 3,
+    'RateTable': 4,
+    'NPANXXTable': 5,
+}
+
+# Frame sizes for the tables that have no encoder yet, in bytes
+ESTIMATED_FRAME_SIZES = {
+    'RateTable': 1024,
+    'NPANXXTable': 402,
+}
+
+Job = namedtuple('Job', 'priority queued terminal tenant tables duration')
+Slot = namedtuple('Slot', 'terminal tenant line start end priority tables')
+
+def frameSizes(terminals):
+    # terminal id -> {table name: frame size}
+    return {
+        terminalId: {name: len(frame) for name, frame in frames.items()}
+        for terminalId, termId, frames in buildFrames(terminals)
+    }
+
+def pendingJobs(downloads, bps=None):
+    # One job per terminal from a PendingDownload queryset, prioritised by
+    # its most vital table, taking as long as the transport needs for its
+    # frames with the terminal's packet timing
+    tables = {}
+    for terminalId, tenantId, table, queued in downloads.values_list('terminal_id', 'terminal__tenant_id', 'table', 'queued').order_by():
+        entry = tables.setdefault(terminalId, [tenantId, queued, []])
+        entry[1] = min(entry[1], queued)
+        entry[2].append(table)
+
+    terminals = terminal.objects.filter(pk__in=downloads.values('terminal'))
+    sizes = frameSizes(terminals)
+    timings = linkTimings(terminals)
+
+    jobs = []
+    for terminalId, (tenantId, queued, names) in tables.items():
+        names.sort(key=lambda name: TABLE_PRIORITY.get(name, len(TABLE_PRIORITY)))
+        terminalSizes = sizes.get(terminalId, {})
+        duration = estimateSession(
+            [terminalSizes.get(name, ESTIMATED_FRAME_SIZES.get(name, 0)) for name in names],
+            timings[terminalId],
+            bps,
+        )
+        jobs.append(Job(TABLE_PRIORITY.get(names[0], len(TABLE_PRIORITY)), queued, terminalId, tenantId, names, duration))
+    return jobs
+
+def planJobs(jobs, start, lines, quota=None):
+    # List scheduling: whenever a line frees up it takes the most vital job
+    # of a tenant that is below its quota of concurrent lines. Jobs are kept
+    # in a heap per tenant, and tenants in a heap keyed by their best job,
+    # so tenants at quota are skipped without touching their jobs.
+    if lines < 1:
+        raise ValueError('A campaign needs at least one line')
+    if quota is not None and quota < 1:
+        raise ValueError('The tenant quota must be at least one line')
+
+    queues = {}
+    for job in jobs:
+        queues.setdefault(job.tenant, []).append(job)
+    for queue in queues.values():
+        heapq.heapify(queue)
+
+    heads = [(queue[0], tenant) for tenant, queue in queues.items()]
+    heapq.heapify(heads)
+    freeLines = [(0.0, line) for line in range(lines)]
+    busy = {tenant: [] for tenant in queues}
+    slots = []
+
+    while heads:
+        now, line = heapq.heappop(freeLines)
+        blocked = []
+        chosen = None
+
+        while heads:
+            head, tenant = heapq.heappop(heads)
+            sessions = busy[tenant]
+            while sessions and sessions[0] <= now:
+                heapq.heappop(sessions)
+            if quota is None or len(sessions) < quota:
+                chosen = tenant
+                break
+            blocked.append((head, tenant))
+
+        for entry in blocked:
+            heapq.heappush(heads, entry)
+
+        if chosen is None:
+            # Every tenant with work left is at quota: try again when the
+            # first of their sessions ends
+            heapq.heappush(freeLines, (min(busy[tenant][0] for head, tenant in blocked), line))
+            continue
+
+        queue = queues[chosen]
+        job = heapq.heappop(queue)
+        if queue:
+            heapq.heappush(heads, (queue[0], chosen))
+
+        end = now + job.duration
+        heapq.heappush(busy[chosen], end)
+        heapq.heappush(freeLines, (end, line))
+        slots.append(Slot(
+            job.terminal,
+            job.tenant,
+            line,
+            start + datetime.timedelta(seconds=now),
+            start + datetime.timedelta(seconds=end),
+            job.priority,
+            job.tables,
+        ))
+
+    return slots
+
+def createCampaign(name, downloads, tenant=None, start=None, lines=None, quota=None, bps=None):
+    # Plans the terminals with pending downloads in the queryset and stores
+    # the plan. Returns the campaign.
+    start = start or timezone.now()
+    lines = lines or getattr(settings, 'NCC_LINES', 4)
+    slots = planJobs(pendingJobs(downloads, bps), start, lines, quota)
+
+    with transaction.atomic():
+        campaign = Campaign.objects.create(
+            name=name,
+            tenant=tenant,
+            start=start,
+            end=max([slot.end for slot in slots], default=start),
+            lines=lines,
+            tenant_quota=quota,
+        )
+        CampaignSlot.objects.bulk_create([
+            CampaignSlot(
+                campaign=campaign,
+                terminal_id=slot.terminal,
+                line=slot.line,
+                start=slot.start,
+                end=slot.end,
+                priority=slot.priority,
+                tables=','.join(slot.tables),
+            )
+            for slot in slots
+        ], batch_size=500)
+
+    return campaign
@@ -0,0 +1,198 @@
+from millennium.panel.dialog import Dialog
+from millennium.panel.transport import PacketDecoder
+import struct
+import threading
+import time
+
+# Capture file: CAPTURE_MAGIC, then one record per chunk a line read or
+# wrote: microseconds since the epoch, session number, direction, length,
+# then the bytes as they went over the line. A session starts with an OPEN
+# record holding the line's path and ends with a CLOSE record.
+CAPTURE_MAGIC = b'MPCAP\x01\r\n'
+CAPTURE_RECORD = struct.Struct('<QIBH')
+
+IN = 0
+OUT = 1
+OPEN = 2
+CLOSE = 3
+DIRECTIONS = {IN: 'IN', OUT: 'OUT', OPEN: 'OPEN', CLOSE: 'CLOSE'}
+
+RING_SIZE = 4 * 1024 * 1024
+FLUSH_INTERVAL = 1.0 # seconds
+READ_SIZE = 1024 * 1024
+
+def hexdump(data, width=16):
+    # Offset, hex and printable characters, for when someone looks
+    lines = []
+    for offset in range(0, len(data), width):
+        chunk = bytes(data[offset:offset + width])
+        lines.append('%06x  %-*s  %s' % (
+            offset,
+            width * 3 - 1,
+            ' '.join('%02x' % byte for byte in chunk),
+            ''.join(chr(byte) if 32 <= byte < 127 else '.' for byte in chunk),
+        ))
+    return '\n'.join(lines)
+
+class CaptureWriter(object):
+    # Appends records to a capture file through a ring buffer. record()
+    # only packs the header and copies the bytes into the ring; a thread
+    # writes the ring out, so the event loop never waits for the disk. A
+    # record that does not fit in the ring is dropped and counted rather
+    # than stalling the lines. Meant for a single producer, the event loop.
+
+    def __init__(self, path, size=RING_SIZE, flushInterval=FLUSH_INTERVAL):
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(CAPTURE_MAGIC)
+        self.ring = bytearray(size)
+        self.header = bytearray(CAPTURE_RECORD.size)
+        self.head = 0 # bytes put into the ring so far
+        self.tail = 0 # bytes written out so far
+        self.flushInterval = flushInterval
+        self.records = 0
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.closing = False
+        self.thread = threading.Thread(target=self.run, name='capture', daemon=True)
+        self.thread.start()
+
+    def record(self, session, direction, data=b'', timestamp=None):
+        size = CAPTURE_RECORD.size + len(data)
+        if self.head - self.tail + size > len(self.ring):
+            self.dropped += 1
+            self.wake.set()
+            return False
+
+        if timestamp is None:
+            timestamp = int(time.time() * 1000000)
+        CAPTURE_RECORD.pack_into(self.header, 0, timestamp, session, direction, len(data))
+        self.put(self.head, self.header)
+        self.put(self.head + CAPTURE_RECORD.size, data)
+        # Publish the record only once it is complete
+        self.head += size
+        self.records += 1
+
+        if self.head - self.tail > len(self.ring) // 2:
+            self.wake.set()
+        return True
+
+    def put(self, position, data):
+        ring = self.ring
+        start = position % len(ring)
+        first = min(len(data), len(ring) - start)
+        ring[start:start + first] = data[:first]
+        if first < len(data):
+            ring[:len(data) - first] = data[first:]
+
+    def run(self):
+        while not self.closing:
+            self.wake.wait(self.flushInterval)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            head = self.head
+            if head == self.tail:
+                return
+            view = memoryview(self.ring)
+            start = self.tail % len(self.ring)
+            end = head % len(self.ring)
+            if start < end:
+                self.file.write(view[start:end])
+            else:
+                self.file.write(view[start:])
+                self.file.write(view[:end])
+            view.release()
+            self.file.flush()
+            self.tail = head
+
+    def close(self):
+        self.closing = True
+        self.wake.set()
+        self.thread.join()
+        self.flush()
+        self.file.close()
+
+def readCapture(path):
+    # Yields (timestamp, session, direction, data) for every record
+    with open(path, 'rb') as file:
+        if file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError('%s is not a capture file' % path)
+
+        buffer = b''
+        while True:
+            chunk = file.read(READ_SIZE)
+            if not chunk:
+                break
+            buffer = buffer + chunk if buffer else chunk
+            offset = 0
+            while len(buffer) - offset >= CAPTURE_RECORD.size:
+                timestamp, session, direction, size = CAPTURE_RECORD.unpack_from(buffer, offset)
+                end = offset + CAPTURE_RECORD.size + size
+                if end > len(buffer):
+                    break
+                yield timestamp, session, direction, buffer[offset + CAPTURE_RECORD.size:end]
+                offset = end
+            buffer = buffer[offset:]
+
+def captureSessions(path):
+    # {session: {'line': path, 'in': [chunks], 'out': [chunks]}}
+    sessions = {}
+    for timestamp, session, direction, data in readCapture(path):
+        entry = sessions.setdefault(session, {'line': None, 'start': timestamp, 'in': [], 'out': []})
+        if direction == OPEN:
+            entry['line'] = data.decode(errors='replace')
+        elif direction == IN:
+            entry['in'].append(data)
+        elif direction == OUT:
+            entry['out'].append(data)
+    return sessions
+
+def sentPayloads(chunks):
+    # The payloads the NCC sent in a session, in order and without
+    # retransmissions
+    decoder = PacketDecoder()
+    payloads = []
+    expected = None
+    for chunk in chunks:
+        for event in decoder.feed(chunk):
+            if event[0] != 'packet':
+                continue
+            if expected is not None and event[1] != expected:
+                continue
+            payloads.append(bytes(event[2]))
+            expected = (event[1] + 1) & 0xFF
+    return payloads
+
+def replaySession(inbound, lookup):
+    # Runs a session's inbound bytes through the packet decoder and the
+    # dialog as fast as they go: lookups are answered at once with
+    # lookup(term ID), every transfer succeeds and timers never fire.
+    # Returns the payloads the dialog sent. Nothing is written to the
+    # database, so replays are repeatable.
+    decoder = PacketDecoder()
+    dialog = Dialog()
+    sent = []
+    queue = list(dialog.start())
+
+    def perform(actions):
+        queue.extend(actions)
+        while queue:
+            action = queue.pop(0)
+            if action[0] == 'lookup':
+                download = lookup(action[1])
+                queue.extend(dialog.handle('unknown') if download is None else dialog.handle('identified', download))
+            elif action[0] == 'send':
+                sent.append(bytes(action[1]))
+            elif action[0] == 'frame':
+                sent.append(bytes(action[1]))
+                queue.extend(dialog.handle('sent'))
+
+    for chunk in inbound:
+        for event in decoder.feed(chunk):
+            if event[0] == 'packet':
+                perform(dialog.packet(event[2]))
+    return sent
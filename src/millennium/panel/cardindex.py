@@ -0,0 +1,72 @@
+from bisect import bisect_left, bisect_right
+import threading
+
+PAN_PREFIX_LEN = 6
+
+_indexes = {}
+_indexesLock = threading.Lock()
+
+def panPrefix(pan):
+    # pan_low/pan_high hold the first six digits of the card number
+    pan = str(pan).strip()
+    if len(pan) < PAN_PREFIX_LEN or not pan[:PAN_PREFIX_LEN].isdigit():
+        return None
+    return int(pan[:PAN_PREFIX_LEN])
+
+class CardRangeIndex(object):
+    # Sorted boundaries of the elementary intervals between all PAN ranges,
+    # each mapped to the definition the phone would pick: the first one in
+    # table order whose range covers it. A lookup is one bisect.
+
+    def __init__(self, cards):
+        cards = [card for card in cards if card.pan_low is not None and card.pan_high is not None and card.pan_low <= card.pan_high]
+
+        self.bounds = sorted({card.pan_low for card in cards} | {card.pan_high + 1 for card in cards})
+        self.owners = [None] * len(self.bounds)
+
+        # Paint from the last definition to the first so earlier ones win
+        for card in reversed(cards):
+            start = bisect_left(self.bounds, card.pan_low)
+            end = bisect_left(self.bounds, card.pan_high + 1)
+            self.owners[start:end] = [card] * (end - start)
+
+    def lookupPrefix(self, prefix):
+        i = bisect_right(self.bounds, prefix) - 1
+        if i < 0:
+            return None
+        return self.owners[i]
+
+    def lookup(self, pan):
+        prefix = panPrefix(pan)
+        if prefix is None:
+            return None
+        return self.lookupPrefix(prefix)
+
+    def lookupMany(self, pans):
+        bounds, owners = self.bounds, self.owners
+        results = []
+        for pan in pans:
+            prefix = panPrefix(pan)
+            if prefix is None:
+                results.append(None)
+                continue
+            i = bisect_right(bounds, prefix) - 1
+            results.append(owners[i] if i >= 0 else None)
+        return results
+
+def getCardIndex(cardTable):
+    # Built once per card table and process, dropped by the CardDefs signals
+    with _indexesLock:
+        index = _indexes.get(cardTable.pk)
+    if index is not None:
+        return index
+
+    index = CardRangeIndex(cardTable.carddefs_set.all())
+
+    with _indexesLock:
+        _indexes[cardTable.pk] = index
+    return index
+
+def invalidateCardIndex(cardTableId):
+    with _indexesLock:
+        _indexes.pop(cardTableId, None)
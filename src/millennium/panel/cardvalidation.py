@@ -0,0 +1,164 @@
+from django.core.exceptions import ValidationError
+from millennium.panel.cardindex import CardRangeIndex, getCardIndex
+from millennium.panel.models.CardDefs import ServiceCodeValidator
+import datetime
+
+FIELD_SEPARATOR = '='
+TRACK2_MAX_LEN = 40
+
+# standard_id values whose check digit is the ANSI X4.13 / ISO 7812 Luhn
+# digit. The other standards are verified on the phone only.
+LUHN_STANDARDS = (1, 2, 6) # MOD10, ANSI, ANSI59
+
+# Per-digit Luhn contributions as byte translation tables, so a card number
+# is checked with two translate() calls and two sums instead of a loop.
+_LUHN_PLAIN = bytes.maketrans(b'0123456789', bytes(range(10)))
+_LUHN_DOUBLE = bytes.maketrans(b'0123456789', bytes((2 * d) if d < 5 else (2 * d - 9) for d in range(10)))
+
+def isNumeric(pan):
+    # ASCII digits only; str.isdigit() also takes other scripts' digits
+    return pan.isascii() and pan.isdigit()
+
+def luhnValid(pan):
+    if not isNumeric(pan):
+        return False
+    digits = pan.encode('ascii')
+    total = sum(digits[-1::-2].translate(_LUHN_PLAIN)) + sum(digits[-2::-2].translate(_LUHN_DOUBLE))
+    return total % 10 == 0
+
+def isSmartcard(card):
+    # As CardTable.getFrame: a definition with a 1st service code is sent
+    # with its service codes, one without it with its check digits
+    return not card.service_code_1
+
+def serviceCodes(card):
+    if isSmartcard(card):
+        return set()
+    return {
+        '%03d' % code
+        for code in (getattr(card, 'service_code_%d' % i) for i in range(1, 11))
+        if code is not None
+    }
+
+def checkDigits(card):
+    # (position, value) pairs of a smartcard definition; positions are
+    # 1-based within the PAN. Values are bytes (0-255), of which only 0-9
+    # can be checked against a card number; the phone checks the others
+    # against the card itself. The frame carries eight values but only six
+    # positions, so check_value_7 and _8 have no position to be checked at
+    # and are left to the phone as well.
+    if not isSmartcard(card):
+        return []
+    pairs = []
+    for i in range(1, 7):
+        position = getattr(card, 'check_digit_%d' % i)
+        value = getattr(card, 'check_value_%d' % i)
+        if position and value is not None and value <= 9:
+            pairs.append((position, value))
+    return pairs
+
+class CardValidator(object):
+    # Applies a card table's rules to card numbers or track 2 data. Rules are
+    # derived once per definition and reused for the whole batch.
+
+    def __init__(self, index, today=None):
+        self.index = index
+        self.today = today or datetime.date.today()
+        self.rules = {}
+
+    def rulesFor(self, card):
+        rules = self.rules.get(card.pk)
+        if rules is None:
+            rules = self.rules[card.pk] = (
+                card.standard_id in LUHN_STANDARDS,
+                checkDigits(card),
+                serviceCodes(card),
+                card.expiry_date_pos,
+            )
+        return rules
+
+    def validate(self, data):
+        return self.validateMany([data])[0]
+
+    def validateMany(self, batch):
+        # Returns one (card definition or None, [errors]) per input
+        pans = [data.split(FIELD_SEPARATOR, 1)[0].strip() for data in batch]
+        today = self.today.year % 100 * 100 + self.today.month
+        results = []
+
+        for data, pan, card in zip(batch, pans, self.index.lookupMany(pans)):
+            if card is None:
+                results.append((None, ['no matching card definition']))
+                continue
+
+            errors = []
+            luhn, digits, codes, expiryPos = self.rulesFor(card)
+
+            if not isNumeric(pan):
+                errors.append('card number is not numeric')
+            else:
+                if luhn and not luhnValid(pan):
+                    errors.append('check digit mismatch')
+                for position, value in digits:
+                    if position > len(pan) or int(pan[position - 1]) != value:
+                        errors.append('digit %d is not %d' % (position, value))
+
+            if FIELD_SEPARATOR in data and expiryPos is not None:
+                # Positions are relative to the first field separator
+                tail = data.split(FIELD_SEPARATOR, 1)[1]
+                expiry = tail[expiryPos:expiryPos + 4]
+                service = tail[expiryPos + 4:expiryPos + 7]
+
+                if len(expiry) != 4 or not expiry.isdigit():
+                    errors.append('no expiry date')
+                elif int(expiry) < today:
+                    errors.append('expired')
+
+                if codes and service not in codes:
+                    errors.append('service code %s not accepted' % (service or '-'))
+
+            results.append((card, errors))
+
+        return results
+
+def validatorFor(cardTable, today=None):
+    return CardValidator(getCardIndex(cardTable), today)
+
+def validateCardTable(cardTable):
+    # Problems in a card table that would make the phone reject or never use
+    # a definition, or settings the phone never gets. Returns a list of
+    # messages, empty if the table is sound.
+    cards = list(cardTable.carddefs_set.all())
+    problems = []
+
+    for card in cards:
+        if card.pan_low is None or card.pan_high is None:
+            problems.append('%s: no PAN range' % card)
+        elif card.pan_low > card.pan_high:
+            problems.append('%s: PAN range starts after it ends' % card)
+
+        for code in serviceCodes(card):
+            try:
+                ServiceCodeValidator(code)
+            except ValidationError:
+                problems.append('%s: invalid service code %s' % (card, code))
+
+        # Fields the encoder leaves out of the frame
+        if isSmartcard(card):
+            ignored = [i for i in range(2, 11) if getattr(card, 'service_code_%d' % i) is not None]
+            if ignored:
+                problems.append('%s: service codes %s are not sent without a 1st service code' % (card, ', '.join(map(str, ignored))))
+        elif any(getattr(card, 'check_digit_%d' % i) for i in range(1, 7)) or any(getattr(card, 'check_value_%d' % i) is not None for i in range(1, 9)):
+            problems.append('%s: check digits are only sent for smartcards (no 1st service code)' % card)
+
+        for field in ('expiry_date_pos', 'initial_date_pos', 'discret_data_pos'):
+            position = getattr(card, field)
+            if position is not None and position >= TRACK2_MAX_LEN:
+                problems.append('%s: %s is beyond the end of track 2' % (card, card._meta.get_field(field).verbose_name))
+
+    owners = set(CardRangeIndex(cards).owners)
+    for card in cards:
+        if card.pan_low is not None and card.pan_high is not None and card.pan_low <= card.pan_high and card not in owners:
+            problems.append('%s: PAN range is entirely covered by earlier definitions' % card)
+
+    return problems
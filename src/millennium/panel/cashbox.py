@@ -0,0 +1,99 @@
+from django.db.models import Q, Sum, Subquery, OuterRef, Value, DateTimeField
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from millennium.panel.models import CoinEvent, CoinValDefs, terminal
+from collections import namedtuple
+import datetime
+
+# Trailing period the fill rate is measured over
+FORECAST_WINDOW = datetime.timedelta(days=28)
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+Forecast = namedtuple('Forecast', 'terminal term_id volume threshold rate full_at')
+
+def recordCoinEvents(events):
+    # events: iterable of (terminal id, timestamp, kind, coin, count), as
+    # the line driver collects them from a call. One bulk insert; events of
+    # terminals that no longer exist are dropped. Returns the number stored.
+    events = list(events)
+    known = set(terminal.objects.filter(id__in={event[0] for event in events}).values_list('id', flat=True))
+    created = CoinEvent.objects.bulk_create([
+        CoinEvent(terminal_id=terminalId, timestamp=timestamp, kind=kind, coin=coin, count=count)
+        for terminalId, timestamp, kind, coin, count in events
+        if terminalId in known
+    ], batch_size=500)
+    return len(created)
+
+def coinVolumes(tableIds):
+    # CoinValTable id -> coin volumes in table order, which is the coin index
+    # the phone reports deposits with
+    volumes = {}
+    rows = CoinValDefs.objects.filter(coinValTable__in=tableIds).order_by('coinValTable', 'order').values_list('coinValTable_id', 'coin_volume')
+    for tableId, volume in rows:
+        volumes.setdefault(tableId, []).append(volume or 0)
+    return volumes
+
+def depositTotals(terminals, since):
+    # One grouped query over the whole fleet: coins per (terminal, coin)
+    # deposited since the terminal's last collection, and within the window
+    lastCollection = CoinEvent.objects.filter(
+        terminal=OuterRef('terminal'),
+        kind='collection',
+    ).order_by('-timestamp').values('timestamp')[:1]
+
+    sinceCollection = Q(timestamp__gt=Coalesce(Subquery(lastCollection), Value(EPOCH, output_field=DateTimeField())))
+    recent = Q(timestamp__gte=since)
+
+    return CoinEvent.objects.filter(
+        sinceCollection | recent,
+        terminal__in=terminals.values('pk'),
+        kind='deposit',
+        coin__isnull=False,
+    ).values_list('terminal', 'coin').annotate(
+        used=Sum('count', filter=sinceCollection),
+        recent=Sum('count', filter=recent),
+    ).order_by()
+
+def forecastCashboxes(terminals, now=None, window=FORECAST_WINDOW):
+    # Predicts when the cashbox of every terminal in the queryset reaches its
+    # coin validator's cash_box_volume_threshold. Three queries whatever the
+    # fleet size; the rest is a single pass over the aggregates. Returns
+    # Forecasts sorted by full_at, terminals with no recent coin traffic or
+    # no threshold last (full_at None).
+    now = now or timezone.now()
+    days = window.total_seconds() / 86400
+
+    fleet = list(terminals.values_list('id', 'term_id', 'effective__CoinValTable_id', 'effective__CoinValTable__cash_box_volume_threshold'))
+    volumes = coinVolumes({tableId for id, termId, tableId, threshold in fleet})
+
+    tableOf = {id: tableId for id, termId, tableId, threshold in fleet}
+    used = dict.fromkeys(tableOf, 0)
+    recent = dict.fromkeys(tableOf, 0)
+
+    for terminalId, coin, usedCount, recentCount in depositTotals(terminals, now - window):
+        coins = volumes.get(tableOf.get(terminalId), ())
+        if coin >= len(coins):
+            continue
+        used[terminalId] += (usedCount or 0) * coins[coin]
+        recent[terminalId] += (recentCount or 0) * coins[coin]
+
+    forecasts = []
+    for id, termId, tableId, threshold in fleet:
+        rate = recent[id] / days
+        remaining = threshold - used[id] if threshold is not None else None
+
+        if remaining is None:
+            # No coin validation table or threshold to be full against
+            fullAt = None
+        elif remaining <= 0:
+            fullAt = now
+        elif rate > 0:
+            fullAt = now + datetime.timedelta(days=remaining / rate)
+        else:
+            fullAt = None
+
+        forecasts.append(Forecast(id, termId, used[id], threshold, rate, fullAt))
+
+    forecasts.sort(key=lambda forecast: (forecast.full_at is None, forecast.full_at or now))
+    return forecasts
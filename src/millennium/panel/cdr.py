@@ -0,0 +1,192 @@
+from django.db import transaction
+from millennium.panel.models import CallRecord
+from millennium.panel.metrics import metrics
+import datetime
+import struct
+import threading
+import time
+
+# Uploaded call detail record, one per frame:
+#   table id, start (year - 1900, month, day, hour, minute, second),
+#   duration (hours, minutes, seconds), call type, called number (20 BCD
+#   digits, padded), carrier reference, rate, charged amount, card
+#   reference, sequence number. Multi-byte values are little endian, like
+#   everything the panel encodes.
+# The layout is provisional: it is assumed from the fields CallRecord
+# keeps, not taken from the phone's documentation, and has to be checked
+# against real uploads. Phones send it in CDR dialog messages; ingestcdrs
+# loads it from files.
+CDR_TABLE_ID = 0x03
+CDR_RECORD = struct.Struct('<B6B3BB10sBHIBH')
+
+BATCH_SIZE = 2000
+FLUSH_INTERVAL = 2.0 # seconds
+
+def decodeNumber(raw):
+    # BCD digits up to the first filler nibble; zero padded numbers lose
+    # their trailing zero bytes
+    digits = raw.hex()
+    for filler in 'ef':
+        if filler in digits:
+            return digits[:digits.index(filler)]
+    return digits.rstrip('0')
+
+class CDRDecoder(object):
+    # Incremental decoder for one terminal's upload. feed() takes chunks of
+    # any size, as they come off the line, and returns the complete records
+    # they finish. Bytes that cannot start a record are skipped and counted.
+
+    def __init__(self, terminalId):
+        self.terminalId = terminalId
+        self.buffer = bytearray()
+        self.records = 0
+        self.errors = 0
+
+    def feed(self, chunk):
+        self.buffer.extend(chunk)
+        size = CDR_RECORD.size
+        records = []
+        offset = 0
+
+        while len(self.buffer) - offset >= size:
+            if self.buffer[offset] != CDR_TABLE_ID:
+                offset += 1
+                self.errors += 1
+                continue
+
+            # Unpack every whole record in one go while the stream is aligned
+            end = offset + (len(self.buffer) - offset) // size * size
+            view = memoryview(self.buffer)[offset:end]
+            for values in CDR_RECORD.iter_unpack(view):
+                if values[0] != CDR_TABLE_ID:
+                    break
+                offset += size
+                record = self.build(values)
+                if record is None:
+                    self.errors += 1
+                else:
+                    records.append(record)
+            view.release()
+
+        del self.buffer[:offset]
+        self.records += len(records)
+        return records
+
+    def build(self, values):
+        (tableId, year, month, day, hour, minute, second, durHours, durMinutes, durSeconds,
+            callType, number, carrierRef, rate, cost, cardRef, seq) = values
+        try:
+            started = datetime.datetime(1900 + year, month, day, hour, minute, second, tzinfo=datetime.timezone.utc)
+        except ValueError:
+            return None
+
+        return CallRecord(
+            period=started.year * 100 + started.month,
+            terminal_id=self.terminalId,
+            seq=seq,
+            started=started,
+            duration=durHours * 3600 + durMinutes * 60 + durSeconds,
+            call_type=callType,
+            called_number=decodeNumber(number),
+            carrier_ref=carrierRef,
+            rate=rate,
+            cost=cost,
+            card_ref_num=cardRef,
+        )
+
+def encodeRecord(record):
+    # The inverse of CDRDecoder, for replays and tests
+    started = record.started
+    return CDR_RECORD.pack(
+        CDR_TABLE_ID,
+        started.year - 1900, started.month, started.day, started.hour, started.minute, started.second,
+        record.duration // 3600, record.duration // 60 % 60, record.duration % 60,
+        record.call_type,
+        bytes.fromhex(record.called_number.ljust(20, 'f')),
+        record.carrier_ref,
+        record.rate,
+        record.cost,
+        record.card_ref_num,
+        record.seq,
+    )
+
+class IngestStats(object):
+    # Per-terminal ingest counters: records, bytes and the time span they
+    # arrived in
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.terminals = {}
+
+    def count(self, terminalId, records, size):
+        now = time.monotonic()
+        with self.lock:
+            entry = self.terminals.get(terminalId)
+            if entry is None:
+                entry = self.terminals[terminalId] = [0, 0, now, now]
+            entry[0] += records
+            entry[1] += size
+            entry[3] = now
+
+    def throughput(self, terminalId=None):
+        # {terminal id: (records, bytes, records/s, bytes/s)}, or the tuple
+        # for a single terminal
+        with self.lock:
+            items = list(self.terminals.items()) if terminalId is None else [(terminalId, self.terminals.get(terminalId))]
+
+        result = {}
+        for key, entry in items:
+            if entry is None:
+                result[key] = (0, 0, 0.0, 0.0)
+                continue
+            records, size, first, last = entry
+            span = max(last - first, 1e-6)
+            result[key] = (records, size, records / span, size / span)
+        return result if terminalId is None else result[terminalId]
+
+class CDRWriter(object):
+    # Buffers decoded records from any number of sessions and writes them
+    # with one bulk_create per batch, in its own transaction. Records that
+    # were already stored (a retried upload) are ignored.
+
+    def __init__(self, batchSize=BATCH_SIZE, flushInterval=FLUSH_INTERVAL):
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self.lock = threading.Lock()
+        self.pending = []
+        self.lastFlush = time.monotonic()
+        self.written = 0
+        self.stats = IngestStats()
+
+    def decode(self, decoder, chunk):
+        # Only decodes and counts, for callers that must not write, such as
+        # an event loop
+        records = decoder.feed(chunk)
+        self.stats.count(decoder.terminalId, len(records), len(chunk))
+        metrics.addIngest(decoder.terminalId, len(records), len(chunk))
+        return records
+
+    def ingest(self, decoder, chunk):
+        records = self.decode(decoder, chunk)
+        if records:
+            self.add(records)
+        return len(records)
+
+    def add(self, records):
+        with self.lock:
+            self.pending.extend(records)
+            due = len(self.pending) >= self.batchSize or time.monotonic() - self.lastFlush >= self.flushInterval
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            batch = self.pending
+            self.pending = []
+            self.lastFlush = time.monotonic()
+
+        for start in range(0, len(batch), self.batchSize):
+            with transaction.atomic():
+                CallRecord.objects.bulk_create(batch[start:start + self.batchSize], ignore_conflicts=True)
+        self.written += len(batch)
+        return len(batch)
@@ -0,0 +1,121 @@
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR, ALL_VAR
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+import json
+
+CURSOR_VAR = 'after'
+
+class EstimatedCountPaginator(Paginator):
+    # Counting is bounded: up to `threshold` rows we count exactly, above that
+    # we ask the query planner for its estimate instead of scanning the tenant.
+    threshold = 10000
+    estimated = False
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return len(self.object_list)
+
+        exact = self.object_list[:self.threshold + 1].count()
+        if exact <= self.threshold:
+            return exact
+
+        self.estimated = True
+        return max(estimateCount(self.object_list), exact)
+
+def estimateCount(queryset):
+    connection = connections[queryset.db]
+
+    if connection.vendor == 'postgresql':
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    elif connection.vendor == 'mysql':
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN ' + sql, params)
+            columns = [col[0] for col in cursor.description]
+            return int(dict(zip(columns, cursor.fetchone()))['rows'] or 0)
+
+    # No cheap estimate available (e.g. SQLite): the capped count is the best we have
+    return 0
+
+class KeysetChangeList(ChangeList):
+    # Pages through the default ordering by (keyset_field, pk) instead of
+    # OFFSET, so page 1000 costs the same as page 1. Any explicit ordering
+    # or "show all" falls back to the stock numbered pages.
+    keyset_field = None
+
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = request.GET.get(CURSOR_VAR) or None
+        super(KeysetChangeList, self).__init__(request, *args, **kwargs)
+
+    @property
+    def keyset(self):
+        return ORDER_VAR not in self.params and ALL_VAR not in self.params
+
+    def get_filters_params(self, params=None):
+        lookup_params = super(KeysetChangeList, self).get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # Changing sorting or filters has to start over from the first page
+        new_params = dict(new_params or {})
+        new_params.setdefault(CURSOR_VAR, None)
+        return super(KeysetChangeList, self).get_query_string(new_params, remove)
+
+    def get_ordering(self, request, queryset):
+        if self.keyset:
+            return [self.keyset_field, 'pk']
+        return super(KeysetChangeList, self).get_ordering(request, queryset)
+
+    def get_results(self, request):
+        if not self.keyset:
+            return super(KeysetChangeList, self).get_results(request)
+
+        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        queryset = self.queryset
+
+        if self.cursor:
+            try:
+                value, pk = self.cursor.rsplit('-', 1)
+                pk = int(pk)
+            except ValueError:
+                value, pk = None, None
+            if value is not None:
+                queryset = queryset.filter(
+                    Q(**{self.keyset_field + '__gt': value}) |
+                    Q(**{self.keyset_field: value, 'pk__gt': pk})
+                )
+
+        result_list = list(queryset[:self.list_per_page + 1])
+
+        if len(result_list) > self.list_per_page:
+            result_list = result_list[:self.list_per_page]
+            last = result_list[-1]
+            self.next_page_url = self.get_query_string({
+                CURSOR_VAR: '%s-%d' % (getattr(last, self.keyset_field), last.pk),
+            })
+        else:
+            self.next_page_url = None
+
+        self.first_page_url = self.get_query_string()
+        self.result_count = paginator.count
+        self.result_count_estimated = paginator.estimated
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = result_list
+        self.can_show_all = False
+        self.multi_page = bool(self.cursor or self.next_page_url)
+        self.paginator = paginator
+
+class TerminalChangeList(KeysetChangeList):
+    keyset_field = 'term_id'
@@ -0,0 +1,79 @@
+from django.db import transaction
+from millennium.panel.models import *
+
+CLONED_TABLES = (NCCTermParms, InstallParms, FconfigOpts, CoinValTable, CardTable, RateTable, NPANXXTable)
+
+# Table -> (definitions model, foreign key from the definition to the table)
+CHILD_DEFS = {
+    CoinValTable: (CoinValDefs, 'coinValTable'),
+    CardTable: (CardDefs, 'cardTable'),
+    RateTable: (RateDefs, 'rateTable'),
+}
+
+def copyInstance(obj, **overrides):
+    values = {
+        field.attname: getattr(obj, field.attname)
+        for field in obj._meta.concrete_fields
+        if not field.primary_key
+    }
+    values.update(overrides)
+    return type(obj)(**values)
+
+def cloneTables(tables, tenants):
+    # Copies every table in `tables` into every tenant in `tenants`: one
+    # bulk_create per table type and one per definitions type, whatever the
+    # number of tenants. Tables whose name already exists in a target tenant
+    # are left alone. The content blob is copied as is, since the content is.
+    # Returns {model name: number of rows created}.
+    counts = {}
+    byModel = {}
+    for table in tables:
+        byModel.setdefault(type(table), []).append(table)
+
+    with transaction.atomic():
+        for model in CLONED_TABLES:
+            sources = byModel.get(model)
+            if not sources:
+                continue
+
+            names = [source.name for source in sources]
+            existing = set(model.objects.filter(tenant__in=tenants, name__in=names).values_list('tenant_id', 'name'))
+
+            copies = [
+                copyInstance(source, tenant_id=tenant.id)
+                for tenant in tenants
+                for source in sources
+                if (tenant.id, source.name) not in existing
+            ]
+            if not copies:
+                continue
+
+            model.objects.bulk_create(copies)
+            counts[model.__name__] = len(copies)
+
+            if model not in CHILD_DEFS:
+                continue
+
+            # Map (tenant, name) -> new table id; works on backends that do
+            # not return ids from bulk inserts
+            created = {(copy.tenant_id, copy.name) for copy in copies}
+            newIds = {
+                (tenantId, name): tableId
+                for tenantId, name, tableId in model.objects.filter(tenant__in=tenants, name__in=names).values_list('tenant_id', 'name', 'id')
+                if (tenantId, name) in created
+            }
+
+            childModel, fk = CHILD_DEFS[model]
+            sourceNames = {source.id: source.name for source in sources}
+            children = list(childModel.objects.filter(**{fk + '__in': sources}))
+
+            childCopies = [
+                copyInstance(child, **{fk + '_id': newIds[(tenant.id, sourceNames[getattr(child, fk + '_id')])]})
+                for tenant in tenants
+                for child in children
+                if (tenant.id, sourceNames[getattr(child, fk + '_id')]) in newIds
+            ]
+            childModel.objects.bulk_create(childCopies)
+            counts[childModel.__name__] = len(childCopies)
+
+    return counts
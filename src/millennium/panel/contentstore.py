@@ -0,0 +1,148 @@
+from collections import OrderedDict
+from django.core.serializers.json import DjangoJSONEncoder
+from millennium.panel.models import ConfigBlob, FconfigOpts, InstallParms, CoinValTable, CardTable, NPANXXTable
+from millennium.panel.mtr import asMTRConfig
+from millennium.panel.metrics import encode, measureFrame
+from millennium.panel.oncommit import onCommitOnce
+import hashlib
+import json
+import threading
+
+# Tables whose content is shared between tenants, with the related name of
+# their child definitions (if any) that are part of the content.
+DEDUPLICATED = {
+    FconfigOpts: None,
+    InstallParms: None,
+    CoinValTable: 'coinvaldefs_set',
+    CardTable: 'carddefs_set',
+    NPANXXTable: None,
+}
+
+# Identity and bookkeeping, not content
+PAYLOAD_EXCLUDE = ('id', 'name', 'tenant', 'blob')
+
+FRAME_CACHE_SIZE = 4096
+
+_frames = OrderedDict()
+_framesLock = threading.Lock()
+
+def digestOf(payload):
+    return hashlib.sha256(payload).hexdigest()
+
+def fieldValues(obj, exclude=PAYLOAD_EXCLUDE):
+    return [
+        (field.attname, field.value_to_string(obj))
+        for field in obj._meta.concrete_fields
+        if field.name not in exclude
+    ]
+
+def tablePayload(table):
+    rows = [fieldValues(table)]
+
+    children = DEDUPLICATED.get(type(table))
+    if children:
+        manager = getattr(table, children)
+        exclude = ('id', manager.field.name)
+        rows.extend(fieldValues(child, exclude) for child in manager.all())
+
+    return json.dumps(
+        [type(table).__name__, rows],
+        cls=DjangoJSONEncoder,
+        separators=(',', ':'),
+    ).encode()
+
+def storeBlob(payload, kind='table', source=None):
+    blob, created = ConfigBlob.objects.get_or_create(
+        digest=digestOf(payload),
+        defaults={
+            'kind': kind,
+            'source': source,
+            'payload': payload,
+        },
+    )
+    return blob
+
+def internTable(table):
+    blob = storeBlob(tablePayload(table))
+
+    if table.blob_id != blob.id:
+        # update() rather than save(): no signals, no recursion
+        type(table).objects.filter(pk=table.pk).update(blob=blob)
+        table.blob = blob
+
+    return blob
+
+def internTables(queryset):
+    children = DEDUPLICATED.get(queryset.model)
+    if children:
+        queryset = queryset.prefetch_related(children)
+
+    for table in queryset:
+        internTable(table)
+
+def scheduleIntern(table):
+    # Interning is deferred to commit and done once per table, so saving a
+    # table together with its 16 inline definitions hashes it only once.
+    def intern():
+        fresh = type(table).objects.filter(pk=table.pk).first()
+        if fresh is not None:
+            internTable(fresh)
+
+    onCommitOnce(('intern', type(table), table.pk), intern)
+
+def mtrKey(MTRconfig):
+    return asMTRConfig(MTRconfig).key
+
+def getFrame(table, MTRconfig):
+    # Encoded frames are content-addressed by (table payload, MTR config):
+    # every tenant sharing a configuration shares the frame as well.
+    with measureFrame(table) as measurement:
+        frame, measurement.cache = cachedFrame(table, asMTRConfig(MTRconfig))
+        measurement.size = len(frame)
+    return frame
+
+def cachedFrame(table, MTRconfig):
+    # (frame, where it came from)
+    if type(table) not in DEDUPLICATED or not hasattr(table, 'getFrame'):
+        return encode(table, MTRconfig), 'none'
+
+    blob = table.blob if table.blob_id is not None else internTable(table)
+    digest = digestOf(b'frame\0' + blob.digest.encode() + b'\0' + mtrKey(MTRconfig))
+
+    with _framesLock:
+        frame = _frames.get(digest)
+        if frame is not None:
+            _frames.move_to_end(digest)
+            return frame, 'hit'
+
+    stored = ConfigBlob.objects.filter(digest=digest).values_list('payload', flat=True).first()
+    if stored is not None:
+        frame = bytes(stored)
+        cache = 'store'
+    else:
+        frame = encode(table, MTRconfig)
+        cache = 'miss'
+        ConfigBlob.objects.get_or_create(
+            digest=digest,
+            defaults={
+                'kind': 'frame',
+                'source': blob,
+                'payload': frame,
+            },
+        )
+
+    with _framesLock:
+        _frames[digest] = frame
+        if len(_frames) > FRAME_CACHE_SIZE:
+            _frames.popitem(last=False)
+
+    return frame, cache
+
+def pruneBlobs():
+    # Table payloads no tenant refers to anymore; their frames cascade
+    referenced = set()
+    for model in DEDUPLICATED:
+        referenced.update(model.objects.exclude(blob=None).values_list('blob_id', flat=True).distinct())
+
+    deleted, _ = ConfigBlob.objects.filter(kind='table').exclude(id__in=referenced).delete()
+    return deleted
@@ -0,0 +1,236 @@
+from collections import namedtuple
+import struct
+
+# Download dialog between a calling terminal and the NCC, above the packet
+# transport. Every message is one packet payload; frames are sent as they
+# are, led by their table ID.
+#   phone -> NCC: CALL_IN term ID (10 BCD digits), REQUEST table ID, DONE,
+#     ALARM code, STATUS code, PERF_STATS counters (little endian uint32s),
+#     COINS (coin index, count as a little endian uint16) pairs, COLLECTED,
+#     CDR call records (a chunk of the upload, see cdr.CDR_RECORD)
+#   NCC -> phone: PENDING table IDs, UNKNOWN, NO_TABLE table ID, GOODBYE
+MSG_CALL_IN = 0x01
+MSG_REQUEST = 0x02
+MSG_DONE = 0x03
+MSG_ALARM = 0x04
+MSG_STATUS = 0x05
+MSG_PERF_STATS = 0x06
+MSG_COINS = 0x07
+MSG_COLLECTED = 0x08
+MSG_CDR = 0x09
+MSG_PENDING = 0x81
+MSG_UNKNOWN = 0x82
+MSG_NO_TABLE = 0x83
+MSG_GOODBYE = 0x84
+
+TERM_ID_SIZE = 5
+TABLE_RETRIES = 2 # a table whose transfer fails is sent this many more times
+
+# States
+WAIT_CALL_IN = 'wait_call_in'
+LOOKUP = 'lookup'
+WAIT_REQUEST = 'wait_request'
+SENDING = 'sending'
+HANGUP = 'hangup'
+
+# Seconds the phone, the database or the transport get in each state
+# before the call is dropped
+STATE_TIMEOUTS = {
+    WAIT_CALL_IN: 30.0,
+    LOOKUP: 30.0,
+    WAIT_REQUEST: 60.0,
+    SENDING: 300.0,
+}
+
+# What the driver gets back from Dialog.handle(), in order:
+#   ('send', payload): send a message over the transport
+#   ('frame', frame): send a table's frame; the driver reports 'sent' or
+#     'failed'
+#   ('lookup', term ID): find the terminal; the driver reports
+#     'identified' with a Download, or 'unknown'
+#   ('abort',): give up on the frame being sent
+#   ('downloaded', terminal id, [table names]): the phone has these tables
+#   ('timer', seconds): (re)arm the state timer, None to stop it; the
+#     driver reports 'timeout'
+#   ('hangup',): drop the call
+#   ('event', terminal id, kind, code): the phone raised an alarm or
+#     reported its status
+#   ('perfstats', terminal id, (counters)): the phone's performance
+#     statistics, in the order of PerfStatsBlock.PERF_STATS
+#   ('coins', terminal id, ((coin, count), ...)): coins went into the
+#     cashbox since the last report
+#   ('collected', terminal id): the cashbox was emptied
+#   ('cdr', terminal id, bytes): the next chunk of the phone's call records
+Download = namedtuple('Download', 'terminal timing frames pending')
+
+def parseMessage(payload):
+    # A phone's packet payload as a dialog event
+    if payload and payload[0] == MSG_CALL_IN and len(payload) > TERM_ID_SIZE:
+        return ('call_in', bytes(payload[1:1 + TERM_ID_SIZE]).hex())
+    if payload and payload[0] == MSG_REQUEST and len(payload) > 1:
+        return ('request', payload[1])
+    if payload and payload[0] == MSG_DONE:
+        return ('done',)
+    if payload and payload[0] in (MSG_ALARM, MSG_STATUS) and len(payload) > 1:
+        return ('alarm' if payload[0] == MSG_ALARM else 'status', payload[1])
+    if payload and payload[0] == MSG_PERF_STATS and len(payload) >= 5:
+        count = (len(payload) - 1) // 4
+        return ('perfstats', struct.unpack_from('<%dI' % count, bytes(payload), 1))
+    if payload and payload[0] == MSG_COINS and len(payload) >= 4:
+        count = (len(payload) - 1) // 3
+        return ('coins', tuple(struct.iter_unpack('<BH', bytes(payload[1:1 + 3 * count]))))
+    if payload and payload[0] == MSG_COLLECTED:
+        return ('collected',)
+    if payload and payload[0] == MSG_CDR:
+        return ('cdr', bytes(payload[1:]))
+    return ('garbage', bytes(payload))
+
+class Dialog(object):
+    # The dialog of one call as a transition table. Dialog does no I/O: the
+    # driver feeds it events and carries out the actions it returns, so one
+    # event loop can run any number of them, and they can be benchmarked or
+    # fuzzed with plain function calls.
+    #
+    # TRANSITIONS maps (state, event) to (handler, next state). A handler
+    # returns a list of actions, and may return a different state as a
+    # second value when a guard fails. Events a state has no entry for are
+    # counted as protocol errors and otherwise ignored. Deferred events are
+    # handled once the dialog is back in WAIT_REQUEST.
+
+    TRANSITIONS = {
+        (WAIT_CALL_IN, 'call_in'): ('lookup', LOOKUP),
+        (LOOKUP, 'identified'): ('offer', WAIT_REQUEST),
+        (LOOKUP, 'unknown'): ('reject', HANGUP),
+        (WAIT_REQUEST, 'request'): ('sendTable', SENDING),
+        (WAIT_REQUEST, 'done'): ('finish', HANGUP),
+        (SENDING, 'sent'): ('tableSent', WAIT_REQUEST),
+        (SENDING, 'failed'): ('retryTable', SENDING),
+        # The phone may ask for the next table as soon as it has acknowledged
+        # the last packet, before the transport has reported the transfer
+        (SENDING, 'request'): ('defer', SENDING),
+        (SENDING, 'done'): ('defer', SENDING),
+        # Alarms, status reports, statistics, coin traffic and call records
+        # are taken any time once the phone is identified
+        (WAIT_REQUEST, 'alarm'): ('report', WAIT_REQUEST),
+        (WAIT_REQUEST, 'status'): ('report', WAIT_REQUEST),
+        (SENDING, 'alarm'): ('report', SENDING),
+        (SENDING, 'status'): ('report', SENDING),
+        (WAIT_REQUEST, 'perfstats'): ('reportStats', WAIT_REQUEST),
+        (SENDING, 'perfstats'): ('reportStats', SENDING),
+        (WAIT_REQUEST, 'coins'): ('reportCoins', WAIT_REQUEST),
+        (SENDING, 'coins'): ('reportCoins', SENDING),
+        (WAIT_REQUEST, 'collected'): ('reportCoins', WAIT_REQUEST),
+        (SENDING, 'collected'): ('reportCoins', SENDING),
+        (WAIT_REQUEST, 'cdr'): ('uploadCalls', WAIT_REQUEST),
+        (SENDING, 'cdr'): ('uploadCalls', SENDING),
+        (WAIT_CALL_IN, 'timeout'): ('drop', HANGUP),
+        (LOOKUP, 'timeout'): ('drop', HANGUP),
+        (WAIT_REQUEST, 'timeout'): ('finish', HANGUP),
+        (SENDING, 'timeout'): ('abort', HANGUP),
+    }
+
+    def __init__(self):
+        self.state = WAIT_CALL_IN
+        self.download = None
+        self.tableIds = {}
+        self.table = None
+        self.retries = 0
+        self.sent = []
+        self.deferred = []
+        self.event = None
+        self.errors = 0
+
+    def start(self):
+        return [('timer', STATE_TIMEOUTS[self.state])]
+
+    def handle(self, event, *args):
+        transition = self.TRANSITIONS.get((self.state, event))
+        if transition is None:
+            if self.state != HANGUP:
+                self.errors += 1
+            return []
+
+        handler, state = transition
+        self.event = event
+        result = getattr(self, handler)(*args)
+        if isinstance(result, tuple):
+            actions, state = result
+        else:
+            actions = result
+
+        if state != self.state:
+            self.state = state
+            if state == HANGUP:
+                actions.append(('timer', None))
+                actions.append(('hangup',))
+            else:
+                actions.append(('timer', STATE_TIMEOUTS[state]))
+
+        if self.deferred and self.state == WAIT_REQUEST:
+            event, args = self.deferred.pop(0)
+            actions.extend(self.handle(event, *args))
+        return actions
+
+    def packet(self, payload):
+        return self.handle(*parseMessage(payload))
+
+    def lookup(self, termId):
+        return [('lookup', termId)]
+
+    def offer(self, download):
+        self.download = download
+        self.tableIds = {frame[0]: name for name, frame in download.frames.items() if frame}
+        pending = [download.frames[name][0] for name in download.pending if download.frames.get(name)]
+        return [('send', bytes([MSG_PENDING] + pending))]
+
+    def reject(self):
+        return [('send', bytes((MSG_UNKNOWN,)))]
+
+    def sendTable(self, tableId):
+        name = self.tableIds.get(tableId)
+        if name is None:
+            return [('send', bytes((MSG_NO_TABLE, tableId)))], WAIT_REQUEST
+        self.table = name
+        self.retries = 0
+        return [('frame', self.download.frames[name])]
+
+    def defer(self, *args):
+        self.deferred.append((self.event, args))
+        return []
+
+    def report(self, code):
+        return [('event', self.download.terminal, self.event, code)]
+
+    def reportStats(self, counters):
+        return [('perfstats', self.download.terminal, counters)]
+
+    def reportCoins(self, *deposits):
+        return [(self.event, self.download.terminal) + deposits]
+
+    def uploadCalls(self, data):
+        return [('cdr', self.download.terminal, data)]
+
+    def tableSent(self):
+        if self.table not in self.sent:
+            self.sent.append(self.table)
+        self.table = None
+        return []
+
+    def retryTable(self):
+        self.retries += 1
+        if self.retries > TABLE_RETRIES:
+            return self.finish(), HANGUP
+        return [('frame', self.download.frames[self.table])]
+
+    def finish(self):
+        actions = []
+        if self.sent:
+            actions.append(('downloaded', self.download.terminal, list(self.sent)))
+        actions.append(('send', bytes((MSG_GOODBYE,))))
+        return actions
+
+    def abort(self):
+        return [('abort',)] + self.finish()
+
+    def drop(self):
+        return []
@@ -0,0 +1,146 @@
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from millennium.panel.models import TerminalEvent, TerminalStatus, terminal
+import threading
+import time
+
+COALESCE_WINDOW = 60.0 # seconds
+
+class EventCoalescer(object):
+    # Collects alarms and status events from any number of sessions. Within
+    # a window, repeats of the same (terminal, kind, code) only bump a
+    # counter; at the end of the window every distinct event is written as
+    # one row and the status of every terminal involved is upserted, all in
+    # a handful of bulk statements. A burst of a million identical alarms
+    # costs as much as one.
+    #
+    # With autoFlush, add() writes the window out itself once it is over;
+    # otherwise the owner calls flush(), e.g. from a timer. Flushes never
+    # overlap. Events of terminals that no longer exist are dropped; a
+    # window that fails to be written is merged back into the next one,
+    # unless the database rejected its contents.
+
+    def __init__(self, window=COALESCE_WINDOW, autoFlush=True):
+        self.window = window
+        self.autoFlush = autoFlush
+        self.lock = threading.Lock()
+        self.flushLock = threading.Lock()
+        self.pending = {}
+        self.windowStart = time.monotonic()
+        self.received = 0
+        self.written = 0
+        self.dropped = 0
+
+    def add(self, terminalId, kind, code, timestamp=None):
+        timestamp = timestamp or timezone.now()
+
+        with self.lock:
+            self.received += 1
+            self.merge({(terminalId, kind, code): (timestamp, timestamp, 1)})
+            due = self.autoFlush and time.monotonic() - self.windowStart >= self.window
+
+        if due:
+            # Whoever gets there first writes the window; the others go on
+            self.flush(wait=False)
+
+    def merge(self, events):
+        # Called with the lock held
+        for key, (first, last, count) in events.items():
+            entry = self.pending.get(key)
+            if entry is None:
+                self.pending[key] = [first, last, count]
+            else:
+                if first < entry[0]:
+                    entry[0] = first
+                if last > entry[1]:
+                    entry[1] = last
+                entry[2] += count
+
+    def flush(self, wait=True):
+        # Returns the number of rows written; 0 if nothing was pending, or if
+        # another flush is running and wait is False
+        if not self.flushLock.acquire(wait):
+            return 0
+        try:
+            with self.lock:
+                pending = self.pending
+                self.pending = {}
+                self.windowStart = time.monotonic()
+
+            if not pending:
+                return 0
+
+            try:
+                known = set(terminal.objects.filter(id__in={terminalId for terminalId, kind, code in pending}).values_list('id', flat=True))
+                unknown = [key for key in pending if key[0] not in known]
+                for key in unknown:
+                    self.dropped += pending.pop(key)[2]
+                if not pending:
+                    return 0
+
+                with transaction.atomic():
+                    TerminalEvent.objects.bulk_create([
+                        TerminalEvent(terminal_id=terminalId, kind=kind, code=code, first_seen=first, last_seen=last, count=count)
+                        for (terminalId, kind, code), (first, last, count) in pending.items()
+                    ], batch_size=500)
+                    upsertStatus(pending)
+            except IntegrityError:
+                # Would fail the same way again, e.g. a terminal deleted
+                # since the check
+                for first, last, count in pending.values():
+                    self.dropped += count
+                raise
+            except Exception:
+                with self.lock:
+                    self.merge(pending)
+                raise
+
+            self.written += len(pending)
+            return len(pending)
+        finally:
+            self.flushLock.release()
+
+def upsertStatus(events):
+    # events: {(terminal id, kind, code): [first seen, last seen, count]}.
+    # Folds them into TerminalStatus with one read, one bulk_update and one
+    # bulk_create, in place of one UPDATE per event. Assumes a single
+    # writer, i.e. one coalescer per database, which serializes its flushes.
+    changes = {}
+    for (terminalId, kind, code), (first, last, count) in events.items():
+        change = changes.get(terminalId)
+        if change is None:
+            change = changes[terminalId] = {'last_seen': last, 'alarms': 0, 'events': 0}
+        change['last_seen'] = max(change['last_seen'], last)
+        change['events'] += count
+
+        latest = 'last_%s_at' % kind
+        if kind == 'alarm':
+            change['alarms'] += count
+        if latest not in change or last > change[latest]:
+            change[latest] = last
+            change['last_' + kind] = code
+
+    existing = TerminalStatus.objects.in_bulk(list(changes))
+    created = []
+
+    for terminalId, change in changes.items():
+        status = existing.get(terminalId)
+        if status is None:
+            status = TerminalStatus(terminal_id=terminalId, last_seen=change['last_seen'])
+            created.append(status)
+        status.last_seen = max(status.last_seen, change['last_seen'])
+        status.alarms += change['alarms']
+        status.events += change['events']
+        if 'last_alarm' in change and (status.last_alarm_at is None or change['last_alarm_at'] >= status.last_alarm_at):
+            status.last_alarm = change['last_alarm']
+            status.last_alarm_at = change['last_alarm_at']
+        if 'last_status' in change and (status.last_status_at is None or change['last_status_at'] >= status.last_status_at):
+            status.last_status = change['last_status']
+            status.last_status_at = change['last_status_at']
+
+    TerminalStatus.objects.bulk_update(
+        [status for terminalId, status in existing.items()],
+        ['last_seen', 'last_alarm', 'last_alarm_at', 'last_status', 'last_status_at', 'alarms', 'events'],
+        batch_size=500,
+    )
+    TerminalStatus.objects.bulk_create(created, batch_size=500)
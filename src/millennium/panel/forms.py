@@ -0,0 +1,141 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from millennium.panel.models import NPANXXTable, terminal
+from millennium.panel.models.NPANXXTable import NXX_RANGE, NXX_FIELDS
+from millennium.panel.layering import LAYERED, resolveValues, missingTables
+
+NXX_MAX_CLASS = 128
+
+def packNXX(values):
+    return bytes(values).hex()
+
+def unpackNXX(packed):
+    # Two hex digits per NXX, NXX 200 first
+    try:
+        values = bytes.fromhex(packed)
+    except ValueError:
+        values = None
+
+    if values is None or len(values) != len(NXX_RANGE):
+        bad = []
+        for index, nxx in enumerate(NXX_RANGE):
+            try:
+                int(packed[index * 2:index * 2 + 2], 16)
+            except ValueError:
+                bad.append(nxx)
+        raise ValidationError(
+            'Invalid class for NXX %(nxx)s.',
+            code='invalid',
+            params={'nxx': ', '.join(map(str, bad[:20])) or '-'},
+        )
+
+    return list(values)
+
+class NPANXXGridWidget(forms.Widget):
+    # The 800 cells are built client-side and packed into a single hidden
+    # value on submit, instead of rendering and posting 800 form fields.
+    template_name = 'admin/widgets/npanxx_grid.html'
+
+    def format_value(self, value):
+        if isinstance(value, (list, tuple)):
+            return packNXX(value)
+        return value or ''
+
+class NPANXXGridField(forms.Field):
+    widget = NPANXXGridWidget
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        return unpackNXX(value)
+
+    def validate(self, value):
+        super(NPANXXGridField, self).validate(value)
+        if value is None:
+            return
+
+        if max(value) > NXX_MAX_CLASS:
+            bad = [str(nxx) for nxx, cls in zip(NXX_RANGE, value) if cls > NXX_MAX_CLASS]
+            raise ValidationError(
+                'Classes must be between 0 and %(max)d (NXX %(nxx)s).',
+                code='max_value',
+                params={'max': NXX_MAX_CLASS, 'nxx': ', '.join(bad[:20])},
+            )
+
+class NPANXXTableForm(forms.ModelForm):
+    grid = NPANXXGridField(
+        label='NXX classes',
+    )
+    fill_from = forms.IntegerField(
+        min_value=NXX_RANGE[0],
+        max_value=NXX_RANGE[-1],
+        required=False,
+        label='Fill NXX from',
+    )
+    fill_to = forms.IntegerField(
+        min_value=NXX_RANGE[0],
+        max_value=NXX_RANGE[-1],
+        required=False,
+        label='Fill NXX to',
+    )
+    fill_value = forms.IntegerField(
+        min_value=0,
+        max_value=NXX_MAX_CLASS,
+        required=False,
+        label='with class',
+        help_text='e.g. NXX 200 to 299 with class 3. Applied after the grid.',
+    )
+
+    class Meta:
+        model = NPANXXTable
+        fields = ('name', 'npa')
+
+    def __init__(self, *args, **kwargs):
+        super(NPANXXTableForm, self).__init__(*args, **kwargs)
+        if self.instance.pk is not None:
+            self.initial['grid'] = [getattr(self.instance, field) for field in NXX_FIELDS]
+        else:
+            self.initial.setdefault('grid', [0] * len(NXX_RANGE))
+
+    def clean(self):
+        cleaned_data = super(NPANXXTableForm, self).clean()
+        grid = cleaned_data.get('grid')
+        fill = [cleaned_data.get('fill_from'), cleaned_data.get('fill_to'), cleaned_data.get('fill_value')]
+
+        if any(value is not None for value in fill):
+            if any(value is None for value in fill):
+                raise ValidationError('Range fill needs a start, an end and a class.', code='incomplete_fill')
+            if fill[0] > fill[1]:
+                raise ValidationError('Range fill must start before it ends.', code='invalid_fill')
+            if grid is not None:
+                start = fill[0] - NXX_RANGE[0]
+                end = fill[1] - NXX_RANGE[0] + 1
+                grid[start:end] = [fill[2]] * (end - start)
+
+        if grid is not None:
+            # Already validated in bulk by the grid field; the per-field
+            # validators are skipped since none of the 800 are form fields.
+            for field, value in zip(NXX_FIELDS, grid):
+                setattr(self.instance, field, value)
+
+        return cleaned_data
+
+class TerminalForm(forms.ModelForm):
+
+    class Meta:
+        model = terminal
+        exclude = ('tenant',)
+
+    def clean(self):
+        cleaned_data = super(TerminalForm, self).clean()
+        own = tuple(getattr(cleaned_data.get(name), 'pk', None) for name in LAYERED)
+        missing = missingTables(resolveValues(own, cleaned_data.get('group')))
+
+        if missing:
+            raise ValidationError(
+                'No %(tables)s for this terminal: set them here or in its group.',
+                code='incomplete',
+                params={'tables': ', '.join(missing)},
+            )
+
+        return cleaned_data
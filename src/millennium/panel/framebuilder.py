@@ -0,0 +1,77 @@
+from millennium.panel.models import NCCTermParms, InstallParms, FconfigOpts, CoinValTable, CardTable
+from millennium.panel.contentstore import getFrame
+from millennium.panel.mtr import getMTRConfig
+from millennium.panel.framehelpers import mmHextel
+from millennium.panel.metrics import encode, measureBuilder, measureFrame
+
+# Tables with an encoder that depends on the table and profile only.
+# NCCTermParms also carries the terminal ID, which is patched into a frame
+# encoded once per table and profile.
+SHARED_TABLES = (InstallParms, FconfigOpts, CoinValTable, CardTable)
+
+# Child definitions the encoders read
+PREFETCH = {
+    CoinValTable: 'coinvaldefs_set',
+    CardTable: 'carddefs_set',
+}
+
+def loadTables(model, ids):
+    queryset = model.objects.all()
+    if model in PREFETCH:
+        queryset = queryset.prefetch_related(PREFETCH[model])
+    return queryset.in_bulk(ids)
+
+@measureBuilder('encodeShared')
+def encodeShared(needed):
+    # needed: {model: {(profile id, table id)}}. Returns
+    # {(model, profile id, table id): frame}, each loaded and encoded once.
+    frames = {}
+    for model, keys in needed.items():
+        if not keys:
+            continue
+        tables = loadTables(model, {tableId for profileId, tableId in keys})
+        for profileId, tableId in keys:
+            frames[model, profileId, tableId] = getFrame(tables[tableId], getMTRConfig(profileId))
+    return frames
+
+@measureBuilder('buildFrames')
+def buildFrames(terminals):
+    # Yields (terminal id, term_id, {table name: frame}) for every terminal
+    # in the queryset, from its effective configuration. Terminals are
+    # grouped by MTR profile and every table is loaded once and encoded once
+    # per profile, whatever the number of terminals sharing it. Tables a
+    # terminal has none of are left out.
+    columns = ['id', 'term_id', 'effective__MTRProfile_id', 'effective__NCCTermParms_id'] + ['effective__%s_id' % model.__name__ for model in SHARED_TABLES]
+    rows = list(terminals.values_list(*columns))
+
+    needed = {model: set() for model in SHARED_TABLES}
+    for row in rows:
+        for model, tableId in zip(SHARED_TABLES, row[4:]):
+            if tableId is not None:
+                needed[model].add((row[2], tableId))
+
+    frames = encodeShared(needed)
+    nccTables = loadTables(NCCTermParms, {row[3] for row in rows if row[3] is not None})
+    nccFrames = {}
+
+    for row in rows:
+        terminalId, termId, profileId, nccId = row[:4]
+        config = getMTRConfig(profileId)
+        terminalFrames = {}
+
+        if nccId is not None:
+            template = nccFrames.get((profileId, nccId))
+            if template is None:
+                with measureFrame(nccTables[nccId]) as measurement:
+                    template = nccFrames[profileId, nccId] = encode(nccTables[nccId], config, None)
+                    measurement.size = len(template)
+
+            start = config.offsets['NCCTermParms']['term_id']
+            nccFrame = bytearray(template)
+            nccFrame[start:start + config.NCC_TERM_SIZE] = mmHextel(termId, config.NCC_TERM_SIZE)
+            terminalFrames[NCCTermParms.__name__] = bytes(nccFrame)
+
+        for model, tableId in zip(SHARED_TABLES, row[4:]):
+            if tableId is not None:
+                terminalFrames[model.__name__] = frames[model, profileId, tableId]
+        yield terminalId, termId, terminalFrames
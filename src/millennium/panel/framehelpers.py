@@ -1,16 +1,10 @@
 import binascii
+from millennium.panel.tracing import traceFrame
 
 def printframe(frame, direction = "IN"):
-    colorend = '\033[0m'
-
-    if direction == "IN":
-        color = '\033[93m'
-    elif direction == "OUT":
-        color = '\033[92m'
-    else:
-        color = colorend
-
-    print(color + direction + ": " + " ".join(hexlist(frame)) + colorend)
+    # Kept for existing callers: frames go to the trace logger, formatted
+    # only if it is enabled
+    traceFrame(direction, frame)
 
 def hexlist(frame):
     newframe = []
@@ -59,7 +53,7 @@ def mmBCD(number, max = None, finalE = False):
     if finalE:
         end = hex(number[-1])[2:]
 
-        if end[-1] is '0':
+        if end[-1] == '0':
             end = end[0] + 'E'
 
         del number[-1]
@@ -72,7 +66,7 @@ def mmHextel(number, max = None):
         number = '00'
 
     # Single digit strings need to zero in front
-    if len(number) is 1:
+    if len(number) == 1:
         number = number.zfill(2)
 
     # Length of string must be an even number in order to be able to be hex'ed
@@ -0,0 +1,125 @@
+from django.db import transaction
+from millennium.panel.models import NCCTermParms, InstallParms, FconfigOpts, CoinValTable, CardTable, RateTable, NPANXXTable, MTRProfile, TerminalGroup, EffectiveConfig, terminal
+from millennium.panel.framebuilder import encodeShared, SHARED_TABLES
+from millennium.panel.oncommit import onCommitOnce
+
+# Everything a terminal can inherit from its group, by foreign key name
+LAYERED = tuple(model.__name__ for model in (NCCTermParms, InstallParms, FconfigOpts, CoinValTable, CardTable, RateTable, NPANXXTable, MTRProfile))
+LAYERED_IDS = tuple(name + '_id' for name in LAYERED)
+
+def resolveGroups(tenantIds):
+    # group id -> tuple of effective LAYERED_IDS, for every group of the
+    # given tenants. One query; each group is resolved once, on top of its
+    # already resolved parent.
+    groups = {
+        row[0]: row[1:]
+        for row in TerminalGroup.objects.filter(tenant__in=tenantIds).values_list('id', 'parent_id', *LAYERED_IDS)
+    }
+    empty = (None,) * len(LAYERED_IDS)
+    resolved = {}
+
+    for groupId in groups:
+        chain = []
+        seen = set()
+        while groupId is not None and groupId not in resolved and groupId not in seen:
+            seen.add(groupId)
+            chain.append(groupId)
+            groupId = groups[groupId][0] if groupId in groups else None
+
+        inherited = resolved.get(groupId, empty)
+        for groupId in reversed(chain):
+            inherited = overlay(groups[groupId][1:], inherited)
+            resolved[groupId] = inherited
+
+    return resolved
+
+def overlay(own, inherited):
+    return tuple(inherited[i] if value is None else value for i, value in enumerate(own))
+
+def descendants(group):
+    # The group and every group below it
+    children = {}
+    for groupId, parentId in TerminalGroup.objects.filter(tenant=group.tenant_id).values_list('id', 'parent_id'):
+        children.setdefault(parentId, []).append(groupId)
+
+    found = [group.pk]
+    for groupId in found:
+        found.extend(child for child in children.get(groupId, ()) if child not in found)
+    return found
+
+def missingTables(values):
+    # Names of the terminal tables an effective configuration lacks
+    return [name for name, value in zip(LAYERED, values) if value is None and name != 'MTRProfile']
+
+def resolveValues(own, group):
+    # Effective values for a terminal's own LAYERED_IDS in a group (or None)
+    if group is None:
+        return own
+    return overlay(own, resolveGroups([group.tenant_id]).get(group.pk, (None,) * len(LAYERED_IDS)))
+
+def refreshEffective(terminals, changes=None):
+    # Recomputes the effective configuration of the terminals in the
+    # queryset and writes only the rows that changed, in bulk. The frames
+    # of table/profile combinations that became effective are encoded
+    # right away, so the next download finds them in the frame store.
+    # If changes is a dict, terminal id -> names of the changed LAYERED
+    # fields is added to it. Returns the number of rows written.
+    rows = list(terminals.values_list('id', 'tenant_id', 'group_id', *LAYERED_IDS))
+    if not rows:
+        return 0
+
+    groups = resolveGroups({row[1] for row in rows})
+    current = {
+        row[0]: row[1:]
+        for row in EffectiveConfig.objects.filter(terminal__in=terminals.values('pk')).values_list('terminal_id', *LAYERED_IDS)
+    }
+
+    created = []
+    updated = []
+    combinations = set()
+
+    for row in rows:
+        terminalId, tenantId, groupId = row[:3]
+        values = row[3:]
+        if groupId is not None:
+            values = overlay(values, groups.get(groupId, (None,) * len(LAYERED_IDS)))
+
+        old = current.get(terminalId)
+        if old == values:
+            continue
+
+        config = EffectiveConfig(terminal_id=terminalId, **dict(zip(LAYERED_IDS, values)))
+        if changes is not None:
+            changes[terminalId] = [name for name, new, current in zip(LAYERED, values, old or (None,) * len(LAYERED)) if new != current]
+        (created if old is None else updated).append(config)
+        combinations.add(values)
+
+    with transaction.atomic():
+        EffectiveConfig.objects.bulk_create(created)
+        EffectiveConfig.objects.bulk_update(updated, LAYERED, batch_size=500)
+
+    profileAt = LAYERED.index('MTRProfile')
+    needed = {model: set() for model in SHARED_TABLES}
+    for values in combinations:
+        for model in SHARED_TABLES:
+            tableId = values[LAYERED.index(model.__name__)]
+            if tableId is not None:
+                needed[model].add((values[profileAt], tableId))
+    encodeShared(needed)
+
+    return len(created) + len(updated)
+
+def refreshGroup(group):
+    return refreshEffective(terminal.objects.filter(group__in=descendants(group)))
+
+def scheduleRefresh(obj):
+    # Deferred to commit and done once per group or terminal, however many
+    # times it is saved in the transaction
+    def refresh():
+        if isinstance(obj, TerminalGroup):
+            if TerminalGroup.objects.filter(pk=obj.pk).exists():
+                refreshGroup(obj)
+        else:
+            refreshEffective(terminal.objects.filter(pk=obj.pk))
+
+    onCommitOnce(('refresh', type(obj), obj.pk), refresh)
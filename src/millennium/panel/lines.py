@@ -0,0 +1,466 @@
+from django.db import close_old_connections
+from django.utils import timezone
+from millennium.panel.models import PendingDownload, terminal
+from millennium.panel.models.PerfStatsBlock import PERF_STATS
+from millennium.panel.framebuilder import buildFrames
+from millennium.panel.campaigns import TABLE_PRIORITY
+from millennium.panel.dialog import Dialog, Download
+from millennium.panel.capture import IN, OUT, OPEN, CLOSE
+from millennium.panel.cashbox import recordCoinEvents
+from millennium.panel.cdr import CDRDecoder
+from millennium.panel.perfstats import recordSamples
+from millennium.panel.tracing import tracer
+from millennium.panel.transport import ACK, FrameSender, LinkError, PacketDecoder, linkTimings, lineSpeed
+from collections import deque
+import asyncio
+import errno
+import logging
+import os
+import pty
+import termios
+import tty
+
+READ_SIZE = 4096
+HANGUP_DELAY = 1.0 # seconds DTR is held down to hang up a modem
+REOPEN_DELAY = 5.0 # seconds before a device that went away is opened again
+
+# Line states and the states each can move to
+CLOSED = 'closed'
+IDLE = 'idle'
+SESSION = 'session'
+HANGUP = 'hangup'
+
+LINE_TRANSITIONS = {
+    CLOSED: (IDLE,),
+    IDLE: (SESSION, CLOSED),
+    SESSION: (HANGUP, CLOSED),
+    HANGUP: (IDLE, CLOSED),
+}
+
+logger = logging.getLogger('millennium.panel.lines')
+
+class LineStateError(Exception):
+    pass
+
+def inExecutor(loop, function, *args):
+    # Runs database work in the loop's default executor. Its threads live as
+    # long as the process, so connections that went stale or broke are
+    # closed around every call, as Django does around a request.
+    def run():
+        close_old_connections()
+        try:
+            return function(*args)
+        finally:
+            close_old_connections()
+    return loop.run_in_executor(None, run)
+
+def inBackground(loop, function, *args):
+    # inExecutor() for work nobody waits for: failures are logged
+    future = inExecutor(loop, function, *args)
+    future.add_done_callback(logFailure)
+    return future
+
+def logFailure(future):
+    if not future.cancelled() and future.exception() is not None:
+        logger.error('Background database work failed', exc_info=future.exception())
+
+def loadDownload(terminals, termId):
+    # The Download for the terminal calling in: its link timing, the frames
+    # of all its tables and the names of those waiting for it, most vital
+    # first. None if the term ID is unknown.
+    terminals = terminals.filter(term_id=termId)
+    for terminalId, termId, frames in buildFrames(terminals[:1]):
+        pending = PendingDownload.objects.filter(terminal_id=terminalId).values_list('table', flat=True)
+        return Download(
+            terminalId,
+            linkTimings(terminal.objects.filter(pk=terminalId))[terminalId],
+            frames,
+            sorted((name for name in pending if name in frames), key=lambda name: TABLE_PRIORITY.get(name, len(TABLE_PRIORITY))),
+        )
+    return None
+
+def downloaded(terminalId, tables):
+    PendingDownload.objects.filter(terminal_id=terminalId, table__in=tables).delete()
+
+class DialogSession(object):
+    # Runs a Dialog on a line: feeds it the phone's messages, the outcome of
+    # frame transfers and timeouts, and carries out its actions. Messages
+    # and frames go out one at a time, in order. Database work runs in the
+    # default executor so the loop keeps serving the other lines.
+
+    def __init__(self, line):
+        self.line = line
+        self.loop = line.loop
+        self.dialog = Dialog()
+        self.timer = None
+        self.outgoing = deque()
+        self.sending = None
+        self.tasks = []
+        self.linkFailed = False
+        # Performance statistics and coin traffic, recorded in one batch
+        # each when the call ends
+        self.samples = []
+        self.coins = []
+        self.cdrDecoder = None
+        self.perform(self.dialog.start())
+
+    def packet(self, seq, payload):
+        self.perform(self.dialog.packet(payload))
+
+    def event(self, *event):
+        if self.line.session is self:
+            self.perform(self.dialog.handle(*event))
+
+    def perform(self, actions):
+        for action in actions:
+            kind = action[0]
+            if kind == 'timer':
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+                if action[1] is not None:
+                    self.timer = self.loop.call_later(action[1], self.event, 'timeout')
+            elif kind == 'lookup':
+                self.line.traceKey = action[1]
+                self.tasks.append(self.loop.create_task(self.lookup(action[1])))
+            elif kind == 'abort':
+                self.line.sender.cancel(LinkError('Session timed out'))
+            elif kind == 'downloaded':
+                inBackground(self.loop, downloaded, action[1], action[2])
+                self.line.manager.served += 1
+            elif kind == 'event':
+                if self.line.manager.events is not None:
+                    self.line.manager.events.add(action[1], action[2], action[3])
+            elif kind == 'perfstats':
+                self.samples.append((action[1], timezone.now(), dict(zip(PERF_STATS, action[2]))))
+            elif kind == 'coins':
+                now = timezone.now()
+                self.coins.extend((action[1], now, 'deposit', coin, count) for coin, count in action[2])
+            elif kind == 'collected':
+                self.coins.append((action[1], timezone.now(), 'collection', None, 1))
+            elif kind == 'cdr':
+                self.callRecords(action[1], action[2])
+            else:
+                self.outgoing.append(action)
+
+        if self.outgoing and self.sending is None:
+            self.sending = self.loop.create_task(self.drain())
+
+    def callRecords(self, terminalId, chunk):
+        # Decoded as they come in; the manager's CDRWriter writes them out
+        # from the executor
+        cdrs = self.line.manager.cdrs
+        if cdrs is None:
+            return
+        if self.cdrDecoder is None:
+            self.cdrDecoder = CDRDecoder(terminalId)
+        records = cdrs.decode(self.cdrDecoder, chunk)
+        if records:
+            inBackground(self.loop, cdrs.add, records)
+
+    async def lookup(self, termId):
+        try:
+            download = await inExecutor(self.loop, loadDownload, self.line.manager.terminals, termId)
+        except Exception:
+            # The state timer drops the call
+            logger.exception('Looking up terminal %s failed', termId)
+            return
+        if download is None:
+            self.event('unknown')
+        else:
+            self.line.sender.timing = download.timing
+            self.event('identified', download)
+
+    async def drain(self):
+        try:
+            while self.outgoing:
+                action = self.outgoing.popleft()
+                if action[0] == 'hangup':
+                    self.line.hangup()
+                    return
+                try:
+                    await self.line.sender.send(action[1])
+                except LinkError:
+                    self.linkFailed = True
+                    if action[0] != 'frame':
+                        self.line.hangup()
+                        return
+                    self.event('failed')
+                    continue
+                if action[0] == 'frame':
+                    self.event('sent')
+        finally:
+            self.sending = None
+
+    def close(self):
+        if self.timer is not None:
+            self.timer.cancel()
+        current = asyncio.current_task(self.loop)
+        for task in self.tasks + [self.sending]:
+            if task is not None and not task.done() and task is not current:
+                task.cancel()
+        if self.linkFailed:
+            self.line.manager.failed += 1
+        if self.samples:
+            inBackground(self.loop, recordSamples, self.samples)
+            self.samples = []
+        if self.coins:
+            inBackground(self.loop, recordCoinEvents, self.coins)
+            self.coins = []
+
+class Line(object):
+    # One modem endpoint, driven by the manager's event loop. Reads are
+    # decoded into packets as they arrive; writes go through a queue of
+    # memoryviews that is drained as far as the device takes it, so frames
+    # are never copied and the loop never blocks.
+
+    def __init__(self, manager, path, bps=None, fd=None, keep=None):
+        self.manager = manager
+        self.loop = manager.loop
+        self.path = path
+        self.bps = lineSpeed(bps)
+        self.fd = fd
+        self.keep = keep
+        self.state = CLOSED
+        self.queue = deque()
+        self.writing = False
+        self.readBuffer = bytearray(READ_SIZE)
+        self.session = None
+        self.sessionNumber = 0
+        self.traceKey = path
+        self.bytesIn = 0
+        self.bytesOut = 0
+
+    def __str__(self):
+        return '%s (%s)' % (self.path, self.state)
+
+    def setState(self, state):
+        if state not in LINE_TRANSITIONS[self.state]:
+            raise LineStateError('%s: %s -> %s' % (self.path, self.state, state))
+        self.state = state
+
+    def open(self):
+        if self.fd is None:
+            self.fd = os.open(self.path, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+            if os.isatty(self.fd):
+                tty.setraw(self.fd)
+                speed = getattr(termios, 'B%d' % self.bps, None)
+                if speed is not None:
+                    attrs = termios.tcgetattr(self.fd)
+                    attrs[4] = attrs[5] = speed
+                    termios.tcsetattr(self.fd, termios.TCSANOW, attrs)
+        os.set_blocking(self.fd, False)
+        self.decoder = PacketDecoder()
+        self.sender = FrameSender(self.write, bps=self.bps, loop=self.loop)
+        self.loop.add_reader(self.fd, self.readable)
+        self.setState(IDLE)
+
+    def close(self):
+        if self.state == CLOSED:
+            return
+        self.endSession()
+        self.loop.remove_reader(self.fd)
+        self.loop.remove_writer(self.fd)
+        self.writing = False
+        self.queue.clear()
+        os.close(self.fd)
+        self.fd = None
+        if self.keep is not None:
+            os.close(self.keep)
+            self.keep = None
+        self.setState(CLOSED)
+
+    def readable(self):
+        view = memoryview(self.readBuffer)
+        try:
+            size = os.readv(self.fd, [view])
+        except BlockingIOError:
+            return
+        except OSError as e:
+            if e.errno != errno.EIO:
+                raise
+            size = 0
+
+        if size == 0:
+            # Carrier lost or device gone. A pty has no device to come back.
+            reopen = self.keep is None
+            self.close()
+            if reopen:
+                self.loop.call_later(REOPEN_DELAY, self.reopen)
+            return
+
+        self.bytesIn += size
+        capture = self.manager.capture
+        if self.state == IDLE:
+            self.setState(SESSION)
+            self.manager.sessions += 1
+            self.sessionNumber = self.manager.sessions
+            if capture is not None:
+                capture.record(self.sessionNumber, OPEN, self.path.encode())
+            self.session = self.manager.sessionFactory(self)
+        elif self.state != SESSION:
+            return
+
+        if capture is not None:
+            capture.record(self.sessionNumber, IN, view[:size])
+        tracer.frame('IN', view[:size], self.traceKey, self.sessionNumber)
+
+        for event in self.decoder.feed(view[:size]):
+            if self.state != SESSION:
+                break
+            if event[0] == 'packet':
+                self.write(bytes((ACK, event[1])))
+                self.session.packet(event[1], event[2])
+            else:
+                self.sender.received(event)
+
+    def reopen(self):
+        if self.state == CLOSED and not self.manager.closing:
+            try:
+                self.open()
+            except OSError:
+                self.loop.call_later(REOPEN_DELAY, self.reopen)
+
+    def write(self, data):
+        if self.state == CLOSED:
+            return
+        if self.manager.capture is not None and self.state == SESSION:
+            self.manager.capture.record(self.sessionNumber, OUT, data)
+        tracer.frame('OUT', data, self.traceKey, self.sessionNumber)
+        self.queue.append(memoryview(data))
+        if not self.writing:
+            self.flush()
+
+    def flush(self):
+        queue = self.queue
+        while queue:
+            try:
+                size = os.write(self.fd, queue[0])
+            except BlockingIOError:
+                break
+            except OSError:
+                # Device gone or carrier lost, as in readable()
+                reopen = self.keep is None
+                self.close()
+                if reopen:
+                    self.loop.call_later(REOPEN_DELAY, self.reopen)
+                return
+            self.bytesOut += size
+            if size < len(queue[0]):
+                queue[0] = queue[0][size:]
+                break
+            queue.popleft()
+
+        if queue and not self.writing:
+            self.loop.add_writer(self.fd, self.flush)
+            self.writing = True
+        elif not queue and self.writing:
+            self.loop.remove_writer(self.fd)
+            self.writing = False
+
+    def endSession(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+            if self.manager.capture is not None:
+                self.manager.capture.record(self.sessionNumber, CLOSE)
+            self.traceKey = self.path
+        self.sender.cancel()
+
+    def hangup(self):
+        if self.state != SESSION:
+            return
+        self.endSession()
+        self.setState(HANGUP)
+        if os.isatty(self.fd) and self.keep is None:
+            # Dropping the speed to 0 drops DTR, which makes the modem hang up
+            attrs = termios.tcgetattr(self.fd)
+            speed = attrs[4]
+            attrs[4] = attrs[5] = termios.B0
+            termios.tcsetattr(self.fd, termios.TCSANOW, attrs)
+            self.loop.call_later(HANGUP_DELAY, self.raiseDTR, speed)
+        else:
+            self.loop.call_later(HANGUP_DELAY, self.ready)
+
+    def raiseDTR(self, speed):
+        if self.state == HANGUP:
+            attrs = termios.tcgetattr(self.fd)
+            attrs[4] = attrs[5] = speed
+            termios.tcsetattr(self.fd, termios.TCSANOW, attrs)
+            self.ready()
+
+    def ready(self):
+        if self.state == HANGUP:
+            # Whatever arrived during the hangup belongs to no one
+            self.decoder = PacketDecoder()
+            self.sender = FrameSender(self.write, bps=self.bps, loop=self.loop)
+            self.setState(IDLE)
+
+class LineManager(object):
+    # Runs any number of lines from one process and one event loop.
+    # Endpoints are serial devices (modems) or, for testing, ptys whose
+    # other end is handed to a simulated phone.
+
+    def __init__(self, terminals=None, sessionFactory=DialogSession, bps=None, loop=None, capture=None, events=None, cdrs=None):
+        self.terminals = terminals if terminals is not None else terminal.objects.all()
+        self.sessionFactory = sessionFactory
+        self.bps = bps
+        self.loop = loop or asyncio.get_event_loop()
+        self.lines = []
+        self.closing = False
+        self.served = 0
+        self.failed = 0
+        self.sessions = 0
+        self.capture = capture
+        # The phones' alarms and status reports go to an EventCoalescer
+        # without autoFlush, their call records to a CDRWriter; both are
+        # written out from the executor every window or flush interval
+        self.events = events
+        if events is not None:
+            self.flushEvery(events, events.window)
+        self.cdrs = cdrs
+        if cdrs is not None:
+            self.flushEvery(cdrs, cdrs.flushInterval)
+
+    def flushEvery(self, writer, interval):
+        def flush():
+            if not self.closing:
+                inBackground(self.loop, writer.flush)
+                self.loop.call_later(interval, flush)
+        self.loop.call_later(interval, flush)
+
+    def addDevice(self, path):
+        line = Line(self, path, self.bps)
+        line.open()
+        self.lines.append(line)
+        return line
+
+    def addPty(self):
+        # Returns the line and the path of the pty's other end. The manager
+        # keeps that end open too, so the line survives the phone closing it.
+        master, slave = pty.openpty()
+        tty.setraw(slave)
+        line = Line(self, os.ttyname(slave), self.bps, fd=master, keep=slave)
+        line.open()
+        self.lines.append(line)
+        return line, line.path
+
+    def close(self):
+        self.closing = True
+        for line in self.lines:
+            line.close()
+
+    def stats(self):
+        states = {}
+        for line in self.lines:
+            states[line.state] = states.get(line.state, 0) + 1
+        return {
+            'lines': len(self.lines),
+            'states': states,
+            'served': self.served,
+            'failed': self.failed,
+            'bytes_in': sum(line.bytesIn for line in self.lines),
+            'bytes_out': sum(line.bytesOut for line in self.lines),
+            'events': self.events.received if self.events is not None else 0,
+            'call_records': self.cdrs.written if self.cdrs is not None else 0,
+        }
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+from millennium.panel.capture import DIRECTIONS, hexdump, readCapture
+import datetime
+
+class Command(BaseCommand):
+    help = 'Print the records of a line capture, with hex dumps'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Capture file')
+        parser.add_argument('--session', type=int, help='Only this session')
+
+    def handle(self, *args, **options):
+        try:
+            for timestamp, session, direction, data in readCapture(options['path']):
+                if options['session'] is not None and session != options['session']:
+                    continue
+                when = datetime.datetime.fromtimestamp(timestamp / 1000000.0, datetime.timezone.utc)
+                self.stdout.write('%s session %d %s %d bytes' % (when.isoformat(), session, DIRECTIONS.get(direction, direction), len(data)))
+                if data:
+                    self.stdout.write(hexdump(data))
+        except (OSError, ValueError) as e:
+            raise CommandError(e)
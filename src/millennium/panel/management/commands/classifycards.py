@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+from millennium.panel.models import CardTable
+from millennium.panel.cardindex import getCardIndex
+from collections import Counter
+import sys
+
+class Command(BaseCommand):
+    help = 'Classify card numbers (one per line) against a card table and summarise matches per card definition'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenant', help='Tenant (group) name')
+        parser.add_argument('cardtable', help='Card table name')
+        parser.add_argument('pans', nargs='?', help='File with one card number per line (default: stdin)')
+        parser.add_argument('--each', action='store_true', help='Print the matching definition for every card number')
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        cardTable = CardTable.objects.filter(tenant__name=options['tenant'], name=options['cardtable']).first()
+        if cardTable is None:
+            raise CommandError('Unknown card table "%s" for tenant "%s"' % (options['cardtable'], options['tenant']))
+
+        index = getCardIndex(cardTable)
+        counts = Counter()
+        source = open(options['pans']) if options['pans'] else sys.stdin
+
+        try:
+            batch = []
+            for line in source:
+                batch.append(line.strip())
+                if len(batch) >= options['batch_size']:
+                    self.classify(index, batch, counts, options['each'])
+                    batch = []
+            self.classify(index, batch, counts, options['each'])
+        finally:
+            if source is not sys.stdin:
+                source.close()
+
+        for card, count in sorted(counts.items(), key=lambda item: (item[0] is None, item[0] and item[0].order)):
+            self.stdout.write('%s: %d' % (card if card is not None else 'No match', count))
+
+    def classify(self, index, pans, counts, each):
+        for pan, card in zip(pans, index.lookupMany(pans)):
+            counts[card] += 1
+            if each:
+                self.stdout.write('%s %s' % (pan, card.order if card is not None else '-'))
@@ -0,0 +1,37 @@
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand, CommandError
+from millennium.panel.cloning import cloneTables, CLONED_TABLES
+
+class Command(BaseCommand):
+    help = 'Clone configuration tables (with their definitions) from one tenant into one or more tenants'
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', help='Tenant (group) name to clone from')
+        parser.add_argument('targets', nargs='+', help='Tenant (group) names to clone into')
+        parser.add_argument('--name', action='append', dest='names', help='Only clone tables with this name (repeatable, default: all)')
+        parser.add_argument('--create', action='store_true', help='Create target tenants that do not exist')
+
+    def handle(self, *args, **options):
+        source = Group.objects.filter(name=options['source']).first()
+        if source is None:
+            raise CommandError('Unknown tenant "%s"' % options['source'])
+
+        tenants = []
+        for name in options['targets']:
+            if options['create']:
+                tenant, created = Group.objects.get_or_create(name=name)
+            else:
+                tenant = Group.objects.filter(name=name).first()
+                if tenant is None:
+                    raise CommandError('Unknown tenant "%s"' % name)
+            tenants.append(tenant)
+
+        tables = []
+        for model in CLONED_TABLES:
+            queryset = model.objects.filter(tenant=source)
+            if options['names']:
+                queryset = queryset.filter(name__in=options['names'])
+            tables.extend(queryset)
+
+        for model, count in cloneTables(tables, tenants).items():
+            self.stdout.write('%s: %d' % (model, count))
@@ -0,0 +1,31 @@
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand, CommandError
+from millennium.panel.tenantdump import exportTenant
+import gzip
+import sys
+
+class Command(BaseCommand):
+    help = 'Stream all configuration tables and terminals of a tenant as JSON lines'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenant', help='Tenant (group) name')
+        parser.add_argument('-o', '--output', help='Output file, gzip-compressed if it ends in .gz (default: stdout)')
+
+    def handle(self, *args, **options):
+        tenant = Group.objects.filter(name=options['tenant']).first()
+        if tenant is None:
+            raise CommandError('Unknown tenant "%s"' % options['tenant'])
+
+        output = options['output']
+        if output is None:
+            out = sys.stdout
+        elif output.endswith('.gz'):
+            out = gzip.open(output, 'wt', encoding='utf-8')
+        else:
+            out = open(output, 'w', encoding='utf-8')
+
+        try:
+            out.writelines(exportTenant(tenant))
+        finally:
+            if out is not sys.stdout:
+                out.close()
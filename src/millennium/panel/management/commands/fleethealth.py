@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import Group
+from millennium.panel.models.PerfStatsBlock import PERF_STATS
+from millennium.panel.perfstats import tenantSeries, worstTerminals
+import datetime
+
+class Command(BaseCommand):
+    help = 'Fleet performance statistics of a tenant from the rollups (CSV on stdout)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenant', help='Tenant (group) name')
+        parser.add_argument('--days', type=float, default=7, help='How far back to report')
+        parser.add_argument('--hourly', action='store_true', help='Hourly instead of daily buckets')
+        parser.add_argument('--worst', type=int, help='List this many terminals with the highest dialog failure rate instead')
+
+    def handle(self, *args, **options):
+        tenant = Group.objects.filter(name=options['tenant']).first()
+        if tenant is None:
+            raise CommandError('Unknown tenant "%s"' % options['tenant'])
+        since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=options['days'])
+
+        if options['worst']:
+            self.stdout.write('term_id,dialogs,dialog_fails,oos,failure_rate')
+            for row in worstTerminals(tenant, since, options['worst']):
+                self.stdout.write('%s,%d,%d,%d,%.3f' % (row['terminal__term_id'], row['dialogs'], row['dialog_fails'], row['oos'], row['failure_rate']))
+            return
+
+        self.stdout.write(','.join(('bucket', 'samples') + PERF_STATS))
+        for rollup in tenantSeries(tenant, 'hour' if options['hourly'] else 'day', since):
+            self.stdout.write(','.join([rollup.bucket.isoformat(), str(rollup.samples)] + [str(getattr(rollup, stat)) for stat in PERF_STATS]))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from millennium.panel.models import terminal
+from millennium.panel.cashbox import forecastCashboxes
+from django.contrib.auth.models import Group
+import datetime
+
+class Command(BaseCommand):
+    help = 'Forecast when each terminal\'s cashbox reaches its volume threshold (CSV on stdout)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tenant', help='Only terminals of this tenant (group)')
+        parser.add_argument('--within', type=float, help='Only terminals due within this many days')
+        parser.add_argument('--window', type=float, default=28, help='Days of coin traffic the fill rate is measured over')
+
+    def handle(self, *args, **options):
+        terminals = terminal.objects.all()
+        if options['tenant']:
+            tenant = Group.objects.filter(name=options['tenant']).first()
+            if tenant is None:
+                raise CommandError('Unknown tenant "%s"' % options['tenant'])
+            terminals = terminals.filter(tenant=tenant)
+
+        forecasts = forecastCashboxes(terminals, window=datetime.timedelta(days=options['window']))
+        horizon = None
+        if options['within'] is not None:
+            horizon = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=options['within'])
+
+        self.stdout.write('term_id,volume,threshold,volume_per_day,full_at')
+        for forecast in forecasts:
+            if horizon is not None and (forecast.full_at is None or forecast.full_at > horizon):
+                continue
+            self.stdout.write('%s,%d,%s,%.1f,%s' % (
+                forecast.term_id,
+                forecast.volume,
+                forecast.threshold if forecast.threshold is not None else '',
+                forecast.rate,
+                forecast.full_at.isoformat() if forecast.full_at else '',
+            ))
@@ -0,0 +1,32 @@
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+from millennium.panel.tenantdump import importTenant
+import gzip
+
+class Command(BaseCommand):
+    help = 'Import a tenant dump written by exporttenant into a tenant, in a single transaction'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenant', help='Tenant (group) name')
+        parser.add_argument('dumpfile', help='Dump file, gzip-compressed if it ends in .gz')
+        parser.add_argument('--create', action='store_true', help='Create the tenant if it does not exist')
+
+    def handle(self, *args, **options):
+        if options['create']:
+            tenant, created = Group.objects.get_or_create(name=options['tenant'])
+        else:
+            tenant = Group.objects.filter(name=options['tenant']).first()
+            if tenant is None:
+                raise CommandError('Unknown tenant "%s"' % options['tenant'])
+
+        opener = gzip.open if options['dumpfile'].endswith('.gz') else open
+
+        try:
+            with opener(options['dumpfile'], 'rt', encoding='utf-8') as f:
+                counts = importTenant(f, tenant)
+        except (ValueError, IntegrityError) as e:
+            raise CommandError('Import failed, nothing was imported: %s' % e)
+
+        for model, count in counts.items():
+            self.stdout.write('%s: %d' % (model, count))
@@ -0,0 +1,28 @@
+from django.contrib.auth.models import Group
+from django.core.management.base import BaseCommand, CommandError
+from millennium.panel.provisioning import importTerminals, BATCH_SIZE
+import csv
+
+class Command(BaseCommand):
+    help = 'Provision terminals from a CSV file with a term_id column and one column per configuration table, holding its name'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenant', help='Tenant (group) name or id')
+        parser.add_argument('csvfile')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Validate only, do not insert')
+
+    def handle(self, *args, **options):
+        tenant = Group.objects.filter(name=options['tenant']).first()
+        if tenant is None and options['tenant'].isdigit():
+            tenant = Group.objects.filter(id=options['tenant']).first()
+        if tenant is None:
+            raise CommandError('Unknown tenant "%s"' % options['tenant'])
+
+        with open(options['csvfile'], newline='', encoding='utf-8-sig') as f:
+            created, errors = importTerminals(csv.DictReader(f), tenant, options['batch_size'], options['dry_run'])
+
+        for line, message in errors:
+            self.stderr.write('line %d: %s' % (line, message))
+
+        self.stdout.write('%s %d terminals, %d rows rejected' % ('Validated' if options['dry_run'] else 'Created', created, len(errors)))
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from millennium.panel.models import terminal
+from millennium.panel.cdr import CDRDecoder, CDRWriter, BATCH_SIZE
+import sys
+import time
+
+class Command(BaseCommand):
+    help = 'Ingest a raw call detail record upload (concatenated CDR frames) for a terminal'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenant', help='Tenant (group) name')
+        parser.add_argument('term_id', help='Terminal ID')
+        parser.add_argument('file', nargs='?', help='Raw upload (default: stdin)')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument('--chunk-size', type=int, default=65536)
+
+    def handle(self, *args, **options):
+        terminalId = terminal.objects.filter(tenant__name=options['tenant'], term_id=options['term_id']).values_list('id', flat=True).first()
+        if terminalId is None:
+            raise CommandError('Unknown terminal "%s" for tenant "%s"' % (options['term_id'], options['tenant']))
+
+        decoder = CDRDecoder(terminalId)
+        writer = CDRWriter(options['batch_size'])
+        source = open(options['file'], 'rb') if options['file'] else sys.stdin.buffer
+        started = time.monotonic()
+
+        try:
+            for chunk in iter(lambda: source.read(options['chunk_size']), b''):
+                writer.ingest(decoder, chunk)
+            writer.flush()
+        finally:
+            if source is not sys.stdin.buffer:
+                source.close()
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.stdout.write('%d records, %d skipped bytes or records, %.0f records/s' % (decoder.records, decoder.errors, decoder.records / elapsed))
+        records, size, recordRate, byteRate = writer.stats.throughput(terminalId)
+        self.stdout.write('Decoded %d bytes at %.0f records/s, %.0f bytes/s' % (size, recordRate, byteRate))
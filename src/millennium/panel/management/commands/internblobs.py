@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from millennium.panel.contentstore import DEDUPLICATED, internTables, pruneBlobs
+
+class Command(BaseCommand):
+    help = 'Hash all shareable configuration tables into the content-addressed blob store'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prune', action='store_true', help='Delete blobs no table refers to anymore')
+
+    def handle(self, *args, **options):
+        for model in DEDUPLICATED:
+            internTables(model.objects.all())
+            distinct = model.objects.exclude(blob=None).values('blob').distinct().count()
+            self.stdout.write('%s: %d tables, %d distinct' % (model.__name__, model.objects.count(), distinct))
+
+        if options['prune']:
+            self.stdout.write('Pruned %d blobs' % pruneBlobs())
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import Group
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from millennium.panel.models import PendingDownload
+from millennium.panel.campaigns import createCampaign
+from millennium.panel.metrics import addMetricsArguments, servingMetrics
+
+class Command(BaseCommand):
+    help = 'Plan a download campaign for the terminals with pending downloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('name', help='Campaign name')
+        parser.add_argument('--tenant', help='Only terminals of this tenant (group)')
+        parser.add_argument('--start', help='Start time, ISO 8601 (default: now)')
+        parser.add_argument('--lines', type=int, help='Modem lines (default: settings.NCC_LINES)')
+        parser.add_argument('--quota', type=int, help='Maximum lines a single tenant may use at once')
+        parser.add_argument('--bps', type=int, help='Line speed (default: settings.NCC_LINE_BPS)')
+        addMetricsArguments(parser)
+
+    def handle(self, *args, **options):
+        if options['lines'] is not None and options['lines'] < 1:
+            raise CommandError('--lines must be at least 1')
+        if options['quota'] is not None and options['quota'] < 1:
+            raise CommandError('--quota must be at least 1')
+
+        downloads = PendingDownload.objects.all()
+        tenant = None
+        if options['tenant']:
+            tenant = Group.objects.filter(name=options['tenant']).first()
+            if tenant is None:
+                raise CommandError('Unknown tenant "%s"' % options['tenant'])
+            downloads = downloads.filter(terminal__tenant=tenant)
+
+        start = None
+        if options['start']:
+            start = parse_datetime(options['start'])
+            if start is None:
+                raise CommandError('Invalid start time "%s"' % options['start'])
+            if timezone.is_naive(start):
+                start = timezone.make_aware(start)
+
+        with servingMetrics(options):
+            campaign = createCampaign(options['name'], downloads, tenant, start, options['lines'], options['quota'], options['bps'])
+        self.stdout.write('%d sessions on %d lines, %s to %s' % (campaign.slots.count(), campaign.lines, campaign.start, campaign.end))
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import Group
+from millennium.panel.models import terminal
+from millennium.panel.capture import captureSessions, replaySession, sentPayloads
+from millennium.panel.lines import loadDownload
+import time
+
+class Command(BaseCommand):
+    help = 'Replay the sessions of a line capture through the dialog as fast as possible'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Capture file')
+        parser.add_argument('--tenant', help='Look terminals up in this tenant (group) only')
+        parser.add_argument('--repeat', type=int, default=1, help='Replay the capture this many times')
+
+    def handle(self, *args, **options):
+        terminals = terminal.objects.all()
+        if options['tenant']:
+            tenant = Group.objects.filter(name=options['tenant']).first()
+            if tenant is None:
+                raise CommandError('Unknown tenant "%s"' % options['tenant'])
+            terminals = terminals.filter(tenant=tenant)
+
+        try:
+            sessions = captureSessions(options['path'])
+        except (OSError, ValueError) as e:
+            raise CommandError(e)
+
+        lookup = lambda termId: loadDownload(terminals, termId)
+        inbound = sum(len(chunk) for session in sessions.values() for chunk in session['in'])
+        outbound = 0
+        different = 0
+
+        start = time.perf_counter()
+        for i in range(options['repeat']):
+            for number, session in sessions.items():
+                sent = replaySession(session['in'], lookup)
+                outbound += sum(len(payload) for payload in sent)
+                if i == 0 and b''.join(sent) != b''.join(sentPayloads(session['out'])):
+                    different += 1
+        elapsed = time.perf_counter() - start
+
+        count = len(sessions) * options['repeat']
+        self.stdout.write('%d sessions in %.3f s: %.1f sessions/s, %.0f bytes in/s, %.0f bytes out/s' % (
+            count,
+            elapsed,
+            count / elapsed if elapsed else 0,
+            inbound * options['repeat'] / elapsed if elapsed else 0,
+            outbound / elapsed if elapsed else 0,
+        ))
+        if different:
+            self.stdout.write('%d sessions sent different bytes than captured' % different)
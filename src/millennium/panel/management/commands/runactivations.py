@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from millennium.panel.metrics import addMetricsArguments, servingMetrics
+from millennium.panel.scheduler import runActivations, STAGE_AHEAD
+import datetime
+
+class Command(BaseCommand):
+    help = 'Stage and activate scheduled table activations; run it from cron every minute'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--stage-ahead', type=float, default=STAGE_AHEAD.total_seconds() / 3600, help='Hours before their effective date activations are staged')
+        addMetricsArguments(parser)
+
+    def handle(self, *args, **options):
+        with servingMetrics(options):
+            staged, activated = runActivations(stageAhead=datetime.timedelta(hours=options['stage_ahead']))
+        if options['verbosity'] > 1 or staged or activated:
+            self.stdout.write('%d staged, %d activated' % (staged, activated))
@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import Group
+from millennium.panel.models import terminal
+from millennium.panel.lines import LineManager
+from millennium.panel.capture import CaptureWriter
+from millennium.panel.events import EventCoalescer, COALESCE_WINDOW
+from millennium.panel.cdr import CDRWriter
+from millennium.panel.metrics import addMetricsArguments, servingMetrics
+import asyncio
+import signal
+
+class Command(BaseCommand):
+    help = 'Serve terminal call-ins on a bank of modem lines from one process'
+
+    def add_arguments(self, parser):
+        parser.add_argument('devices', nargs='*', help='Serial devices of the modem lines')
+        parser.add_argument('--tenant', help='Only serve terminals of this tenant (group)')
+        parser.add_argument('--bps', type=int, help='Line speed (default: settings.NCC_LINE_BPS)')
+        parser.add_argument('--ptys', type=int, default=0, help='Also open this many ptys, for simulated phones')
+        parser.add_argument('--capture', help='Append every session to this capture file')
+        parser.add_argument('--stats', type=float, default=60, help='Seconds between line statistics')
+        parser.add_argument('--event-window', type=float, default=COALESCE_WINDOW, help='Seconds alarms and status events are coalesced for')
+        addMetricsArguments(parser)
+
+    def handle(self, *args, **options):
+        terminals = terminal.objects.all()
+        if options['tenant']:
+            tenant = Group.objects.filter(name=options['tenant']).first()
+            if tenant is None:
+                raise CommandError('Unknown tenant "%s"' % options['tenant'])
+            terminals = terminals.filter(tenant=tenant)
+
+        if not options['devices'] and not options['ptys']:
+            raise CommandError('No lines to serve')
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        capture = CaptureWriter(options['capture']) if options['capture'] else None
+        events = EventCoalescer(options['event_window'], autoFlush=False)
+        cdrs = CDRWriter()
+        manager = LineManager(terminals, bps=options['bps'], loop=loop, capture=capture, events=events, cdrs=cdrs)
+
+        for path in options['devices']:
+            try:
+                manager.addDevice(path)
+            except OSError as e:
+                raise CommandError('Cannot open %s: %s' % (path, e))
+        for i in range(options['ptys']):
+            line, path = manager.addPty()
+            self.stdout.write('pty %s' % path)
+
+        def report():
+            self.stdout.write(str(manager.stats()))
+            loop.call_later(options['stats'], report)
+
+        loop.add_signal_handler(signal.SIGINT, loop.stop)
+        loop.add_signal_handler(signal.SIGTERM, loop.stop)
+        loop.call_later(options['stats'], report)
+        self.stdout.write('Serving %d lines' % len(manager.lines))
+        try:
+            with servingMetrics(options):
+                loop.run_forever()
+        finally:
+            manager.close()
+            loop.close()
+            events.flush()
+            cdrs.flush()
+            if capture is not None:
+                capture.close()
+            self.stdout.write(str(manager.stats()))
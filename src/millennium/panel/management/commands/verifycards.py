@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+from millennium.panel.models import CardTable
+from millennium.panel.cardvalidation import validatorFor, validateCardTable
+import datetime
+import sys
+
+class Command(BaseCommand):
+    help = 'Check a card table for problems and verify card numbers or track 2 data (one per line) against it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenant', help='Tenant (group) name')
+        parser.add_argument('cardtable', help='Card table name')
+        parser.add_argument('cards', nargs='?', help='File with one card number or track 2 string per line (default: stdin)')
+        parser.add_argument('--date', help='Reference date for expiry checks, YYYY-MM-DD (default: today)')
+        parser.add_argument('--table-only', action='store_true', help='Only check the card table itself')
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        cardTable = CardTable.objects.filter(tenant__name=options['tenant'], name=options['cardtable']).first()
+        if cardTable is None:
+            raise CommandError('Unknown card table "%s" for tenant "%s"' % (options['cardtable'], options['tenant']))
+
+        for problem in validateCardTable(cardTable):
+            self.stderr.write('table: %s' % problem)
+
+        if options['table_only']:
+            return
+
+        today = datetime.datetime.strptime(options['date'], '%Y-%m-%d').date() if options['date'] else None
+        validator = validatorFor(cardTable, today)
+        source = open(options['cards']) if options['cards'] else sys.stdin
+        total = rejected = 0
+
+        try:
+            batch = []
+            for line in source:
+                batch.append(line.strip())
+                if len(batch) >= options['batch_size']:
+                    rejected += self.verify(validator, batch)
+                    total += len(batch)
+                    batch = []
+            rejected += self.verify(validator, batch)
+            total += len(batch)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+
+        self.stdout.write('%d checked, %d rejected' % (total, rejected))
+
+    def verify(self, validator, batch):
+        rejected = 0
+        for data, (card, errors) in zip(batch, validator.validateMany(batch)):
+            if errors:
+                rejected += 1
+                self.stdout.write('%s: %s' % (data, ', '.join(errors)))
+        return rejected
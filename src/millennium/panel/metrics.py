@@ -0,0 +1,345 @@
+from django.conf import settings
+from django.core.management.base import CommandError
+from django.db import connection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import bisect
+import contextlib
+import functools
+import inspect
+import linecache
+import re
+import sys
+import threading
+import time
+
+# Upper bounds of the build time histogram, in seconds
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+FIELD_PATTERN = re.compile(r'self\.(\w+)')
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+class QueryCounter(object):
+    # connection.execute_wrapper() callable counting the queries it sees
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+class FrameMetrics(object):
+    # Frame build statistics since the process started: per (table, tenant,
+    # cache outcome) the number of frames, build time, encoded bytes and ORM
+    # queries; per table a build time histogram; per builder the calls,
+    # time and queries; in field timing mode, the time each field of an
+    # encoder takes; and per terminal the call records and bytes ingested
+    # from its uploads, whose rates are its ingest throughput.
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.frames = {}
+            self.histograms = {}
+            self.builders = {}
+            self.fields = {}
+            self.ingest = {}
+
+    def addFrame(self, table, tenant, cache, seconds, size, queries):
+        with self.lock:
+            entry = self.frames.get((table, tenant, cache))
+            if entry is None:
+                entry = self.frames[table, tenant, cache] = [0, 0.0, 0, 0]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += size
+            entry[3] += queries
+
+            histogram = self.histograms.get(table)
+            if histogram is None:
+                histogram = self.histograms[table] = [0] * (len(BUCKETS) + 1)
+            histogram[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+    def addBuilder(self, name, seconds, queries):
+        with self.lock:
+            entry = self.builders.get(name)
+            if entry is None:
+                entry = self.builders[name] = [0, 0.0, 0]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += queries
+
+    def addIngest(self, terminal, records, size):
+        with self.lock:
+            entry = self.ingest.get(terminal)
+            if entry is None:
+                entry = self.ingest[terminal] = [0, 0]
+            entry[0] += records
+            entry[1] += size
+
+    def addFields(self, table, timings):
+        with self.lock:
+            for field, seconds in timings.items():
+                entry = self.fields.get((table, field))
+                if entry is None:
+                    entry = self.fields[table, field] = [0, 0.0]
+                entry[0] += 1
+                entry[1] += seconds
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'frames': {key: tuple(value) for key, value in self.frames.items()},
+                'histograms': {key: tuple(value) for key, value in self.histograms.items()},
+                'builders': {key: tuple(value) for key, value in self.builders.items()},
+                'fields': {key: tuple(value) for key, value in self.fields.items()},
+                'ingest': {key: tuple(value) for key, value in self.ingest.items()},
+            }
+
+metrics = FrameMetrics()
+
+def enabled():
+    return getattr(settings, 'PANEL_FRAME_METRICS', True)
+
+def fieldTiming():
+    return getattr(settings, 'PANEL_FIELD_TIMING', False)
+
+class FrameMeasurement(object):
+    # What measureFrame() yields; the caller fills in the outcome
+
+    def __init__(self):
+        self.cache = 'none'
+        self.size = 0
+
+class measureFrame(object):
+    # Context manager around getting one table's frame. Counts the ORM
+    # queries run on this thread while it is open.
+
+    def __init__(self, table):
+        self.table = table
+        self.measurement = FrameMeasurement()
+
+    def __enter__(self):
+        self.active = enabled()
+        if self.active:
+            self.counter = QueryCounter()
+            self.wrapper = connection.execute_wrapper(self.counter)
+            self.wrapper.__enter__()
+            self.start = time.perf_counter()
+        return self.measurement
+
+    def __exit__(self, excType, exc, traceback):
+        if self.active:
+            seconds = time.perf_counter() - self.start
+            self.wrapper.__exit__(excType, exc, traceback)
+            if excType is None:
+                metrics.addFrame(
+                    type(self.table).__name__,
+                    str(getattr(self.table, 'tenant_id', '')),
+                    self.measurement.cache,
+                    seconds,
+                    self.measurement.size,
+                    self.counter.count,
+                )
+        return False
+
+def measureBuilder(name):
+    # Decorator recording the calls, time and queries of a bulk frame
+    # builder. For generators, only the time spent producing items counts,
+    # not the time the consumer spends between them.
+    def decorate(function):
+        if inspect.isgeneratorfunction(function):
+            @functools.wraps(function)
+            def generator(*args, **kwargs):
+                if not enabled():
+                    yield from function(*args, **kwargs)
+                    return
+
+                counter = QueryCounter()
+                seconds = 0.0
+                iterator = function(*args, **kwargs)
+                try:
+                    while True:
+                        start = time.perf_counter()
+                        with connection.execute_wrapper(counter):
+                            try:
+                                item = next(iterator)
+                            except StopIteration:
+                                return
+                            finally:
+                                seconds += time.perf_counter() - start
+                        yield item
+                finally:
+                    iterator.close()
+                    metrics.addBuilder(name, seconds, counter.count)
+            return generator
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled():
+                return function(*args, **kwargs)
+            counter = QueryCounter()
+            start = time.perf_counter()
+            try:
+                with connection.execute_wrapper(counter):
+                    return function(*args, **kwargs)
+            finally:
+                metrics.addBuilder(name, time.perf_counter() - start, counter.count)
+        return wrapper
+    return decorate
+
+def fieldName(filename, lineno):
+    match = FIELD_PATTERN.search(linecache.getline(filename, lineno))
+    return match.group(1) if match else 'line %d' % lineno
+
+def encode(table, *args):
+    # table.getFrame(*args) as bytes. In field timing mode the encoder runs
+    # under a line tracer that charges the time between two lines of
+    # getFrame to the field the first one encodes. That slows encoding down
+    # many times over, so it is for profiling sessions only.
+    if not (enabled() and fieldTiming()):
+        return bytes(table.getFrame(*args))
+
+    code = type(table).getFrame.__code__
+    timings = {}
+    last = [None, 0.0]
+
+    def charge(now):
+        if last[0] is not None:
+            field = fieldName(code.co_filename, last[0])
+            timings[field] = timings.get(field, 0.0) + now - last[1]
+
+    def local(frame, event, arg):
+        if event in ('line', 'return'):
+            now = time.perf_counter()
+            charge(now)
+            last[0] = frame.f_lineno if event == 'line' else None
+            last[1] = time.perf_counter()
+        return local
+
+    def dispatch(frame, event, arg):
+        if event == 'call' and frame.f_code is code:
+            return local
+        return None
+
+    previous = sys.gettrace()
+    sys.settrace(dispatch)
+    try:
+        frame = bytes(table.getFrame(*args))
+    finally:
+        sys.settrace(previous)
+
+    metrics.addFields(type(table).__name__, timings)
+    return frame
+
+def labels(**values):
+    return '{%s}' % ','.join('%s="%s"' % (key, str(value).replace('\\', '\\\\').replace('"', '\\"')) for key, value in values.items())
+
+def prometheusText(snapshot=None):
+    # The snapshot in the Prometheus text exposition format
+    snapshot = snapshot or metrics.snapshot()
+    lines = []
+
+    def family(name, kind, help, samples):
+        lines.append('# HELP %s %s' % (name, help))
+        lines.append('# TYPE %s %s' % (name, kind))
+        for suffix, labelValues, value in samples:
+            lines.append('%s%s%s %s' % (name, suffix, labelValues, repr(value) if isinstance(value, float) else value))
+
+    frames = sorted(snapshot['frames'].items())
+    for index, (name, help) in enumerate((
+        ('millennium_frames_total', 'Frames requested, by table, tenant and cache outcome'),
+        ('millennium_frame_build_seconds_total', 'Time spent getting frames'),
+        ('millennium_frame_bytes_total', 'Encoded frame bytes'),
+        ('millennium_frame_queries_total', 'ORM queries run while getting frames'),
+    )):
+        family(name, 'counter', help, [
+            ('', labels(table=table, tenant=tenant, cache=cache), values[index])
+            for (table, tenant, cache), values in frames
+        ])
+
+    samples = []
+    for table, counts in sorted(snapshot['histograms'].items()):
+        total = 0
+        for bound, count in zip(BUCKETS + ('+Inf',), counts):
+            total += count
+            samples.append(('_bucket', labels(table=table, le=bound), total))
+        samples.append(('_count', labels(table=table), total))
+        samples.append(('_sum', labels(table=table), sum(
+            values[1] for (frameTable, tenant, cache), values in frames if frameTable == table
+        )))
+    family('millennium_frame_build_seconds', 'histogram', 'Time to get one frame', samples)
+
+    builders = sorted(snapshot['builders'].items())
+    for index, (name, help) in enumerate((
+        ('millennium_builder_calls_total', 'Bulk frame builder calls'),
+        ('millennium_builder_seconds_total', 'Time spent in bulk frame builders'),
+        ('millennium_builder_queries_total', 'ORM queries run by bulk frame builders'),
+    )):
+        family(name, 'counter', help, [('', labels(builder=builder), values[index]) for builder, values in builders])
+
+    if snapshot['fields']:
+        fields = sorted(snapshot['fields'].items())
+        family('millennium_frame_field_seconds_total', 'counter', 'Time spent encoding each field (field timing mode)', [
+            ('', labels(table=table, field=field), values[1]) for (table, field), values in fields
+        ])
+
+    ingest = sorted(snapshot['ingest'].items())
+    for index, (name, help) in enumerate((
+        ('millennium_cdr_records_total', 'Call records decoded from uploads, by terminal'),
+        ('millennium_cdr_bytes_total', 'Upload bytes fed to the call record decoder, by terminal'),
+    )):
+        family(name, 'counter', help, [('', labels(terminal=terminal), values[index]) for terminal, values in ingest])
+
+    return '\n'.join(lines) + '\n'
+
+class MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics', '/metrics/'):
+            self.send_error(404)
+            return
+        body = prometheusText().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes are not worth a line each
+        pass
+
+def serveMetrics(port, address='127.0.0.1'):
+    # The metrics are kept per process, so the web server's /metrics/ only
+    # has its own. Long running commands serve theirs with this, on a
+    # daemon thread; shutdown() and server_close() the returned server to
+    # stop it. Port 0 picks a free port, see server.server_address.
+    server = ThreadingHTTPServer((address, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics', daemon=True).start()
+    return server
+
+def addMetricsArguments(parser):
+    parser.add_argument('--metrics-port', type=int, help='Serve the frame metrics of this process on this port while it runs')
+    parser.add_argument('--metrics-address', default='127.0.0.1', help='Address the metrics are served on (default: %(default)s)')
+
+@contextlib.contextmanager
+def servingMetrics(options):
+    # For commands with addMetricsArguments()
+    if options['metrics_port'] is None:
+        yield None
+        return
+    try:
+        server = serveMetrics(options['metrics_port'], options['metrics_address'])
+    except OSError as e:
+        raise CommandError('Cannot serve metrics on port %d: %s' % (options['metrics_port'], e))
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,17 @@
+# Generated by Django 3.0.2 on 2026-10-19 18:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='terminal',
+            index=models.Index(fields=['tenant', 'term_id'], name='millenniump_tenant__fea99a_idx'),
+        ),
+    ]
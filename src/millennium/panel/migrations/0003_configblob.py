@@ -0,0 +1,49 @@
+# Generated by Django 3.0.2 on 2026-10-19 18:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0002_terminal_tenant_term_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConfigBlob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True, verbose_name='SHA-256 digest')),
+                ('kind', models.CharField(choices=[('table', 'Table payload'), ('frame', 'Encoded frame')], max_length=5, verbose_name='Kind')),
+                ('payload', models.BinaryField()),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('source', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.ConfigBlob', verbose_name='Encoded from')),
+            ],
+            options={
+                'verbose_name': 'Configuration blob',
+                'verbose_name_plural': 'Configuration blobs',
+            },
+        ),
+        migrations.AddField(
+            model_name='coinvaltable',
+            name='blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='millenniumpanel.ConfigBlob'),
+        ),
+        migrations.AddField(
+            model_name='fconfigopts',
+            name='blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='millenniumpanel.ConfigBlob'),
+        ),
+        migrations.AddField(
+            model_name='installparms',
+            name='blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='millenniumpanel.ConfigBlob'),
+        ),
+        migrations.AddField(
+            model_name='npanxxtable',
+            name='blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='millenniumpanel.ConfigBlob'),
+        ),
+    ]
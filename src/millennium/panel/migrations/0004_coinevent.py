@@ -0,0 +1,34 @@
+# Generated by Django 3.0.2 on 2026-10-19 18:56
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0003_configblob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoinEvent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField(verbose_name='Reported at')),
+                ('kind', models.CharField(choices=[('deposit', 'Coins deposited'), ('collection', 'Cashbox collected')], default='deposit', max_length=10, verbose_name='Event')),
+                ('coin', models.PositiveSmallIntegerField(blank=True, help_text="Index into the coin validator's coin definitions", null=True, validators=[django.core.validators.MaxValueValidator(15)], verbose_name='Coin')),
+                ('count', models.PositiveIntegerField(default=1, verbose_name='Number of coins')),
+                ('terminal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.terminal')),
+            ],
+            options={
+                'verbose_name': 'Coin event',
+                'verbose_name_plural': 'Coin events',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='coinevent',
+            index=models.Index(fields=['terminal', 'kind', 'timestamp'], name='millenniump_termina_fc5362_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 3.0.2 on 2026-10-19 18:59
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0004_coinevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MTRProfile',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('MTR', models.PositiveSmallIntegerField(choices=[(1, 'MTR 1.x'), (2, 'MTR 2.x')], default=2, verbose_name='MTR version')),
+                ('default', models.BooleanField(default=False, help_text='Used for terminals without a profile', verbose_name='Default profile')),
+                ('ncc_term_size', models.PositiveSmallIntegerField(help_text='NCC_TERM_SIZE (bytes)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Terminal ID length')),
+                ('na_ldist_tel_num_len', models.PositiveSmallIntegerField(help_text='NA_LDIST_TEL_NUM_LEN (bytes)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Telephone number length')),
+                ('access_code_size', models.PositiveSmallIntegerField(help_text='ACCESS_CODE_SIZE (bytes)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Access code length')),
+                ('key_card_len', models.PositiveSmallIntegerField(help_text='KEY_CARD_LEN (bytes)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Key card number length')),
+                ('predial_string_len', models.PositiveSmallIntegerField(help_text='PREDIAL_STRING_LEN (bytes)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Predial string length')),
+                ('amp_string_len', models.PositiveSmallIntegerField(help_text='AMP_STRING_LEN (bytes, MTR 2.x only)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Analog mode prefix length')),
+                ('dlog_sp_install_parms', models.PositiveSmallIntegerField(help_text='DLOG_SP_INSTALL_PARMS (bytes)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Install parameters spare')),
+                ('dlog_sp_coin_val_table', models.PositiveSmallIntegerField(help_text='DLOG_SP_COIN_VAL_TABLE (bytes)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Coin validation table spare')),
+                ('number_coin_types', models.PositiveSmallIntegerField(help_text='NUMBER_COIN_TYPES', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Coin types')),
+                ('dlog_num_card_types', models.PositiveSmallIntegerField(help_text='DLOG_NUM_CARD_TYPES (0 to use the card table maximum)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Card types')),
+                ('max_card_table_entries', models.PositiveSmallIntegerField(help_text='MAX_CARD_TABLE_ENTRIES', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Card table entries')),
+                ('spill_str_size', models.PositiveSmallIntegerField(help_text='SPILL_STR_SIZE (bytes, MTR 2.x only)', validators=[django.core.validators.MaxValueValidator(255)], verbose_name='Spill string length')),
+            ],
+            options={
+                'verbose_name': 'MTR profile',
+                'verbose_name_plural': 'MTR profiles',
+            },
+        ),
+        migrations.AddField(
+            model_name='terminal',
+            name='MTRProfile',
+            field=models.ForeignKey(blank=True, help_text='Firmware the phone runs; empty for the default profile', null=True, on_delete=django.db.models.deletion.SET_NULL, to='millenniumpanel.MTRProfile', verbose_name='MTR profile'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 3.0.2 on 2026-10-19 18:59
+
+from django.db import migrations
+
+# Sizes of the variable-length fields per firmware generation. Adjust them
+# in the admin if your phones differ.
+PROFILES = (
+    dict(
+        name='MTR 1.x',
+        MTR=1,
+        default=False,
+        ncc_term_size=5,
+        na_ldist_tel_num_len=8,
+        access_code_size=3,
+        key_card_len=5,
+        predial_string_len=2,
+        amp_string_len=0,
+        dlog_sp_install_parms=3,
+        dlog_sp_coin_val_table=10,
+        number_coin_types=16,
+        dlog_num_card_types=10,
+        max_card_table_entries=10,
+        spill_str_size=0,
+    ),
+    dict(
+        name='MTR 2.x',
+        MTR=2,
+        default=True,
+        ncc_term_size=5,
+        na_ldist_tel_num_len=8,
+        access_code_size=3,
+        key_card_len=5,
+        predial_string_len=2,
+        amp_string_len=2,
+        dlog_sp_install_parms=1,
+        dlog_sp_coin_val_table=10,
+        number_coin_types=16,
+        dlog_num_card_types=0,
+        max_card_table_entries=32,
+        spill_str_size=5,
+    ),
+)
+
+def create_profiles(apps, schema_editor):
+    MTRProfile = apps.get_model('millenniumpanel', 'MTRProfile')
+    for profile in PROFILES:
+        MTRProfile.objects.get_or_create(name=profile['name'], defaults=profile)
+
+def delete_profiles(apps, schema_editor):
+    MTRProfile = apps.get_model('millenniumpanel', 'MTRProfile')
+    MTRProfile.objects.filter(name__in=[profile['name'] for profile in PROFILES]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0005_mtrprofile'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_profiles, delete_profiles),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+LAYERED = ('NCCTermParms', 'InstallParms', 'FconfigOpts', 'CoinValTable', 'CardTable', 'RateTable', 'NPANXXTable', 'MTRProfile')
+
+def materialise(apps, schema_editor):
+    # Existing terminals have no group: their own tables are effective
+    terminal = apps.get_model('millenniumpanel', 'terminal')
+    EffectiveConfig = apps.get_model('millenniumpanel', 'EffectiveConfig')
+    fields = ['id'] + [name + '_id' for name in LAYERED]
+    EffectiveConfig.objects.bulk_create([
+        EffectiveConfig(terminal_id=row[0], **{name + '_id': value for name, value in zip(LAYERED, row[1:])})
+        for row in terminal.objects.values_list(*fields).iterator()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0011_update_proxy_permissions'),
+        ('millenniumpanel', '0006_default_mtr_profiles'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='terminal',
+            name='CardTable',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.CardTable', verbose_name='Card Table'),
+        ),
+        migrations.AlterField(
+            model_name='terminal',
+            name='CoinValTable',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.CoinValTable', verbose_name='Coin Validator parameters'),
+        ),
+        migrations.AlterField(
+            model_name='terminal',
+            name='FconfigOpts',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.FconfigOpts', verbose_name='Feature Config & Call Options'),
+        ),
+        migrations.AlterField(
+            model_name='terminal',
+            name='InstallParms',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.InstallParms', verbose_name='Installation/Service parameters'),
+        ),
+        migrations.AlterField(
+            model_name='terminal',
+            name='NCCTermParms',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.NCCTermParms', verbose_name='NCC/terminal access parameters'),
+        ),
+        migrations.AlterField(
+            model_name='terminal',
+            name='NPANXXTable',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.NPANXXTable', verbose_name='NPA/NXX LCD Table'),
+        ),
+        migrations.AlterField(
+            model_name='terminal',
+            name='RateTable',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.RateTable', verbose_name='Rate Table'),
+        ),
+        migrations.CreateModel(
+            name='TerminalGroup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=32)),
+                ('CardTable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.CardTable', verbose_name='Card Table')),
+                ('CoinValTable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.CoinValTable', verbose_name='Coin Validator parameters')),
+                ('FconfigOpts', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.FconfigOpts', verbose_name='Feature Config & Call Options')),
+                ('InstallParms', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.InstallParms', verbose_name='Installation/Service parameters')),
+                ('MTRProfile', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.MTRProfile', verbose_name='MTR profile')),
+                ('NCCTermParms', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.NCCTermParms', verbose_name='NCC/terminal access parameters')),
+                ('NPANXXTable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.NPANXXTable', verbose_name='NPA/NXX LCD Table')),
+                ('RateTable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.RateTable', verbose_name='Rate Table')),
+                ('parent', models.ForeignKey(blank=True, help_text='Empty for a top level group, e.g. the tenant default', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='children', to='millenniumpanel.TerminalGroup', verbose_name='Parent group')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='auth.Group')),
+            ],
+            options={
+                'verbose_name': 'Terminal group',
+                'verbose_name_plural': 'Terminal groups',
+                'unique_together': {('name', 'tenant')},
+            },
+        ),
+        migrations.CreateModel(
+            name='EffectiveConfig',
+            fields=[
+                ('terminal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='effective', serialize=False, to='millenniumpanel.terminal')),
+                ('CardTable', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.CardTable')),
+                ('CoinValTable', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.CoinValTable')),
+                ('FconfigOpts', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.FconfigOpts')),
+                ('InstallParms', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.InstallParms')),
+                ('MTRProfile', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='millenniumpanel.MTRProfile')),
+                ('NCCTermParms', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.NCCTermParms')),
+                ('NPANXXTable', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.NPANXXTable')),
+                ('RateTable', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.RateTable')),
+            ],
+            options={
+                'verbose_name': 'Effective configuration',
+                'verbose_name_plural': 'Effective configurations',
+            },
+        ),
+        migrations.AddField(
+            model_name='terminal',
+            name='group',
+            field=models.ForeignKey(blank=True, help_text='Tables left empty below are taken from the group', null=True, on_delete=django.db.models.deletion.PROTECT, to='millenniumpanel.TerminalGroup', verbose_name='Terminal group'),
+        ),
+        migrations.RunPython(materialise, migrations.RunPython.noop),
+    ]
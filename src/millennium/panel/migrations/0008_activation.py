@@ -0,0 +1,59 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0011_update_proxy_permissions'),
+        ('millenniumpanel', '0007_terminalgroup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Activation',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('effective_date', models.DateTimeField(blank=True, help_text='Defaults to the effective date of the rate table', null=True, verbose_name='Effective Date')),
+                ('state', models.CharField(choices=[('scheduled', 'Scheduled'), ('staged', 'Frames staged'), ('active', 'Active'), ('failed', 'Failed')], default='scheduled', editable=False, max_length=10)),
+                ('error', models.TextField(blank=True, editable=False)),
+                ('staged_at', models.DateTimeField(editable=False, null=True)),
+                ('activated_at', models.DateTimeField(editable=False, null=True)),
+                ('CardTable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.CardTable', verbose_name='Card Table')),
+                ('CoinValTable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.CoinValTable', verbose_name='Coin Validator parameters')),
+                ('FconfigOpts', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.FconfigOpts', verbose_name='Feature Config & Call Options')),
+                ('InstallParms', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.InstallParms', verbose_name='Installation/Service parameters')),
+                ('NCCTermParms', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.NCCTermParms', verbose_name='NCC/terminal access parameters')),
+                ('NPANXXTable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.NPANXXTable', verbose_name='NPA/NXX LCD Table')),
+                ('RateTable', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='millenniumpanel.RateTable', verbose_name='Rate Table')),
+                ('group', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.TerminalGroup', verbose_name='Terminal group')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='auth.Group')),
+                ('terminal', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.terminal', verbose_name='Terminal configuration')),
+            ],
+            options={
+                'verbose_name': 'Scheduled activation',
+                'verbose_name_plural': 'Scheduled activations',
+            },
+        ),
+        migrations.CreateModel(
+            name='PendingDownload',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('table', models.CharField(choices=[('NCCTermParms', 'NCCTermParms'), ('InstallParms', 'InstallParms'), ('FconfigOpts', 'FconfigOpts'), ('CoinValTable', 'CoinValTable'), ('CardTable', 'CardTable'), ('RateTable', 'RateTable'), ('NPANXXTable', 'NPANXXTable')], max_length=32)),
+                ('queued', models.DateTimeField(auto_now_add=True)),
+                ('activation', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='millenniumpanel.Activation')),
+                ('terminal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.terminal')),
+            ],
+            options={
+                'verbose_name': 'Pending download',
+                'verbose_name_plural': 'Pending downloads',
+                'unique_together': {('terminal', 'table')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='activation',
+            index=models.Index(fields=['state', 'effective_date'], name='millenniump_state_51509e_idx'),
+        ),
+    ]
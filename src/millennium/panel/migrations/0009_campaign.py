@@ -0,0 +1,54 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0011_update_proxy_permissions'),
+        ('millenniumpanel', '0008_activation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Campaign',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('start', models.DateTimeField(verbose_name='Start')),
+                ('end', models.DateTimeField(null=True, verbose_name='Planned end')),
+                ('lines', models.PositiveSmallIntegerField(verbose_name='Modem lines')),
+                ('tenant_quota', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='Lines per tenant')),
+                ('tenant', models.ForeignKey(blank=True, help_text='Empty for a fleet-wide campaign', null=True, on_delete=django.db.models.deletion.CASCADE, to='auth.Group')),
+            ],
+            options={
+                'verbose_name': 'Campaign',
+                'verbose_name_plural': 'Campaigns',
+            },
+        ),
+        migrations.CreateModel(
+            name='CampaignSlot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('line', models.PositiveSmallIntegerField()),
+                ('start', models.DateTimeField()),
+                ('end', models.DateTimeField()),
+                ('priority', models.PositiveSmallIntegerField()),
+                ('tables', models.CharField(help_text='Tables to download, comma separated', max_length=128)),
+                ('done', models.BooleanField(default=False)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='slots', to='millenniumpanel.Campaign')),
+                ('terminal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.terminal')),
+            ],
+            options={
+                'verbose_name': 'Campaign slot',
+                'verbose_name_plural': 'Campaign slots',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='campaignslot',
+            index=models.Index(fields=['campaign', 'start'], name='millenniump_campaig_e3ba30_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0009_campaign'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CallRecord',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.PositiveIntegerField(verbose_name='Period (YYYYMM)')),
+                ('seq', models.PositiveIntegerField(verbose_name='Sequence number')),
+                ('started', models.DateTimeField(verbose_name='Call start')),
+                ('duration', models.PositiveIntegerField(verbose_name='Duration (seconds)')),
+                ('call_type', models.PositiveSmallIntegerField(verbose_name='Call type')),
+                ('called_number', models.CharField(blank=True, max_length=20, verbose_name='Called number')),
+                ('carrier_ref', models.PositiveSmallIntegerField(verbose_name='Carrier reference')),
+                ('rate', models.PositiveIntegerField(verbose_name='Rate')),
+                ('cost', models.BigIntegerField(verbose_name='Charged amount')),
+                ('card_ref_num', models.PositiveSmallIntegerField(verbose_name='Card reference')),
+                ('received', models.DateTimeField(auto_now_add=True)),
+                ('terminal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.terminal')),
+            ],
+            options={
+                'verbose_name': 'Call record',
+                'verbose_name_plural': 'Call records',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='callrecord',
+            index=models.Index(fields=['period', 'started'], name='millenniump_period_98a051_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='callrecord',
+            unique_together={('period', 'terminal', 'started', 'seq')},
+        ),
+    ]
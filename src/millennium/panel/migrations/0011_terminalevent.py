@@ -0,0 +1,50 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:09
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0010_callrecord'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TerminalStatus',
+            fields=[
+                ('terminal', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='status', serialize=False, to='millenniumpanel.terminal')),
+                ('last_seen', models.DateTimeField(verbose_name='Last event')),
+                ('last_alarm', models.PositiveSmallIntegerField(null=True, verbose_name='Last alarm')),
+                ('last_alarm_at', models.DateTimeField(null=True, verbose_name='Last alarm at')),
+                ('last_status', models.PositiveSmallIntegerField(null=True, verbose_name='Last status')),
+                ('alarms', models.PositiveIntegerField(default=0, verbose_name='Alarms received')),
+                ('events', models.PositiveIntegerField(default=0, verbose_name='Events received')),
+            ],
+            options={
+                'verbose_name': 'Terminal status',
+                'verbose_name_plural': 'Terminal status',
+            },
+        ),
+        migrations.CreateModel(
+            name='TerminalEvent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('alarm', 'Alarm'), ('status', 'Status')], max_length=6)),
+                ('code', models.PositiveSmallIntegerField(verbose_name='Code')),
+                ('first_seen', models.DateTimeField()),
+                ('last_seen', models.DateTimeField()),
+                ('count', models.PositiveIntegerField(default=1)),
+                ('terminal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.terminal')),
+            ],
+            options={
+                'verbose_name': 'Terminal event',
+                'verbose_name_plural': 'Terminal events',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='terminalevent',
+            index=models.Index(fields=['terminal', 'first_seen'], name='millenniump_termina_1ed1d1_idx'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0011_update_proxy_permissions'),
+        ('millenniumpanel', '0011_terminalevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerfStatsRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resolution', models.CharField(choices=[('hour', 'Hourly'), ('day', 'Daily')], max_length=4)),
+                ('bucket', models.DateTimeField()),
+                ('samples', models.PositiveIntegerField(default=0)),
+                ('dialogs', models.BigIntegerField(default=0, verbose_name='NCC dialogs')),
+                ('dialog_fails', models.BigIntegerField(default=0, verbose_name='Failed NCC dialogs')),
+                ('alt_ncc_dialogs', models.BigIntegerField(default=0, verbose_name='Dialogs with the alternate NCC')),
+                ('co_line_check_fails', models.BigIntegerField(default=0, verbose_name='CO line check failures')),
+                ('oos', models.BigIntegerField(default=0, verbose_name='Out of service')),
+                ('calls', models.BigIntegerField(default=0, verbose_name='Calls')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='auth.Group')),
+                ('terminal', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.terminal')),
+            ],
+            options={
+                'verbose_name': 'Performance statistics rollup',
+                'verbose_name_plural': 'Performance statistics rollups',
+            },
+        ),
+        migrations.CreateModel(
+            name='PerfStatsBlock',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('samples', models.PositiveIntegerField(default=0)),
+                ('data', models.BinaryField(default=b'')),
+                ('terminal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='millenniumpanel.terminal')),
+            ],
+            options={
+                'verbose_name': 'Performance statistics block',
+                'verbose_name_plural': 'Performance statistics blocks',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='perfstatsrollup',
+            index=models.Index(fields=['tenant', 'resolution', 'bucket'], name='millenniump_tenant__1b93d6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='perfstatsrollup',
+            index=models.Index(fields=['terminal', 'resolution', 'bucket'], name='millenniump_termina_d4f80e_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='perfstatsblock',
+            unique_together={('terminal', 'day')},
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:36
+
+from django.db import migrations, models
+
+def single_default(apps, schema_editor):
+    # Of several default profiles, the first one stays the default, as it
+    # was the one getMTRConfig() used
+    MTRProfile = apps.get_model('millenniumpanel', 'MTRProfile')
+    first = MTRProfile.objects.filter(default=True).order_by('pk').first()
+    if first is not None:
+        MTRProfile.objects.filter(default=True).exclude(pk=first.pk).update(default=False)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0012_perfstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mtrprofile',
+            name='modified',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(single_default, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='mtrprofile',
+            constraint=models.UniqueConstraint(condition=models.Q(default=True), fields=('default',), name='single_default_mtrprofile'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0013_mtrprofile_modified'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='terminalstatus',
+            name='last_status_at',
+            field=models.DateTimeField(null=True, verbose_name='Last status at'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:52
+
+from django.db import migrations, models
+
+STATS = ('samples', 'dialogs', 'dialog_fails', 'alt_ncc_dialogs', 'co_line_check_fails', 'oos', 'calls')
+
+def merge_duplicates(apps, schema_editor):
+    # Rollups written twice for the same bucket by concurrent sessions are
+    # summed into the first of them
+    PerfStatsRollup = apps.get_model('millenniumpanel', 'PerfStatsRollup')
+    kept = {}
+    for rollup in PerfStatsRollup.objects.order_by('pk').iterator():
+        key = (rollup.tenant_id, rollup.terminal_id, rollup.resolution, rollup.bucket)
+        first = kept.get(key)
+        if first is None:
+            kept[key] = rollup
+            continue
+        for stat in STATS:
+            setattr(first, stat, getattr(first, stat) + getattr(rollup, stat))
+        first.save()
+        rollup.delete()
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0014_terminalstatus_last_status_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='perfstatsrollup',
+            constraint=models.UniqueConstraint(fields=('tenant', 'terminal', 'resolution', 'bucket'), name='unique_perfstatsrollup'),
+        ),
+        migrations.AddConstraint(
+            model_name='perfstatsrollup',
+            constraint=models.UniqueConstraint(condition=models.Q(terminal=None), fields=('tenant', 'resolution', 'bucket'), name='unique_tenant_perfstatsrollup'),
+        ),
+    ]
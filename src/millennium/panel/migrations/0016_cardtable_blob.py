@@ -0,0 +1,19 @@
+# Generated by Django 3.0.2 on 2026-10-19 19:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('millenniumpanel', '0015_perfstatsrollup_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cardtable',
+            name='blob',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to='millenniumpanel.ConfigBlob'),
+        ),
+    ]
@@ -0,0 +1,146 @@
+from django.db import models
+from django.contrib.auth.models import Group
+from django.core.exceptions import ValidationError
+from .NCCTermParms import NCCTermParms
+from .InstallParms import InstallParms
+from .FconfigOpts import FconfigOpts
+from .CoinValTable import CoinValTable
+from .CardTable import CardTable
+from .RateTable import RateTable
+from .NPANXXTable import NPANXXTable
+from .TerminalGroup import TerminalGroup
+from .terminal import terminal
+
+# Create your models here.
+
+ACTIVATED_TABLES = ('NCCTermParms', 'InstallParms', 'FconfigOpts', 'CoinValTable', 'CardTable', 'RateTable', 'NPANXXTable')
+
+class Activation(models.Model):
+    # Switches a group or a terminal to new tables at effective_date. Frames
+    # are encoded ahead of time (staged), so the switch finds them in the
+    # frame store. Rate and NPA-NXX tables have no encoder yet, so there is
+    # nothing to stage for them.
+    tenant = models.ForeignKey(
+        Group,
+        on_delete=models.CASCADE
+    )
+    group = models.ForeignKey(
+        TerminalGroup,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=TerminalGroup._meta.verbose_name_raw,
+    )
+    terminal = models.ForeignKey(
+        terminal,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=terminal._meta.verbose_name_raw,
+    )
+    effective_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Effective Date',
+        help_text='Defaults to the effective date of the rate table',
+    )
+    # Tables to switch to; empty fields are left as they are
+    NCCTermParms = models.ForeignKey(
+        NCCTermParms,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=NCCTermParms._meta.verbose_name_raw
+    )
+    InstallParms = models.ForeignKey(
+        InstallParms,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=InstallParms._meta.verbose_name_raw
+    )
+    FconfigOpts = models.ForeignKey(
+        FconfigOpts,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=FconfigOpts._meta.verbose_name_raw
+    )
+    CoinValTable = models.ForeignKey(
+        CoinValTable,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=CoinValTable._meta.verbose_name_raw
+    )
+    CardTable = models.ForeignKey(
+        CardTable,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=CardTable._meta.verbose_name_raw
+    )
+    RateTable = models.ForeignKey(
+        RateTable,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=RateTable._meta.verbose_name_raw
+    )
+    NPANXXTable = models.ForeignKey(
+        NPANXXTable,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name=NPANXXTable._meta.verbose_name_raw
+    )
+    state = models.CharField(
+        choices=(
+            ('scheduled', 'Scheduled'),
+            ('staged', 'Frames staged'),
+            ('active', 'Active'),
+            ('failed', 'Failed'),
+        ),
+        default='scheduled',
+        max_length=10,
+        editable=False,
+    )
+    error = models.TextField(
+        blank=True,
+        editable=False,
+    )
+    staged_at = models.DateTimeField(
+        null=True,
+        editable=False,
+    )
+    activated_at = models.DateTimeField(
+        null=True,
+        editable=False,
+    )
+
+    def __str__(self):
+        return '%s at %s' % (self.group or self.terminal, self.effective_date)
+
+    def clean(self):
+        if (self.group_id is None) == (self.terminal_id is None):
+            raise ValidationError('Choose either a group or a terminal.')
+        if not any(getattr(self, name + '_id') is not None for name in ACTIVATED_TABLES):
+            raise ValidationError('Choose at least one table to switch to.')
+        if self.effective_date is None:
+            if self.RateTable_id is None:
+                raise ValidationError({'effective_date': 'This field is required.'})
+            self.effective_date = self.RateTable.effective_date
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['state', 'effective_date']),
+        ]
+        verbose_name = 'Scheduled activation'
+        verbose_name_plural = 'Scheduled activations'
@@ -0,0 +1,59 @@
+from django.db import models
+from .terminal import terminal
+
+# Create your models here.
+
+class CallRecord(models.Model):
+    # Call detail records uploaded by the phones. Rows are only ever
+    # inserted; period (YYYYMM) leads every index so the table can be
+    # partitioned or pruned by month.
+    period = models.PositiveIntegerField(
+        verbose_name='Period (YYYYMM)',
+    )
+    terminal = models.ForeignKey(
+        terminal,
+        on_delete=models.CASCADE,
+    )
+    seq = models.PositiveIntegerField(
+        verbose_name='Sequence number',
+    )
+    started = models.DateTimeField(
+        verbose_name='Call start',
+    )
+    duration = models.PositiveIntegerField(
+        verbose_name='Duration (seconds)',
+    )
+    call_type = models.PositiveSmallIntegerField(
+        verbose_name='Call type',
+    )
+    called_number = models.CharField(
+        max_length=20,
+        blank=True,
+        verbose_name='Called number',
+    )
+    carrier_ref = models.PositiveSmallIntegerField(
+        verbose_name='Carrier reference',
+    )
+    rate = models.PositiveIntegerField(
+        verbose_name='Rate',
+    )
+    cost = models.BigIntegerField(
+        verbose_name='Charged amount',
+    )
+    card_ref_num = models.PositiveSmallIntegerField(
+        verbose_name='Card reference',
+    )
+    received = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    def __str__(self):
+        return '%s %s' % (self.terminal_id, self.started)
+
+    class Meta:
+        unique_together = (('period', 'terminal', 'started', 'seq'),)
+        indexes = [
+            models.Index(fields=['period', 'started']),
+        ]
+        verbose_name = 'Call record'
+        verbose_name_plural = 'Call records'
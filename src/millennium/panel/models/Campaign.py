@@ -0,0 +1,42 @@
+from django.db import models
+from django.contrib.auth.models import Group
+
+# Create your models here.
+
+class Campaign(models.Model):
+    # A planned rollout of pending downloads over the NCC modem lines
+    name = models.CharField(
+        max_length=64,
+    )
+    tenant = models.ForeignKey(
+        Group,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        help_text='Empty for a fleet-wide campaign',
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+    )
+    start = models.DateTimeField(
+        verbose_name='Start',
+    )
+    end = models.DateTimeField(
+        null=True,
+        verbose_name='Planned end',
+    )
+    lines = models.PositiveSmallIntegerField(
+        verbose_name='Modem lines',
+    )
+    tenant_quota = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='Lines per tenant',
+    )
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        verbose_name = 'Campaign'
+        verbose_name_plural = 'Campaigns'
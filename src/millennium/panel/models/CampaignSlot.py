@@ -0,0 +1,37 @@
+from django.db import models
+from .Campaign import Campaign
+from .terminal import terminal
+
+# Create your models here.
+
+class CampaignSlot(models.Model):
+    campaign = models.ForeignKey(
+        Campaign,
+        on_delete=models.CASCADE,
+        related_name='slots',
+    )
+    terminal = models.ForeignKey(
+        terminal,
+        on_delete=models.CASCADE,
+    )
+    line = models.PositiveSmallIntegerField()
+    start = models.DateTimeField()
+    end = models.DateTimeField()
+    priority = models.PositiveSmallIntegerField()
+    tables = models.CharField(
+        max_length=128,
+        help_text='Tables to download, comma separated',
+    )
+    done = models.BooleanField(
+        default=False,
+    )
+
+    def __str__(self):
+        return '%s %s' % (self.terminal_id, self.start)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['campaign', 'start']),
+        ]
+        verbose_name = 'Campaign slot'
+        verbose_name_plural = 'Campaign slots'
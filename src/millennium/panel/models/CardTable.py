@@ -3,6 +3,8 @@ from django.contrib.auth.models import Group
 from django.core.validators import MinLengthValidator, MaxLengthValidator, RegexValidator, MinValueValidator, MaxValueValidator
 from multiselectfield import MultiSelectField
 from millennium.panel.framehelpers import mmByte, mmBCD, mmFlags
+from millennium.panel.mtr import asMTRConfig
+from .ConfigBlob import ConfigBlob
 
 # Create your models here.
 
@@ -26,14 +28,22 @@ class CardTable(models.Model):
         Group,
         on_delete=models.CASCADE,
     )
+    blob = models.ForeignKey(
+        ConfigBlob,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+    )
 
     def __str__(self):
         return self.name
 
     def getFrame(self, MTRconfig):
+        MTRconfig = asMTRConfig(MTRconfig)
         outframe = [0x16]
 
-        for card in self.carddefs_set.all()[:(MTRconfig['DLOG_NUM_CARD_TYPES'] or MTRconfig['MAX_CARD_TABLE_ENTRIES'])]:
+        for card in self.carddefs_set.all()[:MTRconfig.cardTypes]:
             outframe.extend(mmBCD(card.pan_low, 3))
             outframe.extend(mmBCD(card.pan_high, 3))
             outframe.extend(mmByte(card.standard_id))
@@ -51,7 +61,7 @@ class CardTable(models.Model):
                 outframe.extend(mmBCD(card.service_code_5, 2, True))
                     # FIXME: output exactly SERVICE_CODE_SIZE / change model to FK for service CoinValDefs
 
-                if MTRconfig['MTR'] is 1:
+                if MTRconfig.MTR == 1:
                     # FIXME: empty servicecodes should be 0x00 0x00 and not 0x00 0x0E
                     outframe.extend(mmBCD(card.service_code_6, 2, True))
                     outframe.extend(mmBCD(card.service_code_7, 2, True))
@@ -59,8 +69,8 @@ class CardTable(models.Model):
                     outframe.extend(mmBCD(card.service_code_9, 2, True))
                     outframe.extend(mmBCD(card.service_code_10, 2, True))
                     # FIXME: output exactly SERVICE_CODE_SIZE / change model to FK for service CoinValDefs
-                elif MTRconfig['MTR'] is 2:
-                    outframe.extend(mmBCD(card.spill_string, MTRconfig['SPILL_STR_SIZE']))
+                elif MTRconfig.MTR == 2:
+                    outframe.extend(mmBCD(card.spill_string, MTRconfig.SPILL_STR_SIZE))
                     outframe.extend(mmByte(card.spill_term_char))
                     outframe.extend(mmByte(card.disc_ptr))
             else:
@@ -84,20 +94,20 @@ class CardTable(models.Model):
                 outframe.extend(mmByte(card.manufacturer_4))
                 outframe.extend(mmByte(card.manufacturer_5))
 
-                if MTRconfig['MTR'] is 1:
+                if MTRconfig.MTR == 1:
                     outframe.extend(mmByte(card.spare))
-                elif MTRconfig['MTR'] is 2:
+                elif MTRconfig.MTR == 2:
                     outframe.extend(mmByte(card.disc_ptr))
 
             outframe.extend(mmByte(card.card_ref_num))
             outframe.extend(mmByte(card.carrier_id))
 
-            if MTRconfig['MTR'] is 2:
+            if MTRconfig.MTR == 2:
                 outframe.extend(mmFlags(card.control_inf_1))
                 outframe.extend(mmByte(card.bank_reload_ref))
                 outframe.extend(mmByte(card.lang_code))
 
-        # TODO: fill to MTRconfig['DLOG_NUM_CARD_TYPES'] or MTRconfig['MAX_CARD_TABLE_ENTRIES']
+        # TODO: fill to MTRconfig.cardTypes
 
         return outframe
 
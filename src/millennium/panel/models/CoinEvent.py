@@ -0,0 +1,46 @@
+from django.db import models
+from django.core.validators import MaxValueValidator
+from .terminal import terminal
+
+# Create your models here.
+
+class CoinEvent(models.Model):
+    terminal = models.ForeignKey(
+        terminal,
+        on_delete=models.CASCADE,
+    )
+    timestamp = models.DateTimeField(
+        verbose_name='Reported at',
+    )
+    kind = models.CharField(
+        choices=(
+            ('deposit', 'Coins deposited'),
+            ('collection', 'Cashbox collected'),
+        ),
+        default='deposit',
+        max_length=10,
+        verbose_name='Event',
+    )
+    coin = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(15),
+        ],
+        null=True,
+        blank=True,
+        verbose_name='Coin',
+        help_text='Index into the coin validator\'s coin definitions',
+    )
+    count = models.PositiveIntegerField(
+        default=1,
+        verbose_name='Number of coins',
+    )
+
+    def __str__(self):
+        return '%s %s %s' % (self.terminal_id, self.kind, self.timestamp)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['terminal', 'kind', 'timestamp']),
+        ]
+        verbose_name = 'Coin event'
+        verbose_name_plural = 'Coin events'
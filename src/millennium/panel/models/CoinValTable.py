@@ -2,7 +2,9 @@ from django.db import models
 from django.contrib.auth.models import Group
 from django.core.validators import MinLengthValidator, MaxLengthValidator, RegexValidator, MinValueValidator, MaxValueValidator
 from multiselectfield import MultiSelectField
+from .ConfigBlob import ConfigBlob
 from millennium.panel.framehelpers import mmByte, mmWord, mmFlags, mmLong, mmHextel
+from millennium.panel.mtr import asMTRConfig
 
 # Create your models here.
 
@@ -26,6 +28,13 @@ class CoinValTable(models.Model):
         Group,
         on_delete=models.CASCADE,
     )
+    blob = models.ForeignKey(
+        ConfigBlob,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+    )
     #coin_values[] -> CoinValDefs
     #coin_volumes[] -> CoinValDefs
     #coin_val_parms]] -> CoinValDefs
@@ -84,18 +93,19 @@ class CoinValTable(models.Model):
         return self.name
 
     def getFrame(self, MTRconfig):
+        MTRconfig = asMTRConfig(MTRconfig)
         outframe = [0x32]
 
         coin_values = []
         coin_volumes = []
         coin_val_parms = []
 
-        for coin in self.coinvaldefs_set.all()[:MTRconfig['NUMBER_COIN_TYPES']]:
+        for coin in self.coinvaldefs_set.all()[:MTRconfig.NUMBER_COIN_TYPES]:
             coin_values.append(coin.coin_value)
             coin_volumes.append(coin.coin_volume)
             coin_val_parms.append(coin.coin_val_parms)
 
-        # TODO: fill to MTRconfig['NUMBER_COIN_TYPES']
+        # TODO: fill to MTRconfig.NUMBER_COIN_TYPES
 
         for coin in coin_values:
             outframe.extend(mmByte(coin))
@@ -112,7 +122,7 @@ class CoinValTable(models.Model):
         outframe.extend(mmLong(self.cash_box_value_threshold))
         outframe.extend(mmWord(self.escrow_volume_threshold))
         outframe.extend(mmLong(self.escrow_value_threshold))
-        outframe.extend(mmHextel('0', MTRconfig['DLOG_SP_COIN_VAL_TABLE'])) # TODO: spare
+        outframe.extend(MTRconfig.coinValSpare) # TODO: spare
 
         return(outframe)
 
@@ -0,0 +1,36 @@
+from django.db import models
+
+# Create your models here.
+
+class ConfigBlob(models.Model):
+    digest = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name='SHA-256 digest',
+    )
+    kind = models.CharField(
+        choices=(
+            ('table', 'Table payload'),
+            ('frame', 'Encoded frame'),
+        ),
+        max_length=5,
+        verbose_name='Kind',
+    )
+    source = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name='Encoded from',
+    )
+    payload = models.BinaryField()
+    created = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    def __str__(self):
+        return self.digest
+
+    class Meta:
+        verbose_name = 'Configuration blob'
+        verbose_name_plural = 'Configuration blobs'
@@ -0,0 +1,77 @@
+from django.db import models
+from .NCCTermParms import NCCTermParms
+from .InstallParms import InstallParms
+from .FconfigOpts import FconfigOpts
+from .CoinValTable import CoinValTable
+from .CardTable import CardTable
+from .RateTable import RateTable
+from .NPANXXTable import NPANXXTable
+from .MTRProfile import MTRProfile
+from .terminal import terminal
+
+# Create your models here.
+
+class EffectiveConfig(models.Model):
+    # A terminal's tables after applying its group overrides; maintained by
+    # millennium.panel.layering, never edited directly
+    terminal = models.OneToOneField(
+        terminal,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='effective',
+    )
+    NCCTermParms = models.ForeignKey(
+        NCCTermParms,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+    )
+    InstallParms = models.ForeignKey(
+        InstallParms,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+    )
+    FconfigOpts = models.ForeignKey(
+        FconfigOpts,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+    )
+    CoinValTable = models.ForeignKey(
+        CoinValTable,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+    )
+    CardTable = models.ForeignKey(
+        CardTable,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+    )
+    RateTable = models.ForeignKey(
+        RateTable,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+    )
+    NPANXXTable = models.ForeignKey(
+        NPANXXTable,
+        on_delete=models.CASCADE,
+        null=True,
+        related_name='+',
+    )
+    MTRProfile = models.ForeignKey(
+        MTRProfile,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name='+',
+    )
+
+    def __str__(self):
+        return str(self.terminal_id)
+
+    class Meta:
+        verbose_name = 'Effective configuration'
+        verbose_name_plural = 'Effective configurations'
@@ -2,7 +2,9 @@ from django.db import models
 from django.contrib.auth.models import Group
 from django.core.validators import MinLengthValidator, MaxLengthValidator, RegexValidator, MinValueValidator, MaxValueValidator
 from multiselectfield import MultiSelectField
+from .ConfigBlob import ConfigBlob
 from millennium.panel.framehelpers import mmByte, mmWord, mmFlags, mmHextel
+from millennium.panel.mtr import asMTRConfig
 
 # Create your models here.
 
@@ -26,6 +28,13 @@ class FconfigOpts(models.Model):
         Group,
         on_delete=models.CASCADE,
     )
+    blob = models.ForeignKey(
+        ConfigBlob,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+    )
     terminal_type = models.CharField(
         choices=(
             ('00', 'Unknown Terminal Type'), # NULL_TERMINAL_TYPE
@@ -684,6 +693,7 @@ class FconfigOpts(models.Model):
         return self.name
 
     def getFrame(self, MTRconfig):
+        MTRconfig = asMTRConfig(MTRconfig)
         outframe = [0x1A]
         outframe.extend(mmByte(self.terminal_type))
         outframe.extend(mmByte(self.display_present))
@@ -695,15 +705,15 @@ class FconfigOpts(models.Model):
         outframe.extend(mmFlags(self.oos_pots_flags))
         outframe.extend(mmByte(self.data_jack_visual_display))
 
-        if MTRconfig['MTR'] is 1:
+        if MTRconfig.MTR == 1:
             outframe.extend(mmByte(self.incoming_call_rate))
             outframe.extend(mmByte(self.spareB))
             outframe.extend(mmByte(self.spareC))
             outframe.extend(mmByte(self.spareD))
             outframe.extend(mmByte(self.spareE))
             outframe.extend(mmByte(self.spareF))
-            outframe.extend(mmHextel(self.aos_number, MTRconfig['NA_LDIST_TEL_NUM_LEN']))
-        elif MTRconfig['MTR'] is 2:
+            outframe.extend(mmHextel(self.aos_number, MTRconfig.NA_LDIST_TEL_NUM_LEN))
+        elif MTRconfig.MTR == 2:
             outframe.extend(mmByte(self.language_scrolling_order))
             outframe.extend(mmByte(self.language_scrolling_order_2))
             outframe.extend(mmByte(self.number_of_languages))
@@ -723,9 +733,9 @@ class FconfigOpts(models.Model):
         outframe.extend(mmByte(self.dtmf_duration))
         outframe.extend(mmByte(self.inter_digit_pause))
 
-        if MTRconfig['MTR'] is 1:
+        if MTRconfig.MTR == 1:
             outframe.extend(mmFlags(self.dialing_conversion))
-        elif MTRconfig['MTR'] is 2:
+        elif MTRconfig.MTR == 2:
             outframe.extend(mmByte(self.ppu_pre_auth_credit_limit))
 
         outframe.extend(mmFlags(self.coin_call_features))
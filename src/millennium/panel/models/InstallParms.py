@@ -2,7 +2,9 @@ from django.db import models
 from django.contrib.auth.models import Group
 from django.core.validators import MinLengthValidator, MaxLengthValidator, RegexValidator, MinValueValidator, MaxValueValidator
 from multiselectfield import MultiSelectField
+from .ConfigBlob import ConfigBlob
 from millennium.panel.framehelpers import mmByte, mmBCD, mmHextel, mmFlags, mmWord
+from millennium.panel.mtr import asMTRConfig
 
 # Create your models here.
 
@@ -26,6 +28,13 @@ class InstallParms(models.Model):
         Group,
         on_delete=models.CASCADE,
     )
+    blob = models.ForeignKey(
+        ConfigBlob,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+    )
     access_code = models.CharField(
         max_length=7,
         validators=[
@@ -165,29 +174,30 @@ class InstallParms(models.Model):
         return self.name
 
     def getFrame(self, MTRconfig):
+        MTRconfig = asMTRConfig(MTRconfig)
         outframe = [0x1F]
-        outframe.extend(mmBCD(self.access_code, MTRconfig['ACCESS_CODE_SIZE'], True))
-        outframe.extend(mmHextel(self.key_card_num, MTRconfig['KEY_CARD_LEN']))
+        outframe.extend(mmBCD(self.access_code, MTRconfig.ACCESS_CODE_SIZE, True))
+        outframe.extend(mmHextel(self.key_card_num, MTRconfig.KEY_CARD_LEN))
         outframe.extend(mmFlags(self.install_servicing_flags))
         outframe.extend(mmByte(self.tx_pkt_delay))
         outframe.extend(mmByte(self.rx_pkt_gap))
         outframe.extend(mmByte(self.retries_till_oos))
 
-        if MTRconfig['MTR'] is 1:
+        if MTRconfig.MTR == 1:
             outframe.extend(mmByte(0)) #outframe.extend(mmByte(self.spare_2)) # TODO: spare
-        elif MTRconfig['MTR'] is 2:
+        elif MTRconfig.MTR == 2:
             outframe.extend(mmFlags(self.coin_servicing))
 
         outframe.extend(mmWord(self.coin_box_lock_timeout))
-        outframe.extend(mmHextel(self.predial_string, MTRconfig['PREDIAL_STRING_LEN']))
-        outframe.extend(mmHextel(self.alt_predial_string, MTRconfig['PREDIAL_STRING_LEN']))
+        outframe.extend(mmHextel(self.predial_string, MTRconfig.PREDIAL_STRING_LEN))
+        outframe.extend(mmHextel(self.alt_predial_string, MTRconfig.PREDIAL_STRING_LEN))
 
-        if MTRconfig['MTR'] is 1:
-            outframe.extend(mmHextel('0', MTRconfig['DLOG_SP_INSTALL_PARMS'])) # TODO: spare
-        elif MTRconfig['MTR'] is 2:
-            outframe.extend(mmHextel(self.analog_mode_prefix, MTRconfig['AMP_STRING_LEN']))
+        if MTRconfig.MTR == 1:
+            outframe.extend(MTRconfig.installSpare) # TODO: spare
+        elif MTRconfig.MTR == 2:
+            outframe.extend(mmHextel(self.analog_mode_prefix, MTRconfig.AMP_STRING_LEN))
             outframe.extend(mmFlags(self.comm_saving_flags))
-            outframe.extend(mmHextel('0', MTRconfig['DLOG_SP_INSTALL_PARMS'])) # TODO: spare
+            outframe.extend(MTRconfig.installSpare) # TODO: spare
 
         return outframe
 
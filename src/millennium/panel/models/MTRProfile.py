@@ -0,0 +1,126 @@
+from django.db import models
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator
+
+# Create your models here.
+
+class MTRProfile(models.Model):
+    name = models.CharField(
+        max_length=50,
+        unique=True,
+    )
+    MTR = models.PositiveSmallIntegerField(
+        choices=(
+            (1, 'MTR 1.x'),
+            (2, 'MTR 2.x'),
+        ),
+        default=2,
+        verbose_name='MTR version',
+    )
+    default = models.BooleanField(
+        default=False,
+        verbose_name='Default profile',
+        help_text='Used for terminals without a profile',
+    )
+    ncc_term_size = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Terminal ID length',
+        help_text='NCC_TERM_SIZE (bytes)',
+    )
+    na_ldist_tel_num_len = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Telephone number length',
+        help_text='NA_LDIST_TEL_NUM_LEN (bytes)',
+    )
+    access_code_size = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Access code length',
+        help_text='ACCESS_CODE_SIZE (bytes)',
+    )
+    key_card_len = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Key card number length',
+        help_text='KEY_CARD_LEN (bytes)',
+    )
+    predial_string_len = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Predial string length',
+        help_text='PREDIAL_STRING_LEN (bytes)',
+    )
+    amp_string_len = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Analog mode prefix length',
+        help_text='AMP_STRING_LEN (bytes, MTR 2.x only)',
+    )
+    dlog_sp_install_parms = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Install parameters spare',
+        help_text='DLOG_SP_INSTALL_PARMS (bytes)',
+    )
+    dlog_sp_coin_val_table = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Coin validation table spare',
+        help_text='DLOG_SP_COIN_VAL_TABLE (bytes)',
+    )
+    number_coin_types = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Coin types',
+        help_text='NUMBER_COIN_TYPES',
+    )
+    dlog_num_card_types = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Card types',
+        help_text='DLOG_NUM_CARD_TYPES (0 to use the card table maximum)',
+    )
+    max_card_table_entries = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Card table entries',
+        help_text='MAX_CARD_TABLE_ENTRIES',
+    )
+    spill_str_size = models.PositiveSmallIntegerField(
+        validators=[
+            MaxValueValidator(255),
+        ],
+        verbose_name='Spill string length',
+        help_text='SPILL_STR_SIZE (bytes, MTR 2.x only)',
+    )
+    # Lets other processes notice the profile changed
+    modified = models.DateTimeField(
+        auto_now=True,
+    )
+
+    def __str__(self):
+        return self.name
+
+    def clean(self):
+        if self.default and MTRProfile.objects.filter(default=True).exclude(pk=self.pk).exists():
+            raise ValidationError({'default': 'Another profile is already the default.'})
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['default'], condition=models.Q(default=True), name='single_default_mtrprofile'),
+        ]
+        verbose_name = 'MTR profile'
+        verbose_name_plural = 'MTR profiles'
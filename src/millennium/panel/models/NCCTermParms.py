@@ -3,6 +3,7 @@ from django.contrib.auth.models import Group
 from django.core.validators import MinLengthValidator, MaxLengthValidator, RegexValidator, MinValueValidator, MaxValueValidator
 from multiselectfield import MultiSelectField
 from millennium.panel.framehelpers import mmHextel
+from millennium.panel.mtr import asMTRConfig
 
 # Create your models here.
 
@@ -71,12 +72,13 @@ class NCCTermParms(models.Model):
         return self.name
 
     def getFrame(self, MTRconfig, termId):
+        MTRconfig = asMTRConfig(MTRconfig)
         outframe = [0x15]
-        outframe.extend(mmHextel(termId, MTRconfig['NCC_TERM_SIZE']))
-        outframe.extend(mmHextel(self.datapac_num, MTRconfig['NA_LDIST_TEL_NUM_LEN']))
-        outframe.extend(mmHextel(self.alt_datapac_num, MTRconfig['NA_LDIST_TEL_NUM_LEN']))
+        outframe.extend(mmHextel(termId, MTRconfig.NCC_TERM_SIZE))
+        outframe.extend(mmHextel(self.datapac_num, MTRconfig.NA_LDIST_TEL_NUM_LEN))
+        outframe.extend(mmHextel(self.alt_datapac_num, MTRconfig.NA_LDIST_TEL_NUM_LEN))
 
-        if MTRconfig['MTR'] is 2:
+        if MTRconfig.MTR == 2:
             outframe.extend(mmHextel(self.cad_id, 4))
             outframe.extend(mmHextel(self.cpe_id, 4))
             # TODO: spare[14]
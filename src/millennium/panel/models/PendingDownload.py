@@ -0,0 +1,33 @@
+from django.db import models
+from .terminal import terminal
+from .Activation import Activation, ACTIVATED_TABLES
+
+# Create your models here.
+
+class PendingDownload(models.Model):
+    # A table a terminal has to download at its next NCC session
+    terminal = models.ForeignKey(
+        terminal,
+        on_delete=models.CASCADE,
+    )
+    table = models.CharField(
+        choices=[(name, name) for name in ACTIVATED_TABLES],
+        max_length=32,
+    )
+    activation = models.ForeignKey(
+        Activation,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+    )
+    queued = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    def __str__(self):
+        return '%s %s' % (self.terminal_id, self.table)
+
+    class Meta:
+        unique_together = (('terminal', 'table'),)
+        verbose_name = 'Pending download'
+        verbose_name_plural = 'Pending downloads'
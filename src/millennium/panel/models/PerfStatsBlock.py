@@ -0,0 +1,31 @@
+from django.db import models
+from .terminal import terminal
+
+# Create your models here.
+
+# Counters in a performance statistics report, in storage order
+PERF_STATS = ('dialogs', 'dialog_fails', 'alt_ncc_dialogs', 'co_line_check_fails', 'oos', 'calls')
+
+class PerfStatsBlock(models.Model):
+    # One day of a terminal's reports, column by column: the sample offsets
+    # in seconds from midnight, then each counter in PERF_STATS, every column
+    # a little endian uint32 array of `samples` entries
+    terminal = models.ForeignKey(
+        terminal,
+        on_delete=models.CASCADE,
+    )
+    day = models.DateField()
+    samples = models.PositiveIntegerField(
+        default=0,
+    )
+    data = models.BinaryField(
+        default=b'',
+    )
+
+    def __str__(self):
+        return '%s %s' % (self.terminal_id, self.day)
+
+    class Meta:
+        unique_together = (('terminal', 'day'),)
+        verbose_name = 'Performance statistics block'
+        verbose_name_plural = 'Performance statistics blocks'
@@ -0,0 +1,71 @@
+from django.db import models
+from django.contrib.auth.models import Group
+from .terminal import terminal
+
+# Create your models here.
+
+class PerfStatsRollup(models.Model):
+    # Sums of the performance statistics per hour or day, for a terminal or,
+    # with terminal empty, for the whole tenant
+    tenant = models.ForeignKey(
+        Group,
+        on_delete=models.CASCADE,
+    )
+    terminal = models.ForeignKey(
+        terminal,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    resolution = models.CharField(
+        choices=(
+            ('hour', 'Hourly'),
+            ('day', 'Daily'),
+        ),
+        max_length=4,
+    )
+    bucket = models.DateTimeField()
+    samples = models.PositiveIntegerField(
+        default=0,
+    )
+    dialogs = models.BigIntegerField(
+        default=0,
+        verbose_name='NCC dialogs',
+    )
+    dialog_fails = models.BigIntegerField(
+        default=0,
+        verbose_name='Failed NCC dialogs',
+    )
+    alt_ncc_dialogs = models.BigIntegerField(
+        default=0,
+        verbose_name='Dialogs with the alternate NCC',
+    )
+    co_line_check_fails = models.BigIntegerField(
+        default=0,
+        verbose_name='CO line check failures',
+    )
+    oos = models.BigIntegerField(
+        default=0,
+        verbose_name='Out of service',
+    )
+    calls = models.BigIntegerField(
+        default=0,
+        verbose_name='Calls',
+    )
+
+    def __str__(self):
+        return '%s %s %s' % (self.terminal_id or self.tenant_id, self.resolution, self.bucket)
+
+    class Meta:
+        # Terminal is NULL for the tenant-wide rows, which a plain unique
+        # constraint would not compare
+        constraints = [
+            models.UniqueConstraint(fields=['tenant', 'terminal', 'resolution', 'bucket'], name='unique_perfstatsrollup'),
+            models.UniqueConstraint(fields=['tenant', 'resolution', 'bucket'], condition=models.Q(terminal=None), name='unique_tenant_perfstatsrollup'),
+        ]
+        indexes = [
+            models.Index(fields=['tenant', 'resolution', 'bucket']),
+            models.Index(fields=['terminal', 'resolution', 'bucket']),
+        ]
+        verbose_name = 'Performance statistics rollup'
+        verbose_name_plural = 'Performance statistics rollups'
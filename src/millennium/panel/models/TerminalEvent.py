@@ -0,0 +1,39 @@
+from django.db import models
+from .terminal import terminal
+
+# Create your models here.
+
+EVENT_KINDS = (
+    ('alarm', 'Alarm'),
+    ('status', 'Status'),
+)
+
+class TerminalEvent(models.Model):
+    # Repeats of the same event from the same terminal within one coalescing
+    # window are stored once, with their count
+    terminal = models.ForeignKey(
+        terminal,
+        on_delete=models.CASCADE,
+    )
+    kind = models.CharField(
+        choices=EVENT_KINDS,
+        max_length=6,
+    )
+    code = models.PositiveSmallIntegerField(
+        verbose_name='Code',
+    )
+    first_seen = models.DateTimeField()
+    last_seen = models.DateTimeField()
+    count = models.PositiveIntegerField(
+        default=1,
+    )
+
+    def __str__(self):
+        return '%s %s %d' % (self.terminal_id, self.kind, self.code)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['terminal', 'first_seen']),
+        ]
+        verbose_name = 'Terminal event'
+        verbose_name_plural = 'Terminal events'
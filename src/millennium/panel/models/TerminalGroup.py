@@ -0,0 +1,106 @@
+from django.db import models
+from django.contrib.auth.models import Group
+from django.core.exceptions import ValidationError
+from .NCCTermParms import NCCTermParms
+from .InstallParms import InstallParms
+from .FconfigOpts import FconfigOpts
+from .CoinValTable import CoinValTable
+from .CardTable import CardTable
+from .RateTable import RateTable
+from .NPANXXTable import NPANXXTable
+from .MTRProfile import MTRProfile
+
+# Create your models here.
+
+class TerminalGroup(models.Model):
+    name = models.CharField(
+        max_length=32,
+    )
+    tenant = models.ForeignKey(
+        Group,
+        on_delete=models.CASCADE
+    )
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='children',
+        verbose_name='Parent group',
+        help_text='Empty for a top level group, e.g. the tenant default',
+    )
+    # Overrides; empty fields are inherited from the parent group
+    NCCTermParms = models.ForeignKey(
+        NCCTermParms,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=NCCTermParms._meta.verbose_name_raw
+    )
+    InstallParms = models.ForeignKey(
+        InstallParms,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=InstallParms._meta.verbose_name_raw
+    )
+    FconfigOpts = models.ForeignKey(
+        FconfigOpts,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=FconfigOpts._meta.verbose_name_raw
+    )
+    CoinValTable = models.ForeignKey(
+        CoinValTable,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=CoinValTable._meta.verbose_name_raw
+    )
+    CardTable = models.ForeignKey(
+        CardTable,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=CardTable._meta.verbose_name_raw
+    )
+    RateTable = models.ForeignKey(
+        RateTable,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=RateTable._meta.verbose_name_raw
+    )
+    NPANXXTable = models.ForeignKey(
+        NPANXXTable,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=NPANXXTable._meta.verbose_name_raw
+    )
+    MTRProfile = models.ForeignKey(
+        MTRProfile,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=MTRProfile._meta.verbose_name_raw
+    )
+
+    def __str__(self):
+        return self.name
+
+    def clean(self):
+        # The parent chain must end at a top level group
+        parent = self.parent
+        seen = set()
+        while parent is not None and parent.pk not in seen:
+            if self.pk is not None and parent.pk == self.pk:
+                raise ValidationError({'parent': 'A group cannot be its own ancestor.'})
+            seen.add(parent.pk)
+            parent = parent.parent
+
+    class Meta:
+        unique_together = (('name', 'tenant'),)
+        verbose_name = 'Terminal group'
+        verbose_name_plural = 'Terminal groups'
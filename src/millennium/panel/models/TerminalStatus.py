@@ -0,0 +1,47 @@
+from django.db import models
+from .terminal import terminal
+
+# Create your models here.
+
+class TerminalStatus(models.Model):
+    # Latest known state of a terminal, maintained from its events
+    terminal = models.OneToOneField(
+        terminal,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='status',
+    )
+    last_seen = models.DateTimeField(
+        verbose_name='Last event',
+    )
+    last_alarm = models.PositiveSmallIntegerField(
+        null=True,
+        verbose_name='Last alarm',
+    )
+    last_alarm_at = models.DateTimeField(
+        null=True,
+        verbose_name='Last alarm at',
+    )
+    last_status = models.PositiveSmallIntegerField(
+        null=True,
+        verbose_name='Last status',
+    )
+    last_status_at = models.DateTimeField(
+        null=True,
+        verbose_name='Last status at',
+    )
+    alarms = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Alarms received',
+    )
+    events = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Events received',
+    )
+
+    def __str__(self):
+        return str(self.terminal_id)
+
+    class Meta:
+        verbose_name = 'Terminal status'
+        verbose_name_plural = 'Terminal status'
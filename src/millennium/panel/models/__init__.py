@@ -1,3 +1,5 @@
+from .ConfigBlob import ConfigBlob
+from .MTRProfile import MTRProfile
 from .NCCTermParms import NCCTermParms
 from .InstallParms import InstallParms
 from .FconfigOpts import FconfigOpts
@@ -8,4 +10,16 @@ from .CardDefs import CardDefs
 from .RateTable import RateTable
 from .RateDefs import RateDefs
 from .NPANXXTable import NPANXXTable
+from .TerminalGroup import TerminalGroup
 from .terminal import terminal
+from .EffectiveConfig import EffectiveConfig
+from .Activation import Activation
+from .PendingDownload import PendingDownload
+from .Campaign import Campaign
+from .CampaignSlot import CampaignSlot
+from .CoinEvent import CoinEvent
+from .CallRecord import CallRecord
+from .TerminalEvent import TerminalEvent
+from .TerminalStatus import TerminalStatus
+from .PerfStatsBlock import PerfStatsBlock
+from .PerfStatsRollup import PerfStatsRollup
@@ -9,6 +9,8 @@ from .CoinValTable import CoinValTable
 from .CardTable import CardTable
 from .RateTable import RateTable
 from .NPANXXTable import NPANXXTable
+from .MTRProfile import MTRProfile
+from .TerminalGroup import TerminalGroup
 # Create your models here.
 
 OnlyNumbersValidator = RegexValidator(
@@ -37,45 +39,78 @@ class terminal(models.Model):
         Group,
         on_delete=models.CASCADE
     )
+    group = models.ForeignKey(
+        TerminalGroup,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        verbose_name=TerminalGroup._meta.verbose_name_raw,
+        help_text='Tables left empty below are taken from the group',
+    )
     NCCTermParms = models.ForeignKey(
         NCCTermParms,
         on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         verbose_name=NCCTermParms._meta.verbose_name_raw
     )
     InstallParms = models.ForeignKey(
         InstallParms,
         on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         verbose_name=InstallParms._meta.verbose_name_raw
     )
     FconfigOpts = models.ForeignKey(
         FconfigOpts,
         on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         verbose_name=FconfigOpts._meta.verbose_name_raw
     )
     CoinValTable = models.ForeignKey(
         CoinValTable,
         on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         verbose_name=CoinValTable._meta.verbose_name_raw
     )
     CardTable = models.ForeignKey(
         CardTable,
         on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         verbose_name=CardTable._meta.verbose_name_raw
     )
     RateTable = models.ForeignKey(
         RateTable,
         on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         verbose_name=RateTable._meta.verbose_name_raw
     )
     NPANXXTable = models.ForeignKey(
         NPANXXTable,
         on_delete=models.CASCADE,
+        null=True,
+        blank=True,
         verbose_name=NPANXXTable._meta.verbose_name_raw
     )
+    MTRProfile = models.ForeignKey(
+        MTRProfile,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name=MTRProfile._meta.verbose_name_raw,
+        help_text='Firmware the phone runs; empty for the default profile',
+    )
 
     def __str__(self):
         return self.term_id
 
     class Meta:
+        indexes = [
+            models.Index(fields=['tenant', 'term_id']),
+        ]
         verbose_name = 'Terminal configuration'
         verbose_name_plural = 'Terminal configurations'
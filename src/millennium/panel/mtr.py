@@ -0,0 +1,222 @@
+from millennium.panel.models.MTRProfile import MTRProfile
+from millennium.panel.framehelpers import mmHextel
+from itertools import accumulate
+from types import MappingProxyType
+import json
+import threading
+import time
+
+# Firmware constants the encoders size their fields with, as stored on
+# MTRProfile (in lower case)
+MTR_CONSTANTS = (
+    'NCC_TERM_SIZE',
+    'NA_LDIST_TEL_NUM_LEN',
+    'ACCESS_CODE_SIZE',
+    'KEY_CARD_LEN',
+    'PREDIAL_STRING_LEN',
+    'AMP_STRING_LEN',
+    'DLOG_SP_INSTALL_PARMS',
+    'DLOG_SP_COIN_VAL_TABLE',
+    'NUMBER_COIN_TYPES',
+    'DLOG_NUM_CARD_TYPES',
+    'MAX_CARD_TABLE_ENTRIES',
+    'SPILL_STR_SIZE',
+)
+
+MTR_FIELDS = ('MTR',) + MTR_CONSTANTS
+
+def tableLayouts(config):
+    # (field, width in bytes) in frame order for the tables whose frame
+    # length does not depend on their content. Field names are the model
+    # attributes the encoders write.
+    mtr1 = config.MTR == 1
+
+    ncc = [('table_id', 1), ('term_id', config.NCC_TERM_SIZE), ('datapac_num', config.NA_LDIST_TEL_NUM_LEN), ('alt_datapac_num', config.NA_LDIST_TEL_NUM_LEN)]
+    if not mtr1:
+        ncc += [('cad_id', 4), ('cpe_id', 4)]
+
+    install = [
+        ('table_id', 1), ('access_code', config.ACCESS_CODE_SIZE), ('key_card_num', config.KEY_CARD_LEN),
+        ('install_servicing_flags', 1), ('tx_pkt_delay', 1), ('rx_pkt_gap', 1), ('retries_till_oos', 1),
+        ('spare_2' if mtr1 else 'coin_servicing', 1),
+        ('coin_box_lock_timeout', 2), ('predial_string', config.PREDIAL_STRING_LEN), ('alt_predial_string', config.PREDIAL_STRING_LEN),
+    ]
+    if not mtr1:
+        install += [('analog_mode_prefix', config.AMP_STRING_LEN), ('comm_saving_flags', 1)]
+    install += [('spare', config.DLOG_SP_INSTALL_PARMS)]
+
+    fconfig = [(name, 1) for name in (
+        'table_id', 'terminal_type', 'display_present', 'num_call_follow_on', 'card_validation_info', 'accs_info',
+        'incoming_call_mode', 'incoming_call_anti_fraud', 'oos_pots_flags', 'data_jack_visual_display',
+    )]
+    if mtr1:
+        fconfig += [(name, 1) for name in ('incoming_call_rate', 'spareB', 'spareC', 'spareD', 'spareE', 'spareF')]
+        fconfig += [('aos_number', config.NA_LDIST_TEL_NUM_LEN)]
+    else:
+        fconfig += [(name, 1) for name in (
+            'language_scrolling_order', 'language_scrolling_order_2', 'number_of_languages', 'rating_flags',
+            'dial_around_timer', 'opr_interntl_access_ptr', 'aos_interlata_access', 'aos_interntl_access',
+            'djack_grace_before_collect', 'opr_collection_tmr', 'opr_intralata_access_ptr', 'opr_interlata_access_ptr',
+        )]
+    fconfig += [(name, 1) for name in ('advert_enable', 'default_language', 'display_called_number', 'dtmf_duration', 'inter_digit_pause')]
+    fconfig += [('dialing_conversion' if mtr1 else 'ppu_pre_auth_credit_limit', 1)]
+    fconfig += [
+        ('coin_call_features', 1), ('coin_call_overtime_period', 2), ('coin_call_pots_time', 2),
+        ('min_international_digits', 1), ('def_rate_req_payment', 1), ('next_call_revalidation_freq', 1),
+        ('cutoff_on_disconnect_duration', 1), ('cdr_upload_timer_int', 2), ('cdr_upload_timer_nonint', 2),
+    ]
+    fconfig += [(name, 1) for name in (
+        'perf_stats_dialog_fails', 'co_line_check_fails', 'alt_ncc_dialog_fails', 'dialog_fails_till_oos',
+        'dialog_fails_till_alarm', 'smart_card_flags', 'max_man_card_dig', 'aos_intra_access_ptr',
+        'carrier_reroute_flags', 'min_man_card_dig', 'max_smart_card_inserts', 'max_diff_smart_card_inserts',
+        'aos_operator_access_ptr', 'data_jack_flags',
+    )]
+    fconfig += [(name, 2) for name in (
+        'onhook_alarm_delay', 'post_onhook_alarm_delay', 'card_alarm_duration', 'alarm_cadence_on_timer',
+        'alarm_cadence_off_timer', 'cardrdr_blocked_alarm_delay',
+    )]
+    fconfig += [(name, 1) for name in ('settle_time', 'grace_period_domestic', 'ias_timeout', 'grace_period_international', 'settle_time_datajack')]
+
+    coins = config.NUMBER_COIN_TYPES
+    coinval = [
+        ('table_id', 1), ('coin_values', coins), ('coin_volumes', 2 * coins), ('coin_val_parms', coins),
+        ('cash_box_volume', 2), ('escrow_volume', 2), ('cash_box_volume_threshold', 2), ('cash_box_value_threshold', 4),
+        ('escrow_volume_threshold', 2), ('escrow_value_threshold', 4), ('spare', config.DLOG_SP_COIN_VAL_TABLE),
+    ]
+
+    return {
+        'NCCTermParms': tuple(ncc),
+        'InstallParms': tuple(install),
+        'FconfigOpts': tuple(fconfig),
+        'CoinValTable': tuple(coinval),
+    }
+
+def cardEntrySizes(config):
+    # Card definitions with service codes, and with check digits instead
+    common = 3 + 3 + 1 + 1 + 1 + 1 + 1 + 1 + 1 + (3 if config.MTR == 2 else 0)
+    if config.MTR == 1:
+        return common + 10 * 2, common + 6 + 8 + 5 + 1
+    return common + 5 * 2 + config.SPILL_STR_SIZE + 1 + 1, common + 6 + 8 + 5 + 1
+
+class MTRConfig(object):
+    # Immutable set of firmware constants plus everything the encoders
+    # derive from them, computed once per profile. Attribute access in the
+    # encoders; config['NAME'] still works for older callers.
+    __slots__ = MTR_FIELDS + (
+        'key',
+        'cardTypes',
+        'cardEntrySizes',
+        'installSpare',
+        'coinValSpare',
+        'layouts',
+        'offsets',
+        'sizes',
+    )
+
+    def __init__(self, MTR, **constants):
+        # Older MTRconfig dicts may lack the constants of the other MTR
+        # version, or hold None for some. Those stay None, which the
+        # encoders treat as the dict-based ones did (no padding, no limit);
+        # layouts and sizes are only derived from complete sets.
+        values = dict(constants, MTR=MTR)
+        for name in MTR_FIELDS:
+            value = values.get(name)
+            object.__setattr__(self, name, None if value is None else int(value))
+
+        assign = lambda name, value: object.__setattr__(self, name, value)
+        assign('key', json.dumps({name: getattr(self, name) for name in MTR_FIELDS if name in values}, sort_keys=True, separators=(',', ':')).encode())
+        assign('cardTypes', self.DLOG_NUM_CARD_TYPES or self.MAX_CARD_TABLE_ENTRIES)
+        assign('installSpare', bytes(mmHextel('0', self.DLOG_SP_INSTALL_PARMS)))
+        assign('coinValSpare', bytes(mmHextel('0', self.DLOG_SP_COIN_VAL_TABLE)))
+
+        if any(getattr(self, name) is None for name in MTR_FIELDS):
+            assign('cardEntrySizes', None)
+            assign('layouts', MappingProxyType({}))
+            assign('offsets', MappingProxyType({}))
+            assign('sizes', MappingProxyType({}))
+            return
+
+        assign('cardEntrySizes', cardEntrySizes(self))
+        layouts = tableLayouts(self)
+        assign('layouts', MappingProxyType(layouts))
+        assign('offsets', MappingProxyType({
+            table: MappingProxyType({field: offset for (field, width), offset in zip(layout, accumulate([0] + [width for field, width in layout]))})
+            for table, layout in layouts.items()
+        }))
+        sizes = {table: sum(width for field, width in layout) for table, layout in layouts.items()}
+        sizes['CardTable'] = 1 + self.cardTypes * max(self.cardEntrySizes)
+        assign('sizes', MappingProxyType(sizes))
+
+    @classmethod
+    def fromProfile(cls, profile):
+        return cls(profile.MTR, **{name: getattr(profile, name.lower()) for name in MTR_CONSTANTS})
+
+    def __setattr__(self, name, value):
+        raise AttributeError('MTRConfig is read-only')
+
+    def __delattr__(self, name):
+        raise AttributeError('MTRConfig is read-only')
+
+    def __getitem__(self, name):
+        if name not in MTR_FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __eq__(self, other):
+        return isinstance(other, MTRConfig) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return 'MTRConfig(%s)' % self.key.decode()
+
+def asMTRConfig(value):
+    # Accepts an MTRConfig or a plain MTRconfig dict; the encoders call it
+    # too, so dicts can still be passed to getFrame()
+    if isinstance(value, MTRConfig):
+        return value
+    return MTRConfig(**value)
+
+# Seconds a cached config is used before it is checked against its profile
+# again; profiles edited in another process are picked up within that time
+MTR_CONFIG_TTL = 30.0
+
+_configs = {}
+_configsLock = threading.Lock()
+
+def getMTRConfig(profileId=None):
+    # The MTRConfig for a profile, or for the default profile if
+    # profileId is None. Built once per profile and process, dropped by the
+    # MTRProfile signals, and rebuilt when another process changed the
+    # profile; callers share the same object.
+    now = time.monotonic()
+    with _configsLock:
+        entry = _configs.get(profileId)
+    if entry is not None:
+        config, pk, modified, checked = entry
+        if now - checked < MTR_CONFIG_TTL:
+            return config
+
+        profiles = MTRProfile.objects.filter(default=True) if profileId is None else MTRProfile.objects.filter(pk=profileId)
+        if profiles.filter(pk=pk, modified=modified).exists():
+            with _configsLock:
+                _configs[profileId] = (config, pk, modified, now)
+            return config
+
+    if profileId is None:
+        profile = MTRProfile.objects.filter(default=True).order_by('pk').first()
+        if profile is None:
+            raise MTRProfile.DoesNotExist('No default MTR profile')
+    else:
+        profile = MTRProfile.objects.get(pk=profileId)
+    config = MTRConfig.fromProfile(profile)
+
+    with _configsLock:
+        _configs[profileId] = (config, profile.pk, profile.modified, now)
+    return config
+
+def invalidateMTRConfigs():
+    # Changing any profile may change which one is the default
+    with _configsLock:
+        _configs.clear()
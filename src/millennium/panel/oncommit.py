@@ -0,0 +1,39 @@
+from django.db import connection, transaction
+import threading
+
+_batches = threading.local()
+
+def onCommitOnce(key, function):
+    # transaction.on_commit(function), unless a function is already waiting
+    # under the same key for the current transaction. A key only dedupes as
+    # long as its callback is still queued on the connection: a commit runs
+    # it and a rollback (of the transaction or of the savepoint it was
+    # queued in) drops it, and either way the next call queues it again.
+    if not connection.in_atomic_block:
+        # Runs right away
+        transaction.on_commit(function)
+        return
+
+    keys = currentKeys()
+    if key in keys:
+        return
+
+    def callback():
+        if getattr(_batches, 'keys', {}).get(key) is callback:
+            del _batches.keys[key]
+        function()
+
+    keys[key] = callback
+    transaction.on_commit(callback)
+
+def currentKeys():
+    # Django replaces run_on_commit with a new list whenever callbacks run
+    # or are dropped, and only appends to it otherwise. While the list is
+    # the one seen last, every remembered callback is still queued.
+    queue = connection.run_on_commit
+    keys = getattr(_batches, 'keys', None)
+    if keys is None or getattr(_batches, 'queue', None) is not queue:
+        queued = {id(function) for sids, function in queue}
+        keys = _batches.keys = {key: callback for key, callback in (keys or {}).items() if id(callback) in queued}
+        _batches.queue = queue
+    return keys
@@ -0,0 +1,162 @@
+from django.db import transaction
+from django.db.models import Q, Sum, F, FloatField, ExpressionWrapper
+from millennium.panel.models import PerfStatsBlock, PerfStatsRollup, terminal
+from millennium.panel.models.PerfStatsBlock import PERF_STATS
+from array import array
+import datetime
+import sys
+
+COLUMNS = 1 + len(PERF_STATS)
+RESOLUTIONS = ('hour', 'day')
+
+def decodeBlock(data, samples):
+    values = array('I')
+    values.frombytes(bytes(data))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return [values[i * samples:(i + 1) * samples] for i in range(COLUMNS)]
+
+def encodeBlock(columns):
+    values = array('I')
+    for column in columns:
+        values.extend(column)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+def blockSamples(block):
+    # (timestamp, {stat: value}) for every report in a block
+    columns = decodeBlock(block.data, block.samples)
+    midnight = datetime.datetime.combine(block.day, datetime.time(), tzinfo=datetime.timezone.utc)
+    for i, offset in enumerate(columns[0]):
+        yield midnight + datetime.timedelta(seconds=offset), {stat: columns[k + 1][i] for k, stat in enumerate(PERF_STATS)}
+
+def bucketOf(timestamp, resolution):
+    if resolution == 'hour':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def recordSamples(samples):
+    # samples: iterable of (terminal id, timestamp, {stat: value}). Appends
+    # them to the terminals' daily blocks and adds them to the hourly and
+    # daily rollups of the terminal and its tenant, all with a fixed number
+    # of bulk statements per call. Safe to call from several threads or
+    # processes at once. Batch the reports of a whole session or
+    # upload window into one call. Reports of terminals that no longer
+    # exist are dropped; returns the number of samples recorded.
+    samples = [
+        (terminalId, timestamp.astimezone(datetime.timezone.utc), [int(values.get(stat) or 0) for stat in PERF_STATS])
+        for terminalId, timestamp, values in samples
+    ]
+    terminalIds = {terminalId for terminalId, timestamp, values in samples}
+    tenants = dict(terminal.objects.filter(pk__in=terminalIds).values_list('id', 'tenant_id'))
+    samples = [sample for sample in samples if sample[0] in tenants]
+    if not samples:
+        return 0
+
+    with transaction.atomic():
+        appendBlocks(samples)
+        addRollups(samples, tenants)
+
+    return len(samples)
+
+def lockedRows(model, keyFields, keys, rows):
+    # {key: row} for each key, from the rows queryset, creating the missing
+    # ones. Sessions ending at the same time may create the same rows: the
+    # model's unique constraints turn all but one insert into a no-op, and
+    # the rows are read again. They stay locked, taken in pk order, until
+    # the transaction ends.
+    def read():
+        return {tuple(getattr(row, field) for field in keyFields): row for row in rows.select_for_update().order_by('pk')}
+
+    existing = read()
+    missing = [key for key in keys if key not in existing]
+    if missing:
+        model.objects.bulk_create([model(**dict(zip(keyFields, key))) for key in missing], batch_size=500, ignore_conflicts=True)
+        existing = read()
+    return existing
+
+def appendBlocks(samples):
+    rows = {}
+    for terminalId, timestamp, values in samples:
+        midnight = bucketOf(timestamp, 'day')
+        rows.setdefault((terminalId, midnight.date()), []).append([int((timestamp - midnight).total_seconds())] + values)
+
+    blocks = lockedRows(PerfStatsBlock, ('terminal_id', 'day'), rows, PerfStatsBlock.objects.filter(
+        terminal__in={terminalId for terminalId, day in rows},
+        day__in={day for terminalId, day in rows},
+    ))
+    updated = []
+
+    for key, newRows in rows.items():
+        block = blocks[key]
+        columns = decodeBlock(block.data, block.samples)
+        for row in sorted(newRows):
+            for column, value in zip(columns, row):
+                column.append(value)
+        block.samples += len(newRows)
+        block.data = encodeBlock(columns)
+        updated.append(block)
+
+    PerfStatsBlock.objects.bulk_update(updated, ['samples', 'data'], batch_size=500)
+
+def addRollups(samples, tenants):
+    deltas = {}
+    for terminalId, timestamp, values in samples:
+        tenantId = tenants.get(terminalId)
+        if tenantId is None:
+            continue
+        for resolution in RESOLUTIONS:
+            bucket = bucketOf(timestamp, resolution)
+            for owner in (terminalId, None):
+                delta = deltas.get((tenantId, owner, resolution, bucket))
+                if delta is None:
+                    delta = deltas[tenantId, owner, resolution, bucket] = [0] * COLUMNS
+                delta[0] += 1
+                for i, value in enumerate(values, start=1):
+                    delta[i] += value
+
+    if not deltas:
+        return
+    buckets = [bucket for tenantId, owner, resolution, bucket in deltas]
+    rollups = lockedRows(PerfStatsRollup, ('tenant_id', 'terminal_id', 'resolution', 'bucket'), deltas, PerfStatsRollup.objects.filter(
+        Q(terminal__in=set(tenants)) | Q(terminal__isnull=True),
+        tenant__in=set(tenants.values()),
+        bucket__gte=min(buckets),
+        bucket__lte=max(buckets),
+    ))
+    updated = []
+
+    for key, delta in deltas.items():
+        # Increments, so the sums are right even where the database does
+        # not lock rows (SQLite)
+        rollup = rollups[key]
+        rollup.samples = F('samples') + delta[0]
+        for stat, value in zip(PERF_STATS, delta[1:]):
+            setattr(rollup, stat, F(stat) + value)
+        updated.append(rollup)
+
+    PerfStatsRollup.objects.bulk_update(updated, ('samples',) + PERF_STATS, batch_size=500)
+
+def tenantSeries(tenant, resolution, since, until=None):
+    # The tenant-wide rollups, one row per bucket
+    rollups = PerfStatsRollup.objects.filter(tenant=tenant, terminal=None, resolution=resolution, bucket__gte=since)
+    if until is not None:
+        rollups = rollups.filter(bucket__lt=until)
+    return rollups.order_by('bucket')
+
+def worstTerminals(tenant, since, limit=20):
+    # Terminals with the highest NCC dialog failure rate since a date, from
+    # the daily rollups
+    return PerfStatsRollup.objects.filter(
+        tenant=tenant,
+        terminal__isnull=False,
+        resolution='day',
+        bucket__gte=since,
+    ).values('terminal', 'terminal__term_id').annotate(
+        dialogs=Sum('dialogs'),
+        dialog_fails=Sum('dialog_fails'),
+        oos=Sum('oos'),
+    ).filter(dialogs__gt=0).annotate(
+        failure_rate=ExpressionWrapper(F('dialog_fails') * 1.0 / F('dialogs'), output_field=FloatField()),
+    ).order_by('-failure_rate', '-dialog_fails')[:limit]
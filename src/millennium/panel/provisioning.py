@@ -0,0 +1,112 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from millennium.panel.models import NCCTermParms, InstallParms, FconfigOpts, CoinValTable, CardTable, RateTable, NPANXXTable, MTRProfile, TerminalGroup, terminal
+from millennium.panel.layering import LAYERED_IDS, resolveGroups, overlay, missingTables, refreshEffective
+
+# The configuration tables every terminal points at; CSV columns carry the
+# same names as the terminal's foreign keys. A column may be left empty for
+# terminals whose group provides the table.
+TERMINAL_TABLES = (NCCTermParms, InstallParms, FconfigOpts, CoinValTable, CardTable, RateTable, NPANXXTable)
+
+BATCH_SIZE = 1000
+
+def resolveTables(tenant):
+    # name -> id, one query per table type
+    return {
+        model.__name__: dict(model.objects.filter(tenant=tenant).values_list('name', 'id'))
+        for model in TERMINAL_TABLES
+    }
+
+def importTerminals(rows, tenant, batchSize=BATCH_SIZE, dryRun=False):
+    # rows is any iterable of dicts, e.g. a csv.DictReader over a file, and is
+    # consumed one batch at a time. Invalid rows are skipped and reported as
+    # (line, message); valid rows are inserted batch by batch.
+    tables = resolveTables(tenant)
+    profiles = dict(MTRProfile.objects.values_list('name', 'id'))
+    groups = dict(TerminalGroup.objects.filter(tenant=tenant).values_list('name', 'id'))
+    groupValues = resolveGroups([tenant.id])
+    termIdField = terminal._meta.get_field('term_id')
+    seen = set()
+    errors = []
+    created = 0
+    batch = []
+
+    for line, row in enumerate(rows, start=2):
+        try:
+            termId = termIdField.clean((row.get('term_id') or '').strip(), None)
+        except ValidationError as e:
+            errors.append((line, 'term_id: ' + '; '.join(e.messages)))
+            continue
+
+        if termId in seen:
+            errors.append((line, 'term_id %s appears more than once' % termId))
+            continue
+        seen.add(termId)
+
+        obj = terminal(term_id=termId, tenant_id=tenant.id)
+        missing = []
+        # Optional column; the group's tables are used where a table is empty
+        group = (row.get('group') or '').strip()
+        if group:
+            obj.group_id = groups.get(group)
+            if obj.group_id is None:
+                missing.append('group "%s"' % group)
+
+        for model in TERMINAL_TABLES:
+            name = (row.get(model.__name__) or '').strip()
+            if not name:
+                continue
+            tableId = tables[model.__name__].get(name)
+            if tableId is None:
+                missing.append('%s "%s"' % (model.__name__, name))
+            else:
+                setattr(obj, model.__name__ + '_id', tableId)
+
+        # Optional column; empty means the default profile
+        profile = (row.get('MTRProfile') or '').strip()
+        if profile:
+            obj.MTRProfile_id = profiles.get(profile)
+            if obj.MTRProfile_id is None:
+                missing.append('MTRProfile "%s"' % profile)
+
+        if missing:
+            errors.append((line, 'unknown ' + ', '.join(missing)))
+            continue
+
+        values = tuple(getattr(obj, name) for name in LAYERED_IDS)
+        if obj.group_id is not None:
+            values = overlay(values, groupValues.get(obj.group_id))
+        missing = missingTables(values)
+        if missing:
+            errors.append((line, 'no ' + ', '.join(missing)))
+            continue
+
+        batch.append((line, obj))
+        if len(batch) >= batchSize:
+            created += _insertBatch(batch, tenant, errors, dryRun)
+            batch = []
+
+    if batch:
+        created += _insertBatch(batch, tenant, errors, dryRun)
+
+    return created, errors
+
+def _insertBatch(batch, tenant, errors, dryRun):
+    existing = set(terminal.objects.filter(
+        tenant=tenant,
+        term_id__in=[obj.term_id for line, obj in batch],
+    ).values_list('term_id', flat=True))
+
+    objs = []
+    for line, obj in batch:
+        if obj.term_id in existing:
+            errors.append((line, 'term_id %s already exists' % obj.term_id))
+        else:
+            objs.append(obj)
+
+    if objs and not dryRun:
+        with transaction.atomic():
+            terminal.objects.bulk_create(objs)
+            refreshEffective(terminal.objects.filter(tenant=tenant, term_id__in=[obj.term_id for obj in objs]))
+
+    return len(objs)
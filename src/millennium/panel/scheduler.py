@@ -0,0 +1,98 @@
+from django.db import transaction
+from django.utils import timezone
+from millennium.panel.models import Activation, PendingDownload, TerminalGroup, terminal
+from millennium.panel.models.Activation import ACTIVATED_TABLES
+from millennium.panel.layering import descendants, refreshEffective
+from millennium.panel.framebuilder import encodeShared, SHARED_TABLES
+import datetime
+
+# How long before their effective date activations get their frames encoded
+STAGE_AHEAD = datetime.timedelta(hours=12)
+
+def targetTerminals(activation):
+    if activation.group_id is not None:
+        return terminal.objects.filter(group__in=descendants(activation.group))
+    return terminal.objects.filter(pk=activation.terminal_id)
+
+def switchedTables(activation):
+    return {
+        name: getattr(activation, name + '_id')
+        for name in ACTIVATED_TABLES
+        if getattr(activation, name + '_id') is not None
+    }
+
+def stage(activation):
+    # Encodes the new tables for every MTR profile among the affected
+    # terminals, so the switch finds their frames in the frame store (the
+    # tables with an encoder, see Activation). Returns the number of
+    # frames, or None if the activation was staged or activated meanwhile.
+    tables = switchedTables(activation)
+    profiles = set(targetTerminals(activation).values_list('effective__MTRProfile_id', flat=True).distinct())
+
+    frames = encodeShared({
+        model: {(profileId, tables[model.__name__]) for profileId in profiles}
+        for model in SHARED_TABLES
+        if model.__name__ in tables
+    })
+
+    if not Activation.objects.filter(pk=activation.pk, state='scheduled').update(state='staged', staged_at=timezone.now()):
+        return None
+    return len(frames)
+
+def activate(activation):
+    # Switches the group or terminal, refreshes the effective configuration
+    # below it and queues the tables that changed for download, all in one
+    # transaction. Returns the number of terminals affected, or None if the
+    # activation was activated or failed meanwhile.
+    with transaction.atomic():
+        activation = Activation.objects.select_for_update().get(pk=activation.pk)
+        if activation.state not in ('scheduled', 'staged'):
+            return None
+
+        # update() rather than save(): the refresh happens right here
+        tables = {name + '_id': tableId for name, tableId in switchedTables(activation).items()}
+        if activation.group_id is not None:
+            TerminalGroup.objects.filter(pk=activation.group_id).update(**tables)
+        else:
+            terminal.objects.filter(pk=activation.terminal_id).update(**tables)
+
+        changes = {}
+        refreshEffective(targetTerminals(activation), changes)
+
+        PendingDownload.objects.bulk_create([
+            PendingDownload(terminal_id=terminalId, table=name, activation=activation)
+            for terminalId, names in changes.items()
+            for name in names
+            if name in ACTIVATED_TABLES
+        ], batch_size=500, ignore_conflicts=True)
+
+        activation.state = 'active'
+        activation.activated_at = timezone.now()
+        activation.save(update_fields=['state', 'activated_at'])
+
+    return len(changes)
+
+def runActivations(now=None, stageAhead=STAGE_AHEAD):
+    # Stages activations due within stageAhead and activates the ones that
+    # are due. Meant to run every minute or so. Returns (staged, activated),
+    # not counting activations another run got to first.
+    now = now or timezone.now()
+    staged = activated = 0
+
+    for activation in Activation.objects.filter(state='scheduled', effective_date__lte=now + stageAhead).order_by('effective_date'):
+        if activation.effective_date > now and _run(stage, activation) is not None:
+            staged += 1
+
+    for activation in Activation.objects.filter(state__in=('scheduled', 'staged'), effective_date__lte=now).order_by('effective_date'):
+        if _run(activate, activation) is not None:
+            activated += 1
+
+    return staged, activated
+
+def _run(step, activation):
+    # The step's result, None if it did nothing or failed
+    try:
+        return step(activation)
+    except Exception as e:
+        Activation.objects.filter(pk=activation.pk).update(state='failed', error='%s: %s' % (type(e).__name__, e))
+        return None
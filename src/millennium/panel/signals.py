@@ -1,6 +1,12 @@
 from django.contrib.auth.signals import user_logged_in
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.conf import settings
+from millennium.panel.models import FconfigOpts, InstallParms, CoinValTable, CoinValDefs, CardTable, CardDefs, NPANXXTable, MTRProfile, TerminalGroup, terminal
+from millennium.panel.cardindex import invalidateCardIndex
+from millennium.panel.contentstore import scheduleIntern
+from millennium.panel.mtr import invalidateMTRConfigs
+from millennium.panel.layering import scheduleRefresh
 
 @receiver(user_logged_in)
 def sig_user_logged_in(sender, user, request, **kwargs):
@@ -8,3 +14,40 @@ def sig_user_logged_in(sender, user, request, **kwargs):
         request.session['tenant'] = user.groups.all()[0].id
     except:
         request.session['tenant'] = None
+
+@receiver(post_save, sender=FconfigOpts)
+@receiver(post_save, sender=InstallParms)
+@receiver(post_save, sender=CoinValTable)
+@receiver(post_save, sender=CardTable)
+@receiver(post_save, sender=NPANXXTable)
+def sig_table_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        scheduleIntern(instance)
+
+@receiver(post_save, sender=CoinValDefs)
+@receiver(post_delete, sender=CoinValDefs)
+def sig_coinvaldefs_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        scheduleIntern(instance.coinValTable)
+
+@receiver(post_save, sender=CardDefs)
+@receiver(post_delete, sender=CardDefs)
+def sig_carddefs_changed(sender, instance, raw=False, **kwargs):
+    invalidateCardIndex(instance.cardTable_id)
+    if not raw:
+        scheduleIntern(instance.cardTable)
+
+@receiver(post_delete, sender=CardTable)
+def sig_cardtable_deleted(sender, instance, **kwargs):
+    invalidateCardIndex(instance.pk)
+
+@receiver(post_save, sender=MTRProfile)
+@receiver(post_delete, sender=MTRProfile)
+def sig_mtrprofile_changed(sender, instance, **kwargs):
+    invalidateMTRConfigs()
+
+@receiver(post_save, sender=TerminalGroup)
+@receiver(post_save, sender=terminal)
+def sig_layer_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        scheduleRefresh(instance)
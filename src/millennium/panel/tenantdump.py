@@ -0,0 +1,204 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from millennium.panel.models import *
+from millennium.panel.contentstore import DEDUPLICATED, internTables
+from millennium.panel.layering import refreshEffective
+import datetime
+import json
+
+FORMAT = 'millennium-tenant'
+VERSION = 2
+
+# Export order: every model comes after the models it refers to, so the
+# importer can remap foreign keys while streaming.
+TENANT_MODELS = (
+    NCCTermParms,
+    InstallParms,
+    FconfigOpts,
+    CoinValTable,
+    CardTable,
+    RateTable,
+    NPANXXTable,
+    CoinValDefs,
+    CardDefs,
+    RateDefs,
+    TerminalGroup,
+    terminal,
+)
+
+# Recomputed on import, never exported; EffectiveConfig rows are derived
+# from terminals and groups as a whole
+DERIVED_FIELDS = ('blob',)
+
+# Shared models tenant rows may refer to, by the unique field they are
+# exported as: their ids differ from one instance to the next
+NATURAL_KEYS = {
+    MTRProfile: 'name',
+}
+
+BATCH_SIZE = 1000
+
+class DumpEncoder(DjangoJSONEncoder):
+    # DjangoJSONEncoder rounds times to milliseconds; a dump has to be lossless
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super(DumpEncoder, self).default(o)
+
+def exportTenant(tenant, chunkSize=2000):
+    # Yields one JSON document per line; memory use does not depend on the
+    # size of the tenant.
+    yield json.dumps({'format': FORMAT, 'version': VERSION, 'tenant': tenant.name}) + '\n'
+
+    naturalKeys = {related: dict(related.objects.values_list('pk', key)) for related, key in NATURAL_KEYS.items()}
+
+    for model in TENANT_MODELS:
+        tenantPath = tenantLookup(model)
+        exclude = {model._meta.pk.attname, 'tenant_id'} | {model._meta.get_field(name).attname for name in DERIVED_FIELDS if hasField(model, name)}
+        natural = [field for field in model._meta.concrete_fields if field.is_relation and field.related_model in NATURAL_KEYS]
+
+        rows = model.objects.filter(**{tenantPath: tenant}).order_by('pk').values().iterator(chunk_size=chunkSize)
+        selfRef = selfReference(model)
+        if selfRef is not None:
+            rows = parentsFirst(rows, model._meta.pk.attname, selfRef.attname)
+
+        for row in rows:
+            fields = {key: value for key, value in row.items() if key not in exclude}
+            for field in natural:
+                value = fields.pop(field.attname)
+                fields[field.name] = None if value is None else naturalKeys[field.related_model][value]
+            yield json.dumps({
+                'model': model.__name__,
+                'pk': row[model._meta.pk.attname],
+                'fields': fields,
+            }, cls=DumpEncoder, separators=(',', ':')) + '\n'
+
+def importTenant(lines, tenant, batchSize=BATCH_SIZE):
+    # Everything is inserted with bulk_create inside a single transaction.
+    # Tables are matched back to their new primary keys by their (name,
+    # tenant) key, so this works on backends that do not return ids from
+    # bulk inserts.
+    models = {model.__name__: model for model in TENANT_MODELS}
+    pkMap = {model: {} for model in TENANT_MODELS}
+    for related, key in NATURAL_KEYS.items():
+        pkMap[related] = dict(related.objects.values_list(key, 'pk'))
+    counts = {}
+    batch = []
+    batchModel = None
+
+    with transaction.atomic():
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            if number == 1:
+                if record.get('format') != FORMAT or record.get('version') != VERSION:
+                    raise ValueError('Not a %s v%d dump' % (FORMAT, VERSION))
+                continue
+
+            model = models.get(record['model'])
+            if model is None:
+                raise ValueError('line %d: unknown model %s' % (number, record['model']))
+
+            if model is not batchModel or len(batch) >= batchSize or refersToBatch(model, record['fields'], pkMap):
+                _flush(batchModel, batch, tenant, pkMap, counts)
+                batch = []
+                batchModel = model
+
+            batch.append((record['pk'], buildInstance(model, record['fields'], tenant, pkMap)))
+
+        _flush(batchModel, batch, tenant, pkMap, counts)
+
+        for model in DEDUPLICATED:
+            internTables(model.objects.filter(tenant=tenant))
+
+        refreshEffective(terminal.objects.filter(tenant=tenant))
+
+    return counts
+
+def buildInstance(model, fields, tenant, pkMap):
+    values = {}
+
+    for field in model._meta.concrete_fields:
+        # Shared models are referred to by their natural key
+        name = field.name if field.related_model in NATURAL_KEYS else field.attname
+        if name not in fields:
+            continue
+        value = fields[name]
+
+        if field.is_relation:
+            if field.related_model in pkMap and value is not None:
+                try:
+                    value = pkMap[field.related_model][value]
+                except KeyError:
+                    if field.related_model in NATURAL_KEYS:
+                        raise ValueError('%s refers to %s "%s", which does not exist here' % (model.__name__, field.related_model.__name__, value))
+                    raise ValueError('%s refers to missing %s %s' % (model.__name__, field.related_model.__name__, value))
+        elif value is not None:
+            value = field.to_python(value)
+
+        values[field.attname] = value
+
+    if hasField(model, 'tenant'):
+        values['tenant_id'] = tenant.id
+
+    return model(**values)
+
+def _flush(model, batch, tenant, pkMap, counts):
+    if not batch:
+        return
+
+    model.objects.bulk_create([obj for oldPk, obj in batch])
+    counts[model.__name__] = counts.get(model.__name__, 0) + len(batch)
+
+    # Only the tables are referred to by other rows
+    if hasField(model, 'name') and hasField(model, 'tenant'):
+        names = {obj.name: oldPk for oldPk, obj in batch}
+        for name, newPk in model.objects.filter(tenant=tenant, name__in=list(names)).values_list('name', 'pk'):
+            pkMap[model][names[name]] = newPk
+
+def selfReference(model):
+    for field in model._meta.concrete_fields:
+        if field.is_relation and field.related_model is model:
+            return field
+    return None
+
+def parentsFirst(rows, pkName, parentName):
+    # Rows of a self-referencing model (few, e.g. groups), each one after
+    # the row it refers to
+    rows = list(rows)
+    byPk = {row[pkName]: row for row in rows}
+
+    def depth(row):
+        seen = set()
+        while row[parentName] in byPk and row[pkName] not in seen:
+            seen.add(row[pkName])
+            row = byPk[row[parentName]]
+        return len(seen)
+
+    return sorted(rows, key=depth)
+
+def refersToBatch(model, fields, pkMap):
+    # A row pointing at a row of its own model that is not inserted yet
+    field = selfReference(model)
+    return field is not None and fields.get(field.attname) is not None and fields[field.attname] not in pkMap[model]
+
+def tenantLookup(model):
+    if hasField(model, 'tenant'):
+        return 'tenant'
+
+    # Child definitions belong to the tenant of their table
+    for field in model._meta.concrete_fields:
+        if field.is_relation and hasField(field.related_model, 'tenant'):
+            return field.name + '__tenant'
+
+    raise ValueError('%s is not tenant-scoped' % model.__name__)
+
+def hasField(model, name):
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
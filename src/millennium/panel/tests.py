@@ -1,3 +1,1470 @@
-from django.test import TestCase
+from django.apps import apps
+from django.contrib import admin
+from django.contrib.auth.models import Group, User
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, OperationalError, connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from millennium.panel.models import *
+from millennium.panel.models.NPANXXTable import NXX_FIELDS, NXX_RANGE
+from millennium.panel import contentstore
+from millennium.panel.contentstore import getFrame
+from millennium.panel.changelists import EstimatedCountPaginator
+from millennium.panel.campaigns import Job, planJobs
+from millennium.panel.cashbox import forecastCashboxes, recordCoinEvents
+from millennium.panel.cdr import CDR_RECORD, CDRDecoder, CDRWriter, encodeRecord
+from millennium.panel import cardindex
+from millennium.panel.cardindex import CardRangeIndex, getCardIndex
+from millennium.panel.cardvalidation import luhnValid, validatorFor, validateCardTable
+from millennium.panel.cloning import cloneTables
+from millennium.panel.dialog import *
+from millennium.panel import events
+from millennium.panel.events import EventCoalescer
+from millennium.panel.framebuilder import SHARED_TABLES, buildFrames, loadTables
+from millennium.panel.forms import NPANXXGridField, NPANXXGridWidget, NPANXXTableForm, packNXX
+from millennium.panel.framehelpers import mmHextel
+from millennium.panel.layering import refreshEffective, refreshGroup
+from millennium.panel.metrics import metrics, prometheusText, serveMetrics
+from millennium.panel import lines
+from millennium.panel.lines import CLOSED, LineManager, inBackground
+from millennium.panel import mtr
+from millennium.panel.mtr import getMTRConfig, invalidateMTRConfigs
+from millennium.panel import perfstats
+from millennium.panel.perfstats import blockSamples, recordSamples
+from millennium.panel.provisioning import importTerminals
+from millennium.panel import scheduler
+from millennium.panel.scheduler import activate, runActivations, stage
+from millennium.panel.tenantdump import exportTenant, importTenant
+from millennium.panel import transport
+from millennium.panel.transport import MAX_PACKET_RETRIES, MAX_PAYLOAD, WINDOW, FrameSender, LinkError, PacketDecoder, linkTiming
+from importlib import import_module
+import asyncio
+import datetime
+import errno
+import json
+import os
+import random
+import struct
+import sys
+import time
+import tracemalloc
+import urllib.error
+import urllib.request
+from unittest import mock, skipUnless
+from urllib.parse import parse_qsl
 
 # Create your tests here.
+
+# Benchmarks for the frame encoders. The fixtures below are fixed, so the
+# frames they encode to are too: a change in any encoder or helper shows
+# up as a golden frame mismatch. Throughput and allocation limits are set
+# well below what a development machine does, so that only real
+# regressions trip them; the measured numbers are printed at the end.
+# They depend on the machine and its load, so they are only checked with
+# PANEL_BENCHMARKS=1 in the environment; golden frames and query counts
+# always are.
+BENCHMARKS = os.environ.get('PANEL_BENCHMARKS', '') not in ('', '0')
+benchmark = skipUnless(BENCHMARKS, 'timing and allocation limits need PANEL_BENCHMARKS=1')
+
+MTR_PROFILES = ('MTR 1.x', 'MTR 2.x')
+ENCODED_TABLES = ('NCCTermParms',) + tuple(model.__name__ for model in SHARED_TABLES)
+
+FRAMES_PER_RUN = 200
+MIN_FRAMES_PER_SECOND = {
+    'NCCTermParms': 10000,
+    'InstallParms': 10000,
+    'FconfigOpts': 2000,
+    'CoinValTable': 1000,
+    'CardTable': 1000,
+}
+MIN_TERMINALS_PER_SECOND = 2000
+# Queries to build the frames of 600 terminals on both MTR versions, with
+# the frames in the content store but not in memory
+BUILD_QUERIES = 20
+MAX_PEAK_BYTES = 16 * 1024
+MAX_RETAINED_BYTES = 4 * 1024
+
+# (table, MTR profile): frame, as hex
+GOLDEN = {
+    ('NCCTermParms', 'MTR 1.x'): '15000000000015145551111000001514555111100000',
+    ('InstallParms', 'MTR 1.x'): '1f27270e0000000000000c0828002c0109000000000000',
+    ('FconfigOpts', 'MTR 1.x'): '1a020105050101000f0008000000000000000000000000000101010808030605007800050a002d000000000000000000010e00000e05050000f4016400e803320032002c0108055a0000',
+    ('CoinValTable', 'MTR 1.x'): '3200050a0f14191e23282d32373c41464b0a000b000c000d000e000f00100011001200130014001500160017001800190003030303030303030303030303030303405158020041a861000058025802000000000000000000000000',
+    ('CardTable', 'MTR 1.x'): '164000004999990102000000101e201e000e000e000e000e000e000e000e000e0000510000559999010000000001000000000005000000000000000000000000000000',
+    ('NCCTermParms', 'MTR 2.x'): '150000000000151455511110000015145551111000001234000056780000',
+    ('InstallParms', 'MTR 2.x'): '1f27270e0000000000000c0828002c010900000000000000',
+    ('FconfigOpts', 'MTR 2.x'): '1a020105050101000f000102020000000000000000000101010808000605007800050a002d000000000000000000010e00000e05050000f4016400e803320032002c0108055a0000',
+    ('CoinValTable', 'MTR 2.x'): '3200050a0f14191e23282d32373c41464b0a000b000c000d000e000f00100011001200130014001500160017001800190003030303030303030303030303030303405158020041a861000058025802000000000000000000000000',
+    ('CardTable', 'MTR 2.x'): '164000004999990102000000101e201e000e000e000e000000000000000000000000510000559999010000000001000000000005000000000000000000000000000000000000',
+}
+
+results = []
+
+def createFixtures(tenant):
+    # One of every vital table, with the child definitions the encoders read
+    tables = {
+        'NCCTermParms': NCCTermParms.objects.create(name='bench', tenant=tenant, cad_id='1234', cpe_id='5678'),
+        'InstallParms': InstallParms.objects.create(name='bench', tenant=tenant, access_code='2727', predial_string='9', tx_pkt_delay=12, rx_pkt_gap=8, retries_till_oos=40),
+        'FconfigOpts': FconfigOpts.objects.create(name='bench', tenant=tenant),
+        'CoinValTable': CoinValTable.objects.create(name='bench', tenant=tenant),
+        'CardTable': CardTable.objects.create(name='bench', tenant=tenant),
+        'RateTable': RateTable.objects.create(name='bench', tenant=tenant, effective_date=datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc), telco=1),
+    }
+
+    npa = NPANXXTable(name='bench', tenant=tenant, npa=514)
+    for nxx in range(200, 1000):
+        setattr(npa, 'npa_%d' % nxx, nxx % 7)
+    npa.save()
+    tables['NPANXXTable'] = npa
+
+    for i in range(16):
+        CoinValDefs.objects.create(coinValTable=tables['CoinValTable'], order=i, coin_value=5 * i, coin_volume=10 + i, coin_val_parms=['01', '02'])
+    CardDefs.objects.create(cardTable=tables['CardTable'], order=0, pan_low=400000, pan_high=499999, standard_id=1, control_inf=['02'], service_code_1=101, service_code_2=201)
+    CardDefs.objects.create(cardTable=tables['CardTable'], order=1, pan_low=510000, pan_high=559999, standard_id=1, check_digit_1=1, check_value_1=5)
+
+    # As the encoders get them from the database
+    return {name: type(table).objects.get(pk=table.pk) for name, table in tables.items()}
+
+def createTerminals(tenant, tables, count, profile=None, start=5145550000):
+    terminal.objects.bulk_create([
+        terminal(term_id=str(start + i), tenant=tenant, MTRProfile=profile, **tables)
+        for i in range(count)
+    ])
+    refreshEffective(terminal.objects.filter(tenant=tenant))
+
+def tableFrame(table, config):
+    if isinstance(table, NCCTermParms):
+        return bytes(table.getFrame(config, None))
+    return bytes(table.getFrame(config))
+
+class FrameBenchmarks(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='bench')
+        cls.tables = createFixtures(cls.tenant)
+        cls.profiles = {profile.name: profile for profile in MTRProfile.objects.filter(name__in=MTR_PROFILES)}
+
+    @classmethod
+    def tearDownClass(cls):
+        super(FrameBenchmarks, cls).tearDownClass()
+        if results:
+            sys.stderr.write('\n')
+            for line in sorted(results):
+                sys.stderr.write(line + '\n')
+
+    def setUp(self):
+        invalidateMTRConfigs()
+        contentstore._frames.clear()
+
+    def config(self, name):
+        return getMTRConfig(self.profiles[name].pk)
+
+    def fresh(self, table):
+        # getFrame() interns the instance, which a rollback does not undo
+        instance = self.tables[table]
+        return type(instance).objects.get(pk=instance.pk)
+
+    def loaded(self, table):
+        # The table as the frame builder loads it, child definitions included
+        instance = self.tables[table]
+        return loadTables(type(instance), [instance.pk])[instance.pk]
+
+    def test_profiles(self):
+        self.assertEqual(sorted(self.profiles), sorted(MTR_PROFILES))
+        self.assertEqual([self.config(name).MTR for name in MTR_PROFILES], [1, 2])
+
+    def test_golden_frames(self):
+        for name in MTR_PROFILES:
+            for table in ENCODED_TABLES:
+                with self.subTest(table=table, profile=name):
+                    self.assertEqual(tableFrame(self.tables[table], self.config(name)).hex(), GOLDEN[table, name])
+
+    def test_legacy_dicts(self):
+        # MTRconfig dicts as callers built them before MTR profiles: only
+        # the constants of one MTR version, some of them None
+        legacy = {name: value for name, value in json.loads(self.config('MTR 1.x').key).items() if name not in ('AMP_STRING_LEN', 'SPILL_STR_SIZE')}
+        legacy['DLOG_NUM_CARD_TYPES'] = None
+        for table in ENCODED_TABLES:
+            with self.subTest(table=table):
+                self.assertEqual(tableFrame(self.tables[table], legacy).hex(), GOLDEN[table, 'MTR 1.x'])
+                if table != 'NCCTermParms':
+                    self.assertEqual(getFrame(self.fresh(table), legacy).hex(), GOLDEN[table, 'MTR 1.x'])
+
+    def test_layout_sizes(self):
+        # The layouts the frame builder splices into must match the frames
+        for name in MTR_PROFILES:
+            config = self.config(name)
+            for table in ENCODED_TABLES:
+                # Card tables are as long as their definitions
+                if table in config.layouts:
+                    with self.subTest(table=table, profile=name):
+                        self.assertEqual(len(tableFrame(self.tables[table], config)), config.sizes[table])
+
+    def test_content_store(self):
+        # Cached or not, getFrame returns what the encoder does
+        for name in MTR_PROFILES:
+            config = self.config(name)
+            for table in ENCODED_TABLES:
+                if table == 'NCCTermParms':
+                    continue
+                with self.subTest(table=table, profile=name):
+                    expected = bytes.fromhex(GOLDEN[table, name])
+                    instance = self.fresh(table)
+                    self.assertEqual(getFrame(instance, config), expected)
+                    self.assertEqual(getFrame(instance, config), expected)
+
+    @benchmark
+    def test_throughput(self):
+        for name in MTR_PROFILES:
+            config = self.config(name)
+            for table in ENCODED_TABLES:
+                instance = self.loaded(table)
+                tableFrame(instance, config)
+
+                start = time.perf_counter()
+                for i in range(FRAMES_PER_RUN):
+                    tableFrame(instance, config)
+                rate = FRAMES_PER_RUN / (time.perf_counter() - start)
+
+                results.append('%-14s %s  %8.0f frames/s' % (table, name, rate))
+                with self.subTest(table=table, profile=name):
+                    self.assertGreater(rate, MIN_FRAMES_PER_SECOND[table])
+
+    @benchmark
+    def test_allocations(self):
+        for name in MTR_PROFILES:
+            config = self.config(name)
+            for table in ENCODED_TABLES:
+                instance = self.loaded(table)
+                tableFrame(instance, config)
+
+                tracemalloc.start()
+                try:
+                    for i in range(FRAMES_PER_RUN):
+                        tableFrame(instance, config)
+                    current, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+
+                results.append('%-14s %s  %8.0f bytes peak, %d retained' % (table, name, peak, current))
+                with self.subTest(table=table, profile=name):
+                    self.assertLess(peak, MAX_PEAK_BYTES)
+                    self.assertLess(current, MAX_RETAINED_BYTES)
+
+    def test_encoder_queries(self):
+        # Loaded by the frame builder, no encoder goes back to the database
+        for name in MTR_PROFILES:
+            config = self.config(name)
+            instances = [self.loaded(table) for table in ENCODED_TABLES]
+            with self.subTest(profile=name), self.assertNumQueries(0):
+                for instance in instances:
+                    tableFrame(instance, config)
+
+    def test_build_queries(self):
+        # Building frames costs the same number of queries for one terminal
+        # as for hundreds
+        createTerminals(self.tenant, self.tables, 300, self.profiles['MTR 1.x'])
+        createTerminals(self.tenant, self.tables, 300, self.profiles['MTR 2.x'], start=5145560000)
+        getMTRConfig(self.profiles['MTR 1.x'].pk)
+        getMTRConfig(self.profiles['MTR 2.x'].pk)
+
+        terminals = terminal.objects.filter(tenant=self.tenant)
+        with CaptureQueriesContext(connection) as single:
+            list(buildFrames(terminals.filter(term_id='5145550000')))
+        contentstore._frames.clear()
+        with self.assertNumQueries(BUILD_QUERIES):
+            frames = list(buildFrames(terminals))
+
+        self.assertEqual(len(frames), 600)
+        # Twice the profiles, at most twice the queries
+        self.assertLessEqual(BUILD_QUERIES, len(single) * 2)
+
+    @benchmark
+    def test_build_throughput(self):
+        createTerminals(self.tenant, self.tables, 300, self.profiles['MTR 1.x'])
+        createTerminals(self.tenant, self.tables, 300, self.profiles['MTR 2.x'], start=5145560000)
+        terminals = terminal.objects.filter(tenant=self.tenant)
+        list(buildFrames(terminals))
+
+        start = time.perf_counter()
+        list(buildFrames(terminals))
+        rate = 600 / (time.perf_counter() - start)
+        results.append('buildFrames    600 terminals  %8.0f terminals/s' % rate)
+        self.assertGreater(rate, MIN_TERMINALS_PER_SECOND)
+
+    def test_built_frames(self):
+        # The per-terminal frames match the golden ones, with the terminal
+        # ID spliced into NCCTermParms
+        createTerminals(self.tenant, self.tables, 2, self.profiles['MTR 2.x'])
+        for terminalId, termId, frames in buildFrames(terminal.objects.filter(tenant=self.tenant)):
+            for table in ENCODED_TABLES:
+                if table == 'NCCTermParms':
+                    config = self.config('MTR 2.x')
+                    expected = bytes.fromhex(GOLDEN[table, 'MTR 2.x'])
+                    start = config.offsets['NCCTermParms']['term_id']
+                    end = start + config.NCC_TERM_SIZE
+                    self.assertEqual(frames[table][:start], expected[:start])
+                    self.assertEqual(frames[table][start:end], bytes(mmHextel(termId, config.NCC_TERM_SIZE)))
+                    self.assertEqual(frames[table][end:], expected[end:])
+                else:
+                    self.assertEqual(frames[table].hex(), GOLDEN[table, 'MTR 2.x'])
+
+class TerminalImport(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='import')
+        cls.tables = createFixtures(cls.tenant)
+
+    def row(self, termId, **tables):
+        row = {name: 'bench' for name in ('NCCTermParms', 'InstallParms', 'FconfigOpts', 'CoinValTable', 'CardTable', 'RateTable', 'NPANXXTable')}
+        row.update(tables, term_id=termId)
+        return row
+
+    def test_validation(self):
+        created, errors = importTerminals([
+            self.row('5145550001'),
+            self.row('514555'),
+            self.row('5145550002', CardTable='nosuch'),
+            self.row('5145550003', NPANXXTable=''),
+            self.row('5145550004', MTRProfile='MTR 1.x'),
+        ], self.tenant)
+
+        self.assertEqual(created, 2)
+        self.assertEqual([line for line, message in errors], [3, 4, 5])
+        self.assertIn('term_id', errors[0][1])
+        self.assertEqual(errors[1][1], 'unknown CardTable "nosuch"')
+        self.assertEqual(errors[2][1], 'no NPANXXTable')
+        self.assertEqual(terminal.objects.get(term_id='5145550004').MTRProfile.name, 'MTR 1.x')
+        self.assertEqual(terminal.objects.get(term_id='5145550001').effective.CardTable_id, self.tables['CardTable'].pk)
+
+    def test_duplicates(self):
+        importTerminals([self.row('5145550001')], self.tenant)
+        created, errors = importTerminals([
+            self.row('5145550001'),
+            self.row('5145550002'),
+            self.row('5145550002'),
+        ], self.tenant, batchSize=1)
+
+        self.assertEqual(created, 1)
+        self.assertEqual(errors, [(2, 'term_id 5145550001 already exists'), (4, 'term_id 5145550002 appears more than once')])
+        self.assertEqual(terminal.objects.filter(tenant=self.tenant).count(), 2)
+
+    def test_dry_run(self):
+        created, errors = importTerminals([self.row('5145550001')], self.tenant, dryRun=True)
+        self.assertEqual((created, errors), (1, []))
+        self.assertFalse(terminal.objects.filter(tenant=self.tenant).exists())
+
+class TerminalPages(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='pages')
+        tables = createFixtures(cls.tenant)
+        createTerminals(cls.tenant, tables, 3)
+        terminal.objects.bulk_create([
+            terminal(term_id=termId, tenant=cls.tenant, **tables)
+            for termId in ('514-555-0001', '514-555-0002')
+        ])
+        cls.user = User.objects.create_superuser('pages', 'pages@example.com', 'pages')
+        cls.user.groups.add(cls.tenant)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        patcher = mock.patch.object(admin.site._registry[terminal], 'list_per_page', 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def page(self, cursor=None):
+        response = self.client.get(reverse('admin:millenniumpanel_terminal_changelist'), {'after': cursor} if cursor else {})
+        self.assertEqual(response.status_code, 200)
+        return response.context['cl']
+
+    def test_pages(self):
+        # Ordered by term_id, so the dashed ids come first; their cursors
+        # split on the last dash only
+        termIds = []
+        cl = self.page()
+        while True:
+            termIds.extend(row.term_id for row in cl.result_list)
+            if cl.next_page_url is None:
+                break
+            cl = self.page(dict(parse_qsl(cl.next_page_url[1:]))['after'])
+        self.assertEqual(termIds, ['514-555-0001', '514-555-0002', '5145550000', '5145550001', '5145550002'])
+        self.assertEqual(cl.result_count, 5)
+
+    def test_after_last(self):
+        last = terminal.objects.get(term_id='5145550002')
+        cl = self.page('5145550002-%d' % last.pk)
+        self.assertEqual(list(cl.result_list), [])
+        self.assertIsNone(cl.next_page_url)
+
+    def test_malformed_cursor(self):
+        # Hand edited cursors start over from the first page
+        for cursor in ('5145550000', '5145550000-x', '-'):
+            cl = self.page(cursor)
+            self.assertEqual([row.term_id for row in cl.result_list], ['514-555-0001', '514-555-0002'])
+
+    def test_estimated_count(self):
+        queryset = terminal.objects.filter(tenant=self.tenant).order_by('term_id', 'pk')
+        with mock.patch.object(EstimatedCountPaginator, 'threshold', 2):
+            paginator = EstimatedCountPaginator(queryset, 2)
+            self.assertEqual(paginator.count, 3)
+            self.assertTrue(paginator.estimated)
+
+            with mock.patch('millennium.panel.changelists.estimateCount', return_value=1000):
+                paginator = EstimatedCountPaginator(queryset, 2)
+                self.assertEqual(paginator.count, 1000)
+                self.assertTrue(paginator.estimated)
+
+        paginator = EstimatedCountPaginator(queryset, 2)
+        self.assertEqual(paginator.count, 5)
+        self.assertFalse(paginator.estimated)
+
+class NPANXXGrid(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='grid')
+        cls.table = createFixtures(cls.tenant)['NPANXXTable']
+
+    def form(self, grid, instance=None, **data):
+        data.update(name='grid', npa=613, grid=grid)
+        return NPANXXTableForm(data, instance=instance)
+
+    def test_fields(self):
+        fields = [field.name for field in NPANXXTable._meta.get_fields() if field.name.startswith('npa_')]
+        self.assertEqual(tuple(fields), NXX_FIELDS)
+        self.assertEqual(NPANXXTable._meta.get_field('npa_999').verbose_name, '999')
+        self.assertFalse(hasattr(NPANXXTable, '_nxx') or hasattr(NPANXXTable, '_field'))
+
+    def test_packing(self):
+        values = [nxx % 129 for nxx in NXX_RANGE]
+        packed = NPANXXGridWidget().format_value(values)
+        self.assertEqual(len(packed), 1600)
+        self.assertEqual(packed[:6], '474849')
+        self.assertEqual(NPANXXGridField().clean(packed), values)
+        self.assertEqual(NPANXXGridWidget().format_value(packed), packed)
+
+    def test_invalid_cells(self):
+        # The widget posts 'zz' for cells that are not a class
+        packed = packNXX([0] * 800)
+        with self.assertRaisesMessage(ValidationError, 'Invalid class for NXX 205, 999.'):
+            NPANXXGridField().clean(packed[:10] + 'zz' + packed[12:-2] + 'zz')
+        with self.assertRaisesMessage(ValidationError, 'Invalid class for NXX'):
+            NPANXXGridField().clean(packed[:-2])
+        with self.assertRaisesMessage(ValidationError, 'Classes must be between 0 and 128 (NXX 201).'):
+            NPANXXGridField().clean('0081' + packed[4:])
+
+    def test_fill(self):
+        form = self.form(packNXX([1] * 800), fill_from=300, fill_to=309, fill_value=3)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.instance.tenant = self.tenant
+        table = NPANXXTable.objects.get(pk=form.save().pk)
+        self.assertEqual((table.npa_299, table.npa_300, table.npa_309, table.npa_310), (1, 3, 3, 1))
+
+        form = self.form(packNXX([1] * 800), fill_from=999, fill_to=999, fill_value=128)
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual((form.instance.npa_998, form.instance.npa_999), (1, 128))
+
+    def test_invalid_fill(self):
+        packed = packNXX([1] * 800)
+        form = self.form(packed, fill_from=309, fill_to=300, fill_value=3)
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors.as_data()['__all__'][0].code, 'invalid_fill')
+
+        form = self.form(packed, fill_from=300, fill_value=3)
+        self.assertEqual(form.errors.as_data()['__all__'][0].code, 'incomplete_fill')
+
+        form = self.form(packed, fill_from=199, fill_to=1000, fill_value=129)
+        self.assertEqual(set(form.errors), {'fill_from', 'fill_to', 'fill_value'})
+
+    def test_round_trip(self):
+        form = NPANXXTableForm(instance=self.table)
+        packed = NPANXXGridWidget().format_value(form['grid'].value())
+        self.assertEqual(NPANXXGridField().clean(packed), [nxx % 7 for nxx in NXX_RANGE])
+
+        # Change one cell as the widget would and fill a range on top
+        packed = packed[:2 * 150] + '7f' + packed[2 * 151:]
+        form = self.form(packed, instance=self.table, fill_from=200, fill_to=201, fill_value=0)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+
+        table = NPANXXTable.objects.get(pk=self.table.pk)
+        self.assertEqual(table.npa, 613)
+        self.assertEqual(
+            [getattr(table, field) for field in NXX_FIELDS],
+            [0, 0] + [127 if nxx == 350 else nxx % 7 for nxx in NXX_RANGE[2:]],
+        )
+
+class TenantDump(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.source = Group.objects.create(name='source')
+        cls.target = Group.objects.create(name='target')
+        cls.tables = createFixtures(cls.source)
+        cls.profile = MTRProfile.objects.get(name='MTR 1.x')
+
+        parent = TerminalGroup.objects.create(name='parent', tenant=cls.source, MTRProfile=cls.profile)
+        TerminalGroup.objects.create(name='child', tenant=cls.source, parent=parent, CardTable=cls.tables['CardTable'])
+        createTerminals(cls.source, cls.tables, 3, cls.profile)
+        terminal.objects.filter(term_id='5145550002').update(group=parent)
+
+    def test_round_trip(self):
+        lines = list(exportTenant(self.source))
+        counts = importTenant(lines, self.target)
+
+        self.assertEqual(counts['terminal'], 3)
+        self.assertEqual(counts['CardDefs'], 2)
+        self.assertEqual(counts['CoinValDefs'], 16)
+        self.assertEqual(counts['TerminalGroup'], 2)
+
+        # Same content, new rows
+        for name, table in self.tables.items():
+            copy = type(table).objects.get(tenant=self.target, name=table.name)
+            self.assertNotEqual(copy.pk, table.pk)
+            if name in ENCODED_TABLES and name != 'NCCTermParms':
+                self.assertEqual(getFrame(copy, getMTRConfig(self.profile.pk)), getFrame(table, getMTRConfig(self.profile.pk)))
+        self.assertEqual(CardDefs.objects.filter(cardTable__tenant=self.target).count(), 2)
+
+        child = TerminalGroup.objects.get(tenant=self.target, name='child')
+        self.assertEqual(child.parent.name, 'parent')
+        self.assertEqual(child.parent.tenant, self.target)
+        self.assertEqual(child.CardTable.tenant, self.target)
+
+        copied = terminal.objects.get(tenant=self.target, term_id='5145550002')
+        self.assertEqual(copied.group.tenant, self.target)
+        self.assertEqual(copied.MTRProfile, self.profile)
+        self.assertEqual(copied.effective.NPANXXTable.tenant, self.target)
+
+    def test_profiles_by_name(self):
+        lines = list(exportTenant(self.source))
+        records = [json.loads(line) for line in lines[1:]]
+        self.assertEqual({record['fields']['MTRProfile'] for record in records if record['model'] == 'terminal'}, {'MTR 1.x'})
+
+        for record in records:
+            if record['model'] == 'terminal':
+                record['fields']['MTRProfile'] = 'MTR 9.x'
+        with self.assertRaisesMessage(ValueError, 'terminal refers to MTRProfile "MTR 9.x", which does not exist here'):
+            importTenant(lines[:1] + [json.dumps(record) for record in records], self.target)
+        self.assertFalse(terminal.objects.filter(tenant=self.target).exists())
+
+class TableCloning(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.source = Group.objects.create(name='source')
+        cls.targets = [Group.objects.create(name='target %d' % i) for i in range(3)]
+        cls.tables = createFixtures(cls.source)
+
+    def test_clone(self):
+        counts = cloneTables(self.tables.values(), self.targets)
+
+        self.assertEqual(counts['CoinValTable'], 3)
+        self.assertEqual(counts['CoinValDefs'], 48)
+        self.assertEqual(counts['CardDefs'], 6)
+        for tenant in self.targets:
+            copy = CoinValTable.objects.get(tenant=tenant, name='bench')
+            self.assertEqual(
+                list(copy.coinvaldefs_set.values_list('order', 'coin_value', 'coin_volume')),
+                list(self.tables['CoinValTable'].coinvaldefs_set.values_list('order', 'coin_value', 'coin_volume')),
+            )
+            self.assertEqual(copy.blob_id, self.tables['CoinValTable'].blob_id)
+
+    def test_existing_names(self):
+        # A table a tenant already has keeps its content and definitions
+        own = CardTable.objects.create(name='bench', tenant=self.targets[0])
+        counts = cloneTables([self.tables['CardTable'], self.tables['InstallParms']], self.targets)
+
+        self.assertEqual(counts, {'InstallParms': 3, 'CardTable': 2, 'CardDefs': 4})
+        self.assertEqual(CardTable.objects.get(tenant=self.targets[0], name='bench'), own)
+        self.assertFalse(own.carddefs_set.exists())
+
+        self.assertEqual(cloneTables([self.tables['CardTable']], self.targets), {})
+
+def withLuhn(digits):
+    return next(digits + check for check in '0123456789' if luhnValid(digits + check))
+
+class CardValidation(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        tenant = Group.objects.create(name='cards')
+        cls.table = CardTable.objects.create(name='cards', tenant=tenant)
+        # Check digits on a magnetic stripe card are never sent
+        CardDefs.objects.create(cardTable=cls.table, order=0, pan_low=400000, pan_high=499999, standard_id=1, expiry_date_pos=0, service_code_1=101, check_digit_1=1, check_value_1=9)
+        # 200 is a card byte, and the 7th value has no position
+        CardDefs.objects.create(cardTable=cls.table, order=1, pan_low=510000, pan_high=559999, standard_id=1, expiry_date_pos=0, check_digit_1=2, check_value_1=1, check_digit_2=3, check_value_2=200, check_value_7=3)
+
+    def validate(self, *batch):
+        return [errors for card, errors in validatorFor(self.table, datetime.date(2020, 6, 1)).validateMany(batch)]
+
+    def test_magnetic_stripe(self):
+        pan = withLuhn('412345678901234')
+        wrong = pan[:-1] + str((int(pan[-1]) + 1) % 10)
+        self.assertEqual(self.validate(pan, pan + '=2512101', pan + '=2512201', pan + '=2005101', wrong), [
+            [],
+            [],
+            ['service code 201 not accepted'],
+            ['expired'],
+            ['check digit mismatch'],
+        ])
+
+    def test_smartcard(self):
+        good = withLuhn('515555555555555')
+        bad = withLuhn('525555555555555')
+        self.assertEqual(self.validate(good, good + '=2512201', bad), [
+            [],
+            # No service codes for smartcards
+            [],
+            ['digit 2 is not 1'],
+        ])
+
+    def test_non_ascii_digits(self):
+        self.assertFalse(luhnValid('\u0661\u0662\u0663'))
+        self.assertFalse(luhnValid('4111x1111'))
+        self.assertEqual(self.validate('\u0665\u0661\u0665\u0665\u0665\u0665\u0665\u0665'), [['card number is not numeric']])
+
+    def test_table(self):
+        self.assertEqual(validateCardTable(self.table), ['Card 0: check digits are only sent for smartcards (no 1st service code)'])
+
+class CardRanges(TestCase):
+
+    def card(self, order, low, high):
+        return CardDefs(order=order, pan_low=low, pan_high=high)
+
+    def test_edges(self):
+        low = self.card(0, 400000, 499999)
+        single = self.card(1, 500000, 500000)
+        adjacent = self.card(2, 500001, 519999)
+        index = CardRangeIndex([low, single, adjacent, self.card(3, 600000, 599999)])
+
+        self.assertEqual(index.lookupMany(['3999999999', '4000000000', '4999999999', '5000000000', '5000010000', '5199999999', '5200000000', '5999999999', '6000000000']), [
+            None, low, low, single, adjacent, adjacent, None, None, None,
+        ])
+        self.assertEqual(index.lookupPrefix(0), None)
+        self.assertIs(index.lookup(4123456789), low)
+        self.assertEqual(index.lookupMany(['41234', '41234x789', '']), [None, None, None])
+        self.assertIsNone(CardRangeIndex([]).lookup('4123456789'))
+
+    def test_overlaps(self):
+        # The first definition in table order that covers a card wins
+        outer = self.card(0, 400000, 499999)
+        inner = self.card(1, 450000, 459999)
+        index = CardRangeIndex([outer, inner])
+        self.assertEqual(index.lookupMany(['449999', '450000', '459999', '460000']), [outer] * 4)
+
+        inner, outer = self.card(0, 450000, 459999), self.card(1, 400000, 499999)
+        index = CardRangeIndex([inner, outer])
+        self.assertEqual(index.lookupMany(['449999', '450000', '459999', '460000', '499999']), [outer, inner, inner, outer, outer])
+
+        first, second = self.card(0, 400000, 459999), self.card(1, 450000, 499999)
+        index = CardRangeIndex([first, second])
+        self.assertEqual(index.lookupMany(['449999', '459999', '460000', '500000']), [first, first, second, None])
+
+    def test_invalidation(self):
+        tenant = Group.objects.create(name='ranges')
+        table = CardTable.objects.create(name='ranges', tenant=tenant)
+        card = CardDefs.objects.create(cardTable=table, order=0, pan_low=400000, pan_high=499999)
+
+        index = getCardIndex(table)
+        with self.assertNumQueries(0):
+            self.assertIs(getCardIndex(table), index)
+
+        card.pan_high = 449999
+        card.save()
+        self.assertIsNone(getCardIndex(table).lookup('4500000000'))
+
+        other = CardDefs.objects.create(cardTable=table, order=1, pan_low=450000, pan_high=459999)
+        self.assertEqual(getCardIndex(table).lookup('4500000000'), other)
+
+        other.delete()
+        self.assertIsNone(getCardIndex(table).lookup('4500000000'))
+
+        # The ids of deleted tables can come back
+        getCardIndex(table)
+        tableId = table.pk
+        table.delete()
+        self.assertNotIn(tableId, cardindex._indexes)
+
+class MTRProfiles(TestCase):
+
+    def setUp(self):
+        invalidateMTRConfigs()
+
+    def test_changed_elsewhere(self):
+        # update() sends no signals, like a save in another process
+        profile = MTRProfile.objects.get(name='MTR 1.x')
+        self.assertEqual(getMTRConfig(profile.pk).NCC_TERM_SIZE, 5)
+        MTRProfile.objects.filter(pk=profile.pk).update(ncc_term_size=7, modified=profile.modified + datetime.timedelta(seconds=1))
+        self.assertEqual(getMTRConfig(profile.pk).NCC_TERM_SIZE, 5)
+
+        with mock.patch.object(mtr, 'MTR_CONFIG_TTL', 0):
+            self.assertEqual(getMTRConfig(profile.pk).NCC_TERM_SIZE, 7)
+            config = getMTRConfig(None)
+            MTRProfile.objects.update(default=False)
+            MTRProfile.objects.filter(pk=profile.pk).update(default=True)
+            self.assertEqual(config.MTR, 2)
+            self.assertEqual(getMTRConfig(None), getMTRConfig(profile.pk))
+
+    def test_single_default(self):
+        profile = MTRProfile.objects.get(name='MTR 1.x')
+        profile.default = True
+        with self.assertRaises(ValidationError):
+            profile.full_clean()
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            profile.save()
+
+class Activations(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='activations')
+        cls.tables = createFixtures(cls.tenant)
+        cls.group = TerminalGroup.objects.create(name='group', tenant=cls.tenant, **{name: table for name, table in cls.tables.items() if name != 'NCCTermParms'})
+        for i in range(3):
+            terminal.objects.create(term_id=str(5145550000 + i), tenant=cls.tenant, group=cls.group, NCCTermParms=cls.tables['NCCTermParms'])
+        refreshEffective(terminal.objects.filter(tenant=cls.tenant))
+        cls.installs = InstallParms.objects.create(name='next', tenant=cls.tenant, access_code='1111')
+        cls.now = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def schedule(self, **tables):
+        return Activation.objects.create(tenant=self.tenant, group=self.group, effective_date=self.now + datetime.timedelta(hours=1), **tables)
+
+    def test_transitions(self):
+        activation = self.schedule(InstallParms=self.installs)
+
+        self.assertEqual(runActivations(self.now), (1, 0))
+        activation.refresh_from_db()
+        self.assertEqual(activation.state, 'staged')
+        self.assertIsNotNone(activation.staged_at)
+        self.assertEqual(ConfigBlob.objects.filter(kind='frame', source__installparms=self.installs).count(), 1)
+        self.assertEqual(runActivations(self.now), (0, 0))
+
+        later = self.now + datetime.timedelta(hours=2)
+        self.assertEqual(runActivations(later), (0, 1))
+        activation.refresh_from_db()
+        self.assertEqual(activation.state, 'active')
+        self.assertEqual(set(EffectiveConfig.objects.filter(terminal__tenant=self.tenant).values_list('InstallParms', flat=True)), {self.installs.pk})
+        self.assertEqual(list(PendingDownload.objects.filter(activation=activation).values_list('table', flat=True).distinct()), ['InstallParms'])
+        self.assertEqual(PendingDownload.objects.filter(activation=activation).count(), 3)
+
+        # Done once only
+        self.assertIsNone(activate(activation))
+        self.assertEqual(runActivations(later), (0, 0))
+
+    def test_unchanged_terminals(self):
+        # Switching to the tables in place activates, but queues nothing
+        activation = self.schedule(CardTable=self.tables['CardTable'])
+        self.assertEqual(runActivations(self.now + datetime.timedelta(hours=2)), (0, 1))
+        self.assertEqual(Activation.objects.get(pk=activation.pk).state, 'active')
+        self.assertFalse(PendingDownload.objects.exists())
+
+    def test_card_table(self):
+        cards = CardTable.objects.create(name='next', tenant=self.tenant)
+        CardDefs.objects.create(cardTable=cards, order=0, pan_low=600000, pan_high=699999, standard_id=1, service_code_1=101)
+        activation = self.schedule(CardTable=cards)
+
+        self.assertEqual(stage(activation), 1)
+        self.assertEqual(ConfigBlob.objects.filter(kind='frame', source__cardtable=cards).count(), 1)
+
+        # The switch and the next call-in find the staged frame
+        contentstore._frames.clear()
+        with mock.patch.object(CardTable, 'getFrame', side_effect=AssertionError('encoded again')):
+            activate(activation)
+            frames = list(buildFrames(terminal.objects.filter(tenant=self.tenant)))
+        self.assertEqual({terminalFrames['CardTable'] for terminalId, termId, terminalFrames in frames}, {getFrame(cards, getMTRConfig(None))})
+
+    def test_failure(self):
+        activation = self.schedule(InstallParms=self.installs)
+        with mock.patch.object(scheduler, 'encodeShared', side_effect=RuntimeError('no frames')):
+            self.assertEqual(runActivations(self.now), (0, 0))
+        activation.refresh_from_db()
+        self.assertEqual((activation.state, activation.error), ('failed', 'RuntimeError: no frames'))
+        self.assertEqual(runActivations(self.now + datetime.timedelta(hours=2)), (0, 0))
+
+class EventIngestion(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='events')
+        tables = createFixtures(cls.tenant)
+        createTerminals(cls.tenant, tables, 2)
+        cls.first, cls.second = terminal.objects.filter(tenant=cls.tenant).order_by('term_id').values_list('pk', flat=True)
+        cls.now = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def at(self, seconds):
+        return self.now + datetime.timedelta(seconds=seconds)
+
+    def test_coalescing(self):
+        coalescer = EventCoalescer(autoFlush=False)
+        for i in range(1000):
+            coalescer.add(self.first, 'alarm', 7, self.at(i))
+        coalescer.add(self.first, 'alarm', 8, self.at(5))
+        coalescer.add(self.first, 'status', 2, self.at(20))
+        coalescer.add(self.first, 'status', 3, self.at(10))
+        coalescer.add(self.second, 'status', 1, self.at(1))
+
+        with self.assertNumQueries(6):
+            self.assertEqual(coalescer.flush(), 5)
+        self.assertEqual((coalescer.received, coalescer.written), (1004, 5))
+
+        event = TerminalEvent.objects.get(terminal=self.first, kind='alarm', code=7)
+        self.assertEqual((event.count, event.first_seen, event.last_seen), (1000, self.at(0), self.at(999)))
+
+        status = TerminalStatus.objects.get(terminal=self.first)
+        self.assertEqual((status.alarms, status.events), (1001, 1003))
+        self.assertEqual((status.last_alarm, status.last_alarm_at), (7, self.at(999)))
+        self.assertEqual((status.last_status, status.last_status_at), (2, self.at(20)))
+        self.assertEqual(TerminalStatus.objects.get(terminal=self.second).last_status, 1)
+        self.assertEqual(coalescer.flush(), 0)
+
+    def test_upsert_keeps_newer_status(self):
+        coalescer = EventCoalescer(autoFlush=False)
+        coalescer.add(self.first, 'status', 2, self.at(20))
+        coalescer.flush()
+        # A late batch with an older report
+        coalescer.add(self.first, 'status', 3, self.at(10))
+        coalescer.add(self.first, 'alarm', 4, self.at(5))
+        coalescer.flush()
+
+        status = TerminalStatus.objects.get(terminal=self.first)
+        self.assertEqual((status.last_status, status.last_status_at), (2, self.at(20)))
+        self.assertEqual((status.last_alarm, status.alarms, status.events), (4, 1, 3))
+        self.assertEqual(status.last_seen, self.at(20))
+
+    def test_failed_flush(self):
+        coalescer = EventCoalescer(autoFlush=False)
+        coalescer.add(self.first, 'alarm', 7, self.at(0))
+        with mock.patch.object(events, 'upsertStatus', side_effect=OperationalError('database is locked')):
+            with self.assertRaises(OperationalError):
+                coalescer.flush()
+        self.assertFalse(TerminalEvent.objects.exists())
+
+        # Merged into the next window
+        coalescer.add(self.first, 'alarm', 7, self.at(1))
+        self.assertEqual(coalescer.flush(), 1)
+        self.assertEqual(TerminalEvent.objects.get().count, 2)
+        self.assertEqual(TerminalStatus.objects.get(terminal=self.first).alarms, 2)
+
+    def test_rejected_flush(self):
+        coalescer = EventCoalescer(autoFlush=False)
+        coalescer.add(self.first, 'alarm', 7, self.at(0))
+        with mock.patch.object(events, 'upsertStatus', side_effect=IntegrityError('rejected')):
+            with self.assertRaises(IntegrityError):
+                coalescer.flush()
+        # Not retried
+        self.assertEqual((coalescer.flush(), coalescer.dropped), (0, 1))
+
+    def test_deleted_terminal(self):
+        gone = terminal.objects.get(pk=self.second)
+        coalescer = EventCoalescer(autoFlush=False)
+        coalescer.add(self.first, 'alarm', 7, self.at(0))
+        coalescer.add(gone.pk, 'alarm', 7, self.at(0))
+        coalescer.add(gone.pk, 'status', 1, self.at(1))
+        gone.delete()
+
+        self.assertEqual(coalescer.flush(), 1)
+        self.assertEqual(coalescer.dropped, 2)
+        self.assertEqual(list(TerminalEvent.objects.values_list('terminal', flat=True)), [self.first])
+        self.assertEqual(TerminalStatus.objects.get().terminal_id, self.first)
+
+        coalescer.add(self.first, 'alarm', 7, self.at(2))
+        self.assertEqual(coalescer.flush(), 1)
+        self.assertEqual(TerminalEvent.objects.count(), 2)
+
+    def test_one_flush_at_a_time(self):
+        coalescer = EventCoalescer(window=0)
+        coalescer.flushLock.acquire()
+        try:
+            # Due, but another flush is running
+            coalescer.add(self.first, 'alarm', 7, self.at(0))
+        finally:
+            coalescer.flushLock.release()
+        self.assertFalse(TerminalEvent.objects.exists())
+
+        coalescer.add(self.first, 'alarm', 7, self.at(1))
+        self.assertEqual(TerminalEvent.objects.get().count, 2)
+
+    def test_dialog(self):
+        dialog = Dialog()
+        dialog.start()
+        self.assertEqual(dialog.packet(bytes((MSG_ALARM, 7))), [])
+        self.assertEqual(dialog.errors, 1)
+
+        dialog.packet(bytes((MSG_CALL_IN,)) + bytes.fromhex('5145550000'))
+        dialog.handle('identified', Download(self.first, None, {}, []))
+        self.assertEqual(dialog.packet(bytes((MSG_ALARM, 7))), [('event', self.first, 'alarm', 7)])
+        self.assertEqual(dialog.packet(bytes((MSG_STATUS, 2))), [('event', self.first, 'status', 2)])
+        self.assertEqual(dialog.state, 'wait_request')
+
+class DialogTransitions(TestCase):
+    # The transition table with plain calls, as the line driver makes them
+
+    def identified(self, pending=('NCCTermParms',)):
+        dialog = Dialog()
+        self.assertEqual(dialog.start(), [('timer', STATE_TIMEOUTS[WAIT_CALL_IN])])
+        self.assertEqual(dialog.packet(bytes((MSG_CALL_IN,)) + bytes.fromhex('5145550000')), [
+            ('lookup', '5145550000'),
+            ('timer', STATE_TIMEOUTS[LOOKUP]),
+        ])
+        frames = {'NCCTermParms': [0x1A, 1, 2], 'CardTable': [0x16, 3]}
+        self.assertEqual(dialog.handle('identified', Download(7, None, frames, list(pending))), [
+            ('send', bytes((MSG_PENDING, 0x1A))),
+            ('timer', STATE_TIMEOUTS[WAIT_REQUEST]),
+        ])
+        return dialog
+
+    def test_download(self):
+        dialog = self.identified()
+        self.assertEqual(dialog.packet(bytes((MSG_REQUEST, 0x1A))), [
+            ('frame', [0x1A, 1, 2]),
+            ('timer', STATE_TIMEOUTS[SENDING]),
+        ])
+        # Asked for before the transfer is reported: handled after it
+        self.assertEqual(dialog.packet(bytes((MSG_REQUEST, 0x16))), [])
+        self.assertEqual(dialog.handle('sent'), [
+            ('timer', STATE_TIMEOUTS[WAIT_REQUEST]),
+            ('frame', [0x16, 3]),
+            ('timer', STATE_TIMEOUTS[SENDING]),
+        ])
+        dialog.handle('sent')
+        self.assertEqual(dialog.packet(bytes((MSG_DONE,))), [
+            ('downloaded', 7, ['NCCTermParms', 'CardTable']),
+            ('send', bytes((MSG_GOODBYE,))),
+            ('timer', None),
+            ('hangup',),
+        ])
+        self.assertEqual((dialog.state, dialog.errors), (HANGUP, 0))
+
+    def test_unknown_table(self):
+        dialog = self.identified()
+        self.assertEqual(dialog.packet(bytes((MSG_REQUEST, 0x99))), [('send', bytes((MSG_NO_TABLE, 0x99)))])
+        self.assertEqual(dialog.state, WAIT_REQUEST)
+
+    def test_unknown_terminal(self):
+        dialog = Dialog()
+        dialog.packet(bytes((MSG_CALL_IN,)) + bytes.fromhex('5145550000'))
+        self.assertEqual(dialog.handle('unknown'), [('send', bytes((MSG_UNKNOWN,))), ('timer', None), ('hangup',)])
+
+    def test_retries(self):
+        dialog = self.identified()
+        dialog.packet(bytes((MSG_REQUEST, 0x1A)))
+        for retry in range(TABLE_RETRIES):
+            self.assertEqual(dialog.handle('failed'), [('frame', [0x1A, 1, 2])])
+        # Nothing was downloaded, so nothing is reported
+        self.assertEqual(dialog.handle('failed'), [('send', bytes((MSG_GOODBYE,))), ('timer', None), ('hangup',)])
+
+    def test_timeouts(self):
+        dialog = Dialog()
+        self.assertEqual(dialog.handle('timeout'), [('timer', None), ('hangup',)])
+
+        dialog = self.identified()
+        dialog.packet(bytes((MSG_REQUEST, 0x1A)))
+        self.assertEqual(dialog.handle('timeout'), [('abort',), ('send', bytes((MSG_GOODBYE,))), ('timer', None), ('hangup',)])
+
+    def test_protocol_errors(self):
+        dialog = Dialog()
+        self.assertEqual(dialog.packet(bytes((MSG_REQUEST, 0x1A))), [])
+        self.assertEqual(dialog.packet(b'\xff'), [])
+        self.assertEqual((dialog.state, dialog.errors), (WAIT_CALL_IN, 2))
+
+        dialog.handle('timeout')
+        # Nothing counts once the call is over
+        dialog.packet(bytes((MSG_DONE,)))
+        self.assertEqual(dialog.errors, 2)
+
+class CashboxForecast(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='cashbox')
+        tables = createFixtures(cls.tenant)
+        CoinValTable.objects.filter(pk=tables['CoinValTable'].pk).update(cash_box_volume_threshold=1000)
+        createTerminals(cls.tenant, tables, 3)
+        cls.busy, cls.idle, cls.full = terminal.objects.filter(tenant=cls.tenant).order_by('term_id').values_list('pk', flat=True)
+        cls.now = datetime.datetime(2030, 3, 1, tzinfo=datetime.timezone.utc)
+
+    def ago(self, days):
+        return self.now - datetime.timedelta(days=days)
+
+    def test_forecast(self):
+        # Coin 0 takes 10 volume units
+        self.assertEqual(recordCoinEvents([
+            (self.busy, self.ago(50), 'deposit', 0, 100), # emptied since
+            (self.busy, self.ago(40), 'collection', None, 1),
+            (self.busy, self.ago(35), 'deposit', 0, 30), # before the window
+            (self.busy, self.ago(10), 'deposit', 0, 14),
+            (self.full, self.ago(1), 'deposit', 0, 100),
+        ]), 5)
+
+        forecasts = forecastCashboxes(terminal.objects.filter(tenant=self.tenant), now=self.now)
+        self.assertEqual([forecast.terminal for forecast in forecasts], [self.full, self.busy, self.idle])
+        full, busy, idle = forecasts
+
+        self.assertEqual((busy.volume, busy.threshold, busy.rate), (440, 1000, 5.0))
+        self.assertEqual(busy.full_at, self.now + datetime.timedelta(days=112))
+        self.assertEqual((full.volume, full.full_at), (1000, self.now))
+        self.assertEqual((idle.volume, idle.rate, idle.full_at), (0, 0.0, None))
+
+        # A shorter window leaves out the traffic of ten days ago
+        busy, = forecastCashboxes(terminal.objects.filter(pk=self.busy), now=self.now, window=datetime.timedelta(days=7))
+        self.assertEqual((busy.volume, busy.rate, busy.full_at), (440, 0.0, None))
+
+    def test_dialog(self):
+        dialog = Dialog()
+        dialog.start()
+        dialog.packet(bytes((MSG_CALL_IN,)) + bytes.fromhex('5145550000'))
+        dialog.handle('identified', Download(self.busy, None, {}, []))
+        payload = bytes((MSG_COINS,)) + struct.pack('<BHBH', 0, 14, 3, 300)
+        self.assertEqual(dialog.packet(payload), [('coins', self.busy, ((0, 14), (3, 300)))])
+        self.assertEqual(dialog.packet(bytes((MSG_COLLECTED,))), [('collected', self.busy)])
+
+    def test_deleted_terminal(self):
+        gone = terminal.objects.get(pk=self.idle)
+        gone.delete()
+        self.assertEqual(recordCoinEvents([
+            (self.busy, self.now, 'deposit', 0, 1),
+            (gone.pk, self.now, 'deposit', 0, 1),
+        ]), 1)
+        self.assertEqual(list(CoinEvent.objects.values_list('terminal', flat=True)), [self.busy])
+
+class CallRecordIngest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='cdr')
+        createTerminals(cls.tenant, createFixtures(cls.tenant), 1)
+        cls.terminal = terminal.objects.get(tenant=cls.tenant).pk
+
+    def records(self, count):
+        midnight = datetime.datetime(2030, 2, 1, tzinfo=datetime.timezone.utc)
+        records = []
+        for seq in range(count):
+            started = midnight + datetime.timedelta(seconds=seq - 2)
+            records.append(CallRecord(
+                period=started.year * 100 + started.month, terminal_id=self.terminal, seq=seq, started=started,
+                duration=3725 + seq, call_type=2, called_number='5145551234', carrier_ref=3, rate=150, cost=70000 + seq, card_ref_num=1,
+            ))
+        return records
+
+    def fields(self, records):
+        return [
+            (record.period, record.terminal_id, record.seq, record.started, record.duration, record.call_type,
+                record.called_number, record.carrier_ref, record.rate, record.cost, record.card_ref_num)
+            for record in records
+        ]
+
+    def test_round_trip(self):
+        self.addCleanup(metrics.reset)
+        records = self.records(5)
+        upload = b''.join(encodeRecord(record) for record in records)
+        decoder = CDRDecoder(self.terminal)
+        writer = CDRWriter()
+
+        for start in range(0, len(upload), 7):
+            writer.ingest(decoder, upload[start:start + 7])
+        self.assertEqual(writer.flush(), 5)
+        # The period follows the start of each call, across the month end
+        self.assertEqual(self.fields(CallRecord.objects.order_by('seq')), self.fields(records))
+        self.assertEqual([record.period for record in records], [203001, 203001, 203002, 203002, 203002])
+
+        # A retried upload is ignored
+        writer.ingest(CDRDecoder(self.terminal), upload)
+        writer.flush()
+        self.assertEqual(CallRecord.objects.count(), 5)
+
+        self.assertEqual(writer.stats.throughput(self.terminal)[:2], (10, 2 * len(upload)))
+        self.assertIn('millennium_cdr_records_total{terminal="%d"} 10' % self.terminal, prometheusText())
+
+    def test_truncated(self):
+        first, second = (encodeRecord(record) for record in self.records(2))
+        decoder = CDRDecoder(self.terminal)
+
+        # Noise before a record is skipped, a partial record is kept back
+        self.assertEqual(self.fields(decoder.feed(b'\xff' + first + second[:-3])), self.fields(self.records(1)))
+        self.assertEqual((decoder.errors, len(decoder.buffer)), (1, CDR_RECORD.size - 3))
+        self.assertEqual(len(decoder.feed(second[-3:])), 1)
+        self.assertFalse(decoder.buffer)
+
+        # A record with an impossible date is counted, not stored
+        bad = bytearray(first)
+        bad[2] = 13
+        self.assertEqual(decoder.feed(bytes(bad)), [])
+        self.assertEqual((decoder.records, decoder.errors), (2, 2))
+
+    def test_dialog(self):
+        dialog = Dialog()
+        dialog.start()
+        dialog.packet(bytes((MSG_CALL_IN,)) + bytes.fromhex('5145550000'))
+        dialog.handle('identified', Download(self.terminal, None, {}, []))
+        upload = encodeRecord(self.records(1)[0])
+        self.assertEqual(dialog.packet(bytes((MSG_CDR,)) + upload), [('cdr', self.terminal, upload)])
+
+class PerfStatistics(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='perfstats')
+        tables = createFixtures(cls.tenant)
+        createTerminals(cls.tenant, tables, 2)
+        cls.first, cls.second = terminal.objects.filter(tenant=cls.tenant).order_by('term_id').values_list('pk', flat=True)
+        cls.now = datetime.datetime(2030, 1, 1, 10, 15, tzinfo=datetime.timezone.utc)
+
+    def at(self, minutes):
+        return self.now + datetime.timedelta(minutes=minutes)
+
+    def rollup(self, terminalId, resolution, bucket):
+        return PerfStatsRollup.objects.get(tenant=self.tenant, terminal=terminalId, resolution=resolution, bucket=bucket)
+
+    def test_blocks_and_rollups(self):
+        missing = terminal.objects.order_by('-pk').values_list('pk', flat=True)[0] + 1
+        self.assertEqual(recordSamples([
+            (self.first, self.at(0), {'dialogs': 3, 'dialog_fails': 1}),
+            (self.first, self.at(10), {'dialogs': 2}),
+            (self.second, self.at(60), {'dialogs': 5, 'oos': 1}),
+            (missing, self.at(0), {'dialogs': 9}),
+        ]), 3)
+        # Appended to the blocks and rollups written above
+        self.assertEqual(recordSamples([(self.first, self.at(20), {'dialogs': 1, 'calls': 4})]), 1)
+
+        block = PerfStatsBlock.objects.get(terminal=self.first)
+        self.assertEqual(block.samples, 3)
+        self.assertEqual(
+            [(timestamp, values['dialogs'], values['calls']) for timestamp, values in blockSamples(block)],
+            [(self.at(0), 3, 0), (self.at(10), 2, 0), (self.at(20), 1, 4)],
+        )
+        self.assertFalse(PerfStatsBlock.objects.filter(terminal=missing).exists())
+
+        ten = self.now.replace(minute=0)
+        eleven = ten.replace(hour=11)
+        midnight = ten.replace(hour=0)
+        hour = self.rollup(self.first, 'hour', ten)
+        self.assertEqual((hour.samples, hour.dialogs, hour.dialog_fails, hour.calls), (3, 6, 1, 4))
+        self.assertEqual(self.rollup(self.second, 'hour', eleven).dialogs, 5)
+        self.assertEqual(self.rollup(None, 'hour', ten).dialogs, 6)
+        day = self.rollup(None, 'day', midnight)
+        self.assertEqual((day.samples, day.dialogs, day.oos), (4, 11, 1))
+        self.assertEqual(PerfStatsRollup.objects.count(), 7)
+
+    def test_overlapping_sessions(self):
+        # Another session's statistics are recorded in the middle of ours:
+        # between reading and creating the rollups, and between reading and
+        # updating them
+        other = [(self.second, self.at(5), {'dialogs': 2})]
+        lockedRows = perfstats.lockedRows
+        bulkCreate = PerfStatsRollup.objects.bulk_create
+        interleave = ['create', 'update']
+
+        def create(*args, **kwargs):
+            if interleave[:1] == ['create']:
+                interleave.pop(0)
+                recordSamples(other)
+            return bulkCreate(*args, **kwargs)
+
+        def locked(model, *args):
+            rows = lockedRows(model, *args)
+            if model is PerfStatsRollup and interleave[:1] == ['update']:
+                interleave.pop(0)
+                recordSamples(other)
+            return rows
+
+        with mock.patch.object(PerfStatsRollup.objects, 'bulk_create', side_effect=create), mock.patch.object(perfstats, 'lockedRows', side_effect=locked):
+            recordSamples([(self.first, self.at(0), {'dialogs': 1})])
+            recordSamples([(self.first, self.at(1), {'dialogs': 1})])
+        self.assertEqual(interleave, [])
+
+        ten = self.now.replace(minute=0)
+        tenant = self.rollup(None, 'hour', ten)
+        self.assertEqual((tenant.samples, tenant.dialogs), (4, 6))
+        self.assertEqual(self.rollup(self.second, 'hour', ten).dialogs, 4)
+        self.assertEqual(PerfStatsRollup.objects.filter(terminal=None).count(), 2)
+
+    def test_unique_rollups(self):
+        PerfStatsRollup.objects.create(tenant=self.tenant, resolution='day', bucket=self.now)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            PerfStatsRollup.objects.create(tenant=self.tenant, resolution='day', bucket=self.now)
+
+    def test_dialog(self):
+        dialog = Dialog()
+        dialog.start()
+        dialog.packet(bytes((MSG_CALL_IN,)) + bytes.fromhex('5145550000'))
+        dialog.handle('identified', Download(self.first, None, {}, []))
+        payload = bytes((MSG_PERF_STATS,)) + struct.pack('<6I', 3, 1, 0, 0, 2, 70000)
+        self.assertEqual(dialog.packet(payload), [('perfstats', self.first, (3, 1, 0, 0, 2, 70000))])
+
+class FrameSending(TestCase):
+    # A FrameSender on its own event loop, with a line fast enough that
+    # only acknowledgements and timeouts decide what is sent when
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.written = []
+
+    def sender(self, retries=3):
+        return FrameSender(self.written.append, timing=linkTiming(0, 0, retries), bps=10 ** 9, loop=self.loop)
+
+    def settle(self, seconds=0.0):
+        self.loop.run_until_complete(asyncio.sleep(seconds))
+
+    def sequences(self):
+        return [event[1] for event in PacketDecoder().feed(b''.join(self.written))]
+
+    def test_window(self):
+        sender = self.sender()
+        future = sender.send(bytes(MAX_PAYLOAD * 6))
+        self.settle()
+        self.assertEqual(self.sequences(), list(range(WINDOW)))
+
+        # Out of order: the window only moves past acknowledged packets
+        sender.received(('ack', 1))
+        self.settle()
+        self.assertEqual(len(self.written), WINDOW)
+        sender.received(('ack', 0))
+        self.settle()
+        self.assertEqual(self.sequences(), list(range(WINDOW + 2)))
+
+        for seq in range(2, 6):
+            sender.received(('ack', seq))
+        self.settle()
+        self.assertEqual(future.result(), 6)
+        self.assertEqual((sender.sent, sender.retransmitted), (6, 0))
+
+        # Sequence numbers go on with the next frame
+        future = sender.send(b'next')
+        self.settle()
+        sender.received(('ack', 6))
+        self.assertEqual(future.result(), 1)
+        self.assertEqual(self.sequences()[-1], 6)
+
+    def test_retries(self):
+        sender = self.sender(retries=2)
+        future = sender.send(bytes(MAX_PAYLOAD * 2))
+        self.settle()
+        sender.received(('nak', 0))
+        self.settle()
+        self.assertEqual(self.sequences(), [0, 1, 0])
+        sender.received(('ack', 0))
+        sender.received(('ack', 1))
+        self.settle()
+        self.assertEqual(future.result(), 2)
+        self.assertEqual(sender.retransmitted, 1)
+
+        with mock.patch.object(transport, 'ACK_MARGIN', 0.01):
+            future = sender.send(b'lost')
+            self.settle(0.1)
+        # Sent once and retried twice before giving up
+        self.assertEqual(self.sequences()[3:], [2, 2, 2])
+        with self.assertRaises(LinkError):
+            future.result()
+
+    def test_retry_cap(self):
+        self.assertEqual(linkTiming(retries=2).retries, 2)
+        self.assertEqual(linkTiming(retries=40).retries, MAX_PACKET_RETRIES)
+        self.assertEqual(linkTiming().retries, MAX_PACKET_RETRIES)
+
+        # retries_till_oos at its default does not keep a dead line going
+        sender = self.sender(retries=40)
+        with mock.patch.object(transport, 'ACK_MARGIN', 0.01):
+            future = sender.send(b'lost')
+            self.settle(0.2)
+        self.assertEqual(self.sequences(), [0] * (MAX_PACKET_RETRIES + 1))
+        with self.assertRaises(LinkError):
+            future.result()
+
+class CampaignPlanning(TestCase):
+    START = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def job(self, terminal, tenant, priority=0, duration=10.0, queued=None):
+        return Job(priority, queued or self.START, terminal, tenant, ['NCCTermParms'], duration)
+
+    def concurrent(self, slots):
+        # tenant -> most slots it had running at once
+        peaks = {}
+        for slot in slots:
+            running = sum(1 for other in slots if other.tenant == slot.tenant and other.start <= slot.start < other.end)
+            peaks[slot.tenant] = max(peaks.get(slot.tenant, 0), running)
+        return peaks
+
+    def test_quota(self):
+        jobs = [self.job(i, 1, duration=10.0 + i) for i in range(8)] + [self.job(100 + i, 2) for i in range(3)]
+        slots = planJobs(jobs, self.START, 4, quota=2)
+
+        self.assertEqual(sorted(slot.terminal for slot in slots), sorted(job.terminal for job in jobs))
+        self.assertEqual(self.concurrent(slots), {1: 2, 2: 2})
+        for line in range(4):
+            sessions = sorted((slot.start, slot.end) for slot in slots if slot.line == line)
+            for (start, end), (nextStart, nextEnd) in zip(sessions, sessions[1:]):
+                self.assertLessEqual(end, nextStart)
+
+        # Only one tenant left with work: the lines it cannot use stay idle
+        slots = planJobs([self.job(i, 1) for i in range(3)], self.START, 3, quota=1)
+        self.assertEqual([(slot.start - self.START).total_seconds() for slot in slots], [0.0, 10.0, 20.0])
+
+        slots = planJobs([self.job(i, 1) for i in range(3)], self.START, 3)
+        self.assertEqual(self.concurrent(slots), {1: 3})
+
+    def test_order(self):
+        # Most vital first, then longest queued; ties go by terminal id, so
+        # the plan does not depend on the order the jobs come in
+        earlier = self.START - datetime.timedelta(hours=1)
+        jobs = [self.job(i, i % 3) for i in range(12)] + [
+            self.job(20, 1, priority=4),
+            self.job(21, 2, priority=4, queued=earlier),
+        ]
+        slots = planJobs(jobs, self.START, 2)
+        self.assertEqual([slot.terminal for slot in slots], list(range(12)) + [21, 20])
+        self.assertEqual([(slot.line, slot.start) for slot in slots[:4]], [
+            (0, self.START),
+            (1, self.START),
+            (0, self.START + datetime.timedelta(seconds=10)),
+            (1, self.START + datetime.timedelta(seconds=10)),
+        ])
+
+        for seed in range(5):
+            shuffled = list(jobs)
+            random.Random(seed).shuffle(shuffled)
+            self.assertEqual(planJobs(shuffled, self.START, 2), slots)
+
+        slots = planJobs(jobs, self.START, 2, quota=1)
+        self.assertEqual(self.concurrent(slots), {0: 1, 1: 1, 2: 1})
+        self.assertEqual([slot.terminal for slot in slots[:3]], [0, 1, 2])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            planJobs([], self.START, 0)
+        with self.assertRaises(ValueError):
+            planJobs([], self.START, 1, quota=0)
+
+class LineFailures(TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def test_background_work(self):
+        def fail():
+            raise IntegrityError('lost')
+
+        with mock.patch.object(lines, 'close_old_connections') as close:
+            with self.assertLogs('millennium.panel.lines', 'ERROR'):
+                future = inBackground(self.loop, fail)
+                with self.assertRaises(IntegrityError):
+                    self.loop.run_until_complete(future)
+                # Done callbacks run on the next turn of the loop
+                self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(close.call_count, 2)
+
+    def test_write_error(self):
+        manager = LineManager(terminals=terminal.objects.none(), loop=self.loop)
+        line, path = manager.addPty()
+        self.addCleanup(manager.close)
+        with mock.patch.object(lines.os, 'write', side_effect=OSError(errno.EIO, 'I/O error')):
+            line.write(b'lost')
+        self.assertEqual(line.state, CLOSED)
+        self.assertFalse(line.queue)
+
+class MetricsServer(TestCase):
+
+    def test_scrape(self):
+        metrics.addBuilder('scraped', 0.5, 3)
+        self.addCleanup(metrics.reset)
+        server = serveMetrics(0)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = 'http://127.0.0.1:%d/metrics' % server.server_address[1]
+
+        with urllib.request.urlopen(url, timeout=5) as response:
+            self.assertTrue(response.headers['Content-Type'].startswith('text/plain; version=0.0.4'))
+            self.assertIn('millennium_builder_queries_total{builder="scraped"} 3', response.read().decode())
+        with self.assertRaises(urllib.error.HTTPError):
+            urllib.request.urlopen(url + '/other', timeout=5)
+
+class InternOnCommit(TransactionTestCase):
+
+    def test_rolled_back_save(self):
+        # A save that is rolled back must not keep the next one from
+        # interning the table
+        tenant = Group.objects.create(name='intern')
+        table = InstallParms.objects.create(name='intern', tenant=tenant, access_code='2727', predial_string='9')
+        InstallParms.objects.filter(pk=table.pk).update(blob=None)
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                table.save()
+                raise RuntimeError
+        self.assertIsNone(InstallParms.objects.get(pk=table.pk).blob_id)
+
+        with transaction.atomic():
+            table.save()
+            table.save()
+        self.assertIsNotNone(InstallParms.objects.get(pk=table.pk).blob_id)
+
+class GroupLayering(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Group.objects.create(name='layers')
+        cls.tables = createFixtures(cls.tenant)
+        cls.cards = CardTable.objects.create(name='other', tenant=cls.tenant)
+        cls.parent = TerminalGroup.objects.create(name='parent', tenant=cls.tenant, **{name: table for name, table in cls.tables.items() if name != 'NCCTermParms'})
+        cls.child = TerminalGroup.objects.create(name='child', tenant=cls.tenant, parent=cls.parent, CardTable=cls.cards)
+
+    def test_resolution(self):
+        ncc = NCCTermParms.objects.create(name='own', tenant=self.tenant)
+        own = terminal.objects.create(term_id='5145550001', tenant=self.tenant, group=self.child, NCCTermParms=ncc)
+        inherited = terminal.objects.create(term_id='5145550002', tenant=self.tenant, group=self.parent, NCCTermParms=ncc, CardTable=self.cards)
+        refreshEffective(terminal.objects.filter(tenant=self.tenant))
+
+        effective = EffectiveConfig.objects.get(terminal=own)
+        self.assertEqual(effective.NCCTermParms, ncc)
+        self.assertEqual(effective.CardTable, self.cards)
+        self.assertEqual(effective.InstallParms, self.tables['InstallParms'])
+        self.assertEqual(effective.NPANXXTable, self.tables['NPANXXTable'])
+        self.assertEqual(EffectiveConfig.objects.get(terminal=inherited).CardTable, self.cards)
+
+        # A change to the parent reaches the child's terminals, but not a
+        # table the child overrides
+        installs = InstallParms.objects.create(name='other', tenant=self.tenant)
+        TerminalGroup.objects.filter(pk=self.parent.pk).update(InstallParms=installs, CardTable=self.tables['CardTable'])
+        changes = {}
+        self.assertEqual(refreshEffective(terminal.objects.filter(tenant=self.tenant), changes), 2)
+        self.assertEqual(changes, {own.pk: ['InstallParms'], inherited.pk: ['InstallParms']})
+        effective.refresh_from_db()
+        self.assertEqual(effective.InstallParms, installs)
+        self.assertEqual(effective.CardTable, self.cards)
+
+        self.assertEqual(refreshGroup(self.parent), 0)
+
+class LayeringOnCommit(TransactionTestCase):
+
+    def setUp(self):
+        # An earlier TransactionTestCase may have flushed the profiles the
+        # migrations created
+        import_module('millennium.panel.migrations.0006_default_mtr_profiles').create_profiles(apps, None)
+        invalidateMTRConfigs()
+
+    def test_rolled_back_save(self):
+        # A group save that is rolled back must not keep the next one from
+        # refreshing its terminals
+        tenant = Group.objects.create(name='layers')
+        tables = createFixtures(tenant)
+        group = TerminalGroup.objects.create(name='group', tenant=tenant, **{name: table for name, table in tables.items() if name != 'NCCTermParms'})
+        phone = terminal.objects.create(term_id='5145550001', tenant=tenant, group=group, NCCTermParms=tables['NCCTermParms'])
+        self.assertEqual(phone.effective.CardTable, tables['CardTable'])
+
+        cards = CardTable.objects.create(name='other', tenant=tenant)
+        group.CardTable = cards
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                group.save()
+                raise RuntimeError
+        self.assertEqual(EffectiveConfig.objects.get(terminal=phone).CardTable, tables['CardTable'])
+
+        with transaction.atomic():
+            group.save()
+        self.assertEqual(EffectiveConfig.objects.get(terminal=phone).CardTable, cards)
@@ -0,0 +1,56 @@
+from django.conf import settings
+import logging
+import zlib
+
+# Frame tracing through the 'millennium.panel.trace' logger. A trace point
+# costs one level check while the logger is above DEBUG; below it, only
+# sampled terminals are traced, and a frame is turned into hex only if a
+# handler actually emits the record.
+logger = logging.getLogger('millennium.panel.trace')
+
+class HexFrame(object):
+    # Formats a frame as hex when the log record is rendered, not when the
+    # trace point is hit
+    __slots__ = ('frame',)
+
+    def __init__(self, frame):
+        self.frame = frame
+
+    def __str__(self):
+        return bytes(self.frame).hex()
+
+class FrameTracer(object):
+    # Decides per terminal whether to trace, with a stable hash of its key
+    # so a sampled terminal is traced for whole sessions and on every
+    # process. sample is the fraction of terminals traced
+    # (settings.PANEL_TRACE_SAMPLE, all of them by default).
+
+    def __init__(self, logger=logger, sample=None):
+        self.logger = logger
+        self.sample = sample
+        self.decisions = {}
+
+    def sampled(self, key):
+        decision = self.decisions.get(key)
+        if decision is None:
+            sample = self.sample
+            if sample is None:
+                sample = getattr(settings, 'PANEL_TRACE_SAMPLE', 1.0)
+            if len(self.decisions) > 100000:
+                self.decisions.clear()
+            decision = self.decisions[key] = zlib.crc32(str(key).encode()) % 10000 < sample * 10000
+        return decision
+
+    def frame(self, direction, frame, key=None, session=None):
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if key is not None and not self.sampled(key):
+            return
+        # Copied, as the caller may reuse its buffer before a buffering
+        # handler renders the record
+        self.logger.debug('%s %s/%s %d bytes %s', direction, key, session, len(frame), HexFrame(bytes(frame)))
+
+tracer = FrameTracer()
+
+def traceFrame(direction, frame, key=None, session=None):
+    tracer.frame(direction, frame, key, session)
@@ -0,0 +1,286 @@
+from django.conf import settings
+from collections import namedtuple
+import asyncio
+import binascii
+
+# Link layer of the download dialog, as seen on the line:
+#   STX, sequence number, payload length, payload, CRC-16/CCITT of
+#   sequence number..payload (little endian), ETX
+# Every packet is acknowledged on its own with two bytes, ACK or NAK
+# followed by its sequence number.
+STX = 0x02
+ETX = 0x03
+ACK = 0x06
+NAK = 0x15
+
+MAX_PAYLOAD = 128
+PACKET_OVERHEAD = 6 # STX, sequence, length, CRC, ETX
+ACK_SIZE = 2
+WINDOW = 4 # unacknowledged packets in flight
+
+# Assumed, not documented: tx_pkt_delay and rx_pkt_gap count 10 ms ticks.
+# Their defaults of 10 then give the 100 ms seen between packets on the line.
+TICK = 0.01 # seconds per unit of tx_pkt_delay and rx_pkt_gap
+ACK_MARGIN = 0.5 # seconds of slack on top of the expected acknowledgement time
+DEFAULT_RETRIES = 40 # InstallParms' default
+# Also an assumption: retries_till_oos is what the phone tolerates before it
+# takes itself out of service, not a per-packet limit for the NCC side. With
+# up to 40 timeouts per packet a dead line would hold a session for minutes,
+# so retransmissions of one packet are capped at this on top of it.
+MAX_PACKET_RETRIES = 5
+
+CALL_SETUP = 30.0 # seconds: dial, carrier, handshake and logon
+
+# gap: idle time the phone needs between two packets it receives
+# (rx_pkt_gap); turnaround: time the phone takes before it answers
+# (tx_pkt_delay); retries: retransmissions of a packet before the session
+# is given up, at most MAX_PACKET_RETRIES
+LinkTiming = namedtuple('LinkTiming', 'gap turnaround retries')
+
+class LinkError(Exception):
+    pass
+
+def linkTiming(txPktDelay=None, rxPktGap=None, retries=None):
+    # From InstallParms values. retries_till_oos is optional in the model,
+    # so a missing value falls back to the default
+    return LinkTiming(
+        (rxPktGap if rxPktGap is not None else 10) * TICK,
+        (txPktDelay if txPktDelay is not None else 10) * TICK,
+        min(retries or DEFAULT_RETRIES, MAX_PACKET_RETRIES),
+    )
+
+DEFAULT_TIMING = linkTiming()
+
+def linkTimings(terminals):
+    # terminal id -> LinkTiming from its effective InstallParms
+    return {
+        terminalId: linkTiming(txPktDelay, rxPktGap, retries)
+        for terminalId, txPktDelay, rxPktGap, retries in terminals.values_list(
+            'id',
+            'effective__InstallParms__tx_pkt_delay',
+            'effective__InstallParms__rx_pkt_gap',
+            'effective__InstallParms__retries_till_oos',
+        )
+    }
+
+def lineSpeed(bps=None):
+    return bps or getattr(settings, 'NCC_LINE_BPS', 1200)
+
+def wireTime(size, bps):
+    # 10 bits per byte on an asynchronous line
+    return size * 10.0 / bps
+
+def encodePacket(seq, payload):
+    body = bytes((seq & 0xFF, len(payload))) + bytes(payload)
+    return bytes((STX,)) + body + binascii.crc_hqx(body, 0xFFFF).to_bytes(2, 'little') + bytes((ETX,))
+
+def packetize(frame):
+    # Splits a frame into packet payloads
+    frame = bytes(frame)
+    return [frame[i:i + MAX_PAYLOAD] for i in range(0, len(frame), MAX_PAYLOAD)] or [b'']
+
+class PacketDecoder(object):
+    # Incremental decoder for the bytes coming off a line. feed() returns
+    # ('packet', seq, payload), ('ack', seq) and ('nak', seq) events. Noise
+    # and packets with a bad checksum are skipped and counted.
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.errors = 0
+
+    def feed(self, chunk):
+        self.buffer.extend(chunk)
+        buffer = self.buffer
+        events = []
+        offset = 0
+
+        while offset < len(buffer):
+            lead = buffer[offset]
+            if lead in (ACK, NAK):
+                if len(buffer) - offset < ACK_SIZE:
+                    break
+                events.append(('ack' if lead == ACK else 'nak', buffer[offset + 1]))
+                offset += ACK_SIZE
+                continue
+
+            if lead != STX:
+                offset += 1
+                self.errors += 1
+                continue
+
+            if len(buffer) - offset < 3:
+                break
+            end = offset + buffer[offset + 2] + PACKET_OVERHEAD
+            if len(buffer) < end:
+                break
+
+            body = bytes(buffer[offset + 1:end - 3])
+            if buffer[end - 1] != ETX or binascii.crc_hqx(body, 0xFFFF) != int.from_bytes(buffer[end - 3:end - 1], 'little'):
+                # Not a packet after all: resynchronise on the next byte
+                offset += 1
+                self.errors += 1
+                continue
+
+            events.append(('packet', body[0], body[2:]))
+            offset = end
+
+        del buffer[:offset]
+        return events
+
+def transferTime(size, timing=DEFAULT_TIMING, bps=None):
+    # Seconds from the first byte of a frame until its last packet is
+    # acknowledged, with FrameSender's pipelining and no errors
+    bps = lineSpeed(bps)
+    ackTime = wireTime(ACK_SIZE, bps)
+    lineFree = 0.0
+    acked = []
+
+    for payload in packetize(bytes(size)):
+        start = lineFree
+        if len(acked) >= WINDOW:
+            start = max(start, acked[-WINDOW])
+        end = start + wireTime(len(payload) + PACKET_OVERHEAD, bps)
+        acked.append(end + timing.turnaround + ackTime)
+        lineFree = end + timing.gap
+
+    return acked[-1]
+
+def estimateSession(frameSizes, timing=DEFAULT_TIMING, bps=None):
+    # Seconds a session downloading frames of the given sizes keeps a line.
+    # The phone asks for each table, which costs a turnaround on its side.
+    return CALL_SETUP + sum(timing.turnaround + transferTime(size, timing, bps) for size in frameSizes)
+
+class FrameSender(object):
+    # Sends frames over a line as packets. Up to WINDOW packets are in
+    # flight, each sent as soon as the line has drained the previous one
+    # and the phone's receive gap has passed; a packet that is NAKed or not
+    # acknowledged in time is sent again, up to timing.retries times. All
+    # waiting is done with timers on the event loop, so one loop drives any
+    # number of senders.
+
+    def __init__(self, write, timing=DEFAULT_TIMING, bps=None, loop=None):
+        self.write = write
+        self.timing = timing
+        self.bps = lineSpeed(bps)
+        self.loop = loop or asyncio.get_event_loop()
+        self.seq = 0
+        self.lineFree = 0.0
+        self.pumping = None
+        self.future = None
+        self.timers = {}
+        self.sent = 0
+        self.retransmitted = 0
+
+    def send(self, frame):
+        # Returns a future that completes when the whole frame has been
+        # acknowledged, or fails with LinkError
+        if self.future is not None and not self.future.done():
+            raise LinkError('A frame is already being sent')
+
+        self.packets = []
+        for payload in packetize(frame):
+            self.packets.append(encodePacket(self.seq, payload))
+            self.seq = (self.seq + 1) & 0xFF
+        self.firstSeq = (self.seq - len(self.packets)) & 0xFF
+        self.next = 0
+        self.acked = [False] * len(self.packets)
+        self.base = 0
+        self.retries = [0] * len(self.packets)
+        self.timers = {}
+        self.resend = []
+        self.future = self.loop.create_future()
+        self.pump()
+        return self.future
+
+    def index(self, seq):
+        index = (seq - self.firstSeq) & 0xFF
+        if index < len(self.packets):
+            return index
+        return None
+
+    def pump(self):
+        self.pumping = None
+        if self.future.done():
+            return
+
+        while self.resend or (self.next < len(self.packets) and self.next - self.base < WINDOW):
+            now = self.loop.time()
+            if now < self.lineFree:
+                self.pumping = self.loop.call_at(self.lineFree, self.pump)
+                return
+
+            if self.resend:
+                index = self.resend.pop(0)
+                if self.acked[index]:
+                    continue
+                self.retransmitted += 1
+            else:
+                index = self.next
+                self.next += 1
+
+            packet = self.packets[index]
+            self.write(packet)
+            if self.future.done():
+                # The line went away under the write
+                return
+            self.sent += 1
+            drained = now + wireTime(len(packet), self.bps)
+            self.lineFree = drained + self.timing.gap
+            timeout = drained + self.timing.turnaround + wireTime(ACK_SIZE, self.bps) + ACK_MARGIN
+            self.timers[index] = self.loop.call_at(timeout, self.expired, index)
+
+    def schedule(self):
+        if self.pumping is None:
+            self.pumping = self.loop.call_soon(self.pump)
+
+    def received(self, event):
+        # Feed 'ack' and 'nak' events from the line's PacketDecoder
+        if self.future is None or self.future.done():
+            return
+        kind, seq = event[0], event[1]
+        index = self.index(seq)
+        if index is None or index >= self.next or self.acked[index]:
+            return
+
+        if kind == 'ack':
+            self.acked[index] = True
+            self.stopTimer(index)
+            while self.base < len(self.packets) and self.acked[self.base]:
+                self.base += 1
+            if self.base == len(self.packets):
+                self.future.set_result(len(self.packets))
+                return
+            self.schedule()
+        elif kind == 'nak' and index not in self.resend:
+            self.stopTimer(index)
+            self.retry(index)
+
+    def stopTimer(self, index):
+        timer = self.timers.pop(index, None)
+        if timer is not None:
+            timer.cancel()
+
+    def expired(self, index):
+        self.timers.pop(index, None)
+        self.retry(index)
+
+    def retry(self, index):
+        self.retries[index] += 1
+        if self.retries[index] > self.timing.retries:
+            self.cancel(LinkError('Packet %d not acknowledged after %d retries' % ((self.firstSeq + index) & 0xFF, self.timing.retries)))
+            return
+        self.resend.append(index)
+        self.schedule()
+
+    def cancel(self, exc=None):
+        for timer in self.timers.values():
+            timer.cancel()
+        self.timers = {}
+        if self.pumping is not None:
+            self.pumping.cancel()
+            self.pumping = None
+        if self.future is not None and not self.future.done():
+            if exc is None:
+                self.future.cancel()
+            else:
+                self.future.set_exception(exc)
@@ -1,7 +1,17 @@
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
 from django.shortcuts import render, redirect
+from millennium.panel.metrics import CONTENT_TYPE, prometheusText
 # Create your views here.
 
 def change_tenant(request, tenant):
     if (request.user.groups.filter(id=tenant).exists() == True):
         request.session['tenant'] = tenant
     return redirect('admin:index')
+
+def frame_metrics(request):
+    # Frame build metrics of this process for Prometheus. They cover every
+    # tenant, so only superusers get them.
+    if not request.user.is_superuser:
+        raise PermissionDenied
+    return HttpResponse(prometheusText(), content_type=CONTENT_TYPE)
@@ -123,3 +123,41 @@ USE_TZ = True
 STATIC_URL = '/static/'
 
 INTERNAL_IPS = ['127.0.0.1', '10.10.90.43']
+
+# NCC modem lines, used to plan download campaigns
+NCC_LINES = 4
+NCC_LINE_BPS = 1200
+
+# Frame build metrics, served to superusers at /metrics/. They are kept per
+# process: runncc, runactivations and plancampaign serve their own with
+# --metrics-port. Field timing traces every encoder line and is for
+# profiling sessions only.
+PANEL_FRAME_METRICS = True
+PANEL_FIELD_TIMING = False
+
+# Frame tracing: set the 'millennium.panel.trace' logger to DEBUG to log
+# the frames of this fraction of the terminals
+PANEL_TRACE_SAMPLE = 1.0
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'trace': {
+            'format': '%(asctime)s %(message)s',
+        },
+    },
+    'handlers': {
+        'trace': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'trace',
+        },
+    },
+    'loggers': {
+        'millennium.panel.trace': {
+            'handlers': ['trace'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
@@ -20,6 +20,7 @@ from millennium.panel import views
 
 urlpatterns = [
     url(r'^tenant/(?P<tenant>\d+)/$', views.change_tenant, name='change_tenant'),
+    url(r'^metrics/$', admin.site.admin_view(views.frame_metrics), name='frame_metrics'),
     url(r'^', admin.site.urls),
 ]
 